@@ -11,15 +11,81 @@
 The Asset Explorer is a PySide based ui tool which exposes views
 to interact with assets
 """
-# -- Import our classes that plugin developers will want
-# -- easy access to
-from .view import View
-from .view import ViewFactory
-from .config import Configuration
-from .widgets.app import Explorer
-from .widgets.item import AssetItem
-
-# -- Import our main launch function
-from .entry import launch
+import importlib
+import typing
+
+# -- Importing the explorer should be cheap, as it is often imported within
+# -- host applications (such as Maya) long before it is shown. Therefore
+# -- everything we expose is only imported the first time it is accessed.
+# -- Each name maps to the module it lives in, and the attribute within
+# -- that module (or None if the name is the module itself)
+_LAZY: dict[str, tuple[str, str | None]] = dict(
+    # -- Our classes that plugin developers will want easy access to
+    View=(".view", "View"),
+    ViewFactory=(".view", "ViewFactory"),
+    Configuration=(".config", "Configuration"),
+    Explorer=(".widgets.app", "Explorer"),
+    AssetItem=(".widgets.item", "AssetItem"),
+    # -- The thread safe notification functions which traits should use
+    # -- when resolving data in the background
+    notify_changed=(".dispatch", "notify_changed"),
+    notify_status_changed=(".dispatch", "notify_status_changed"),
+    # -- The shared task pool which traits can submit slow fetches to
+    tasks=(".tasks", None),
+    TaskPool=(".tasks", "TaskPool"),
+    # -- The decorator which marks trait actions as safe to run in
+    # -- parallel across many selected assets
+    thread_safe=(".batch", "thread_safe"),
+    # -- The http client for rest api backed traits and discovery plugins
+    HttpClient=(".http_client", "HttpClient"),
+    # -- The persistent key-value store which traits can use to cache
+    # -- the data they resolve
+    CacheStore=(".store", "CacheStore"),
+    # -- The opt-in instrumentation, which is used to find out which
+    # -- traits and plugins are slowing the explorer down
+    profiling=(".profiling", None),
+    # -- The headless queries, for use outside of the ui
+    AssetQuery=(".query", "AssetQuery"),
+    # -- Our main launch function
+    launch=(".entry", "launch"),
+)
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Imports the exposed names on first access (PEP 562)
+    """
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute = _LAZY[name]
+    module = importlib.import_module(module_name, __name__)
+
+    value = module if attribute is None else getattr(module, attribute)
+
+    # -- Store the value so subsequent access does not come through here
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+# -- Allow type checkers and ides to see the exposed names
+if typing.TYPE_CHECKING:
+    from . import profiling, tasks
+    from .batch import thread_safe
+    from .config import Configuration
+    from .dispatch import notify_changed, notify_status_changed
+    from .entry import launch
+    from .http_client import HttpClient
+    from .query import AssetQuery
+    from .store import CacheStore
+    from .tasks import TaskPool
+    from .view import View, ViewFactory
+    from .widgets.app import Explorer
+    from .widgets.item import AssetItem
 
 __version__ = "1.1.4"
@@ -0,0 +1,18 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> __main__.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Allows the headless queries to be run with python -m asset_explorer
+"""
+import sys
+
+from . import cli
+
+if __name__ == "__main__":
+    sys.exit(cli.main())
@@ -0,0 +1,13 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> __init__.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+The modules within this package are generated from the res folder by
+asset_explorer.resources.build, and should not be edited by hand.
+"""
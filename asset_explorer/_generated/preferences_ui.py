@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'preferences.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from Qt.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from Qt.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from Qt.QtWidgets import (QApplication, QCheckBox, QHBoxLayout, QLabel,
+    QSizePolicy, QSpacerItem, QSpinBox, QTabWidget,
+    QVBoxLayout, QWidget)
+
+class Ui_Form(object):
+    def setupUi(self, Form):
+        if not Form.objectName():
+            Form.setObjectName(u"Form")
+        Form.resize(740, 666)
+        self.verticalLayout_6 = QVBoxLayout(Form)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.tabWidget = QTabWidget(Form)
+        self.tabWidget.setObjectName(u"tabWidget")
+        self.General = QWidget()
+        self.General.setObjectName(u"General")
+        self.verticalLayout_2 = QVBoxLayout(self.General)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.preferences_layout = QVBoxLayout()
+        self.preferences_layout.setObjectName(u"preferences_layout")
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label = QLabel(self.General)
+        self.label.setObjectName(u"label")
+        self.label.setMinimumSize(QSize(150, 0))
+        self.label.setMaximumSize(QSize(150, 16777215))
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.item_size = QSpinBox(self.General)
+        self.item_size.setObjectName(u"item_size")
+        self.item_size.setMinimum(10)
+        self.item_size.setValue(32)
+
+        self.horizontalLayout.addWidget(self.item_size)
+
+
+        self.preferences_layout.addLayout(self.horizontalLayout)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.label_2 = QLabel(self.General)
+        self.label_2.setObjectName(u"label_2")
+        self.label_2.setMinimumSize(QSize(150, 0))
+        self.label_2.setMaximumSize(QSize(150, 16777215))
+
+        self.horizontalLayout_2.addWidget(self.label_2)
+
+        self.auto_sort = QCheckBox(self.General)
+        self.auto_sort.setObjectName(u"auto_sort")
+
+        self.horizontalLayout_2.addWidget(self.auto_sort)
+
+
+        self.preferences_layout.addLayout(self.horizontalLayout_2)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.preferences_layout.addItem(self.verticalSpacer)
+
+
+        self.verticalLayout_2.addLayout(self.preferences_layout)
+
+        self.tabWidget.addTab(self.General, "")
+        self.tab_2 = QWidget()
+        self.tab_2.setObjectName(u"tab_2")
+        self.verticalLayout_3 = QVBoxLayout(self.tab_2)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.traits_layout = QVBoxLayout()
+        self.traits_layout.setObjectName(u"traits_layout")
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.traits_layout.addItem(self.verticalSpacer_2)
+
+        self.verticalSpacer_3 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.traits_layout.addItem(self.verticalSpacer_3)
+
+
+        self.verticalLayout_3.addLayout(self.traits_layout)
+
+        self.tabWidget.addTab(self.tab_2, "")
+        self.tab = QWidget()
+        self.tab.setObjectName(u"tab")
+        self.verticalLayout_4 = QVBoxLayout(self.tab)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.searches_layout = QVBoxLayout()
+        self.searches_layout.setObjectName(u"searches_layout")
+        self.verticalSpacer_4 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.searches_layout.addItem(self.verticalSpacer_4)
+
+        self.verticalSpacer_5 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.searches_layout.addItem(self.verticalSpacer_5)
+
+
+        self.verticalLayout_4.addLayout(self.searches_layout)
+
+        self.tabWidget.addTab(self.tab, "")
+        self.tab_3 = QWidget()
+        self.tab_3.setObjectName(u"tab_3")
+        self.verticalLayout_5 = QVBoxLayout(self.tab_3)
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.views_layout = QVBoxLayout()
+        self.views_layout.setObjectName(u"views_layout")
+        self.verticalSpacer_6 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.views_layout.addItem(self.verticalSpacer_6)
+
+        self.verticalSpacer_7 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.views_layout.addItem(self.verticalSpacer_7)
+
+
+        self.verticalLayout_5.addLayout(self.views_layout)
+
+        self.tabWidget.addTab(self.tab_3, "")
+
+        self.verticalLayout_6.addWidget(self.tabWidget)
+
+
+        self.retranslateUi(Form)
+
+        self.tabWidget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(Form)
+    # setupUi
+
+    def retranslateUi(self, Form):
+        Form.setWindowTitle(QCoreApplication.translate("Form", u"Form", None))
+        self.label.setText(QCoreApplication.translate("Form", u"Item Size", None))
+        self.label_2.setText(QCoreApplication.translate("Form", u"Auto Sort", None))
+        self.auto_sort.setText("")
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.General), QCoreApplication.translate("Form", u"General", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), QCoreApplication.translate("Form", u"Traits", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), QCoreApplication.translate("Form", u"Searches", None))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), QCoreApplication.translate("Form", u"Views", None))
+    # retranslateUi
+
+
+FORM = Ui_Form
+SOURCE_HASH = '419e6952433e0cc2eefce6cbef425a393f77ce18'
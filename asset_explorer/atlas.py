@@ -0,0 +1,250 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> atlas.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+The built in icons, along with the status overlays traits commonly return,
+are drawn on almost every row. Rather than decoding and scaling each of them
+individually, this module packs them into a single pixmap (an atlas) per size.
+Looking up an icon then gives back the atlas along with the area of it which
+holds the icon.
+
+Atlases are written to the explorer's cache folder, so subsequent sessions
+only need to decode a single image. The cached atlas is keyed by the icons it
+contains (and when they were last modified) so it is rebuilt whenever any of
+them change.
+
+Traits which return their own overlay icons can register them so that they
+are packed too:
+
+    asset_explorer.atlas.register("c:/my_icons/checked_out.png")
+"""
+import hashlib
+import math
+import os
+
+import Qt
+
+from . import icons, resources
+
+# -- Whether atlases should be written to (and read from) the cache folder
+CACHE_TO_DISK: bool = True
+
+# -- The icons packed in addition to the built in ones
+_REGISTERED: set[str] = set()
+
+# -- The atlases which have been built, keyed by their size and pixel ratio
+_ATLASES: dict[tuple[int, float], "IconAtlas"] = dict()
+
+
+def builtin_names() -> list[str]:
+    """
+    Returns the names of all the icons shipped with the explorer
+    """
+    return sorted(
+        os.path.splitext(filename)[0]
+        for filename in os.listdir(icons._ICON_DIR)
+        if filename.endswith(".png")
+    )
+
+
+def register(*icon_names: str) -> None:
+    """
+    Registers icons (names or absolute paths) to be packed into the atlas.
+    Any atlases already built are discarded so that they are rebuilt with
+    the new icons.
+    """
+    new_names = set(icon_names) - _REGISTERED
+
+    if not new_names:
+        return
+
+    _REGISTERED.update(new_names)
+    clear()
+
+
+def clear() -> None:
+    """
+    Discards all the atlases which have been built
+    """
+    _ATLASES.clear()
+
+
+# noinspection PyUnresolvedReferences
+class IconAtlas:
+    """
+    A single pixmap holding many icons of the same size, laid out in a grid.
+
+    Args:
+        names: The icon names (or paths) to pack
+        size: The logical size of each icon
+        dpr: The device pixel ratio the atlas is drawn at
+    """
+
+    def __init__(self, names: list[str], size: int, dpr: float = 1.0) -> None:
+        self._size: int = size
+        self._dpr: float = dpr
+        self._cell: int = max(1, round(size * dpr))
+
+        # -- Only pack the icons which actually exist
+        self._names: list[str] = [
+            name for name in names if os.path.exists(icons.path(name))
+        ]
+        self._columns: int = max(1, math.ceil(math.sqrt(len(self._names))))
+        self._indices: dict[str, int] = {
+            name: idx for idx, name in enumerate(self._names)
+        }
+
+        self._pixmap: Qt.QtGui.QPixmap = self._load() or self._build()
+
+    @property
+    def pixmap(self) -> Qt.QtGui.QPixmap:
+        return self._pixmap
+
+    def source_rect(self, name: str) -> Qt.QtCore.QRectF | None:
+        """
+        Returns the area of the atlas (in physical pixels) which holds the
+        given icon, or None if the icon is not within this atlas
+        """
+        idx = self._indices.get(name)
+
+        if idx is None:
+            return None
+
+        row, column = divmod(idx, self._columns)
+
+        return Qt.QtCore.QRectF(
+            column * self._cell,
+            row * self._cell,
+            self._cell,
+            self._cell,
+        )
+
+    def _cache_path(self) -> str:
+        """
+        Returns the path the atlas is cached at. This is unique to the icons
+        packed (including when they were last changed), the size and ratio.
+        """
+        digest = hashlib.sha1(f"{self._cell}".encode("utf-8"))
+
+        for name in self._names:
+            icon_path = icons.path(name)
+            digest.update(f"{name}|{icon_path}|{os.path.getmtime(icon_path)}".encode("utf-8"))
+
+        return os.path.join(
+            resources.cache_directory("atlas"),
+            f"atlas_{digest.hexdigest()}.png",
+        )
+
+    def _load(self) -> Qt.QtGui.QPixmap | None:
+        """
+        Reads the atlas from the cache folder if it has been built before
+        """
+        if not CACHE_TO_DISK:
+            return None
+
+        try:
+            cache_path = self._cache_path()
+
+        except OSError:
+            return None
+
+        if not os.path.exists(cache_path):
+            return None
+
+        pixmap = Qt.QtGui.QPixmap(cache_path)
+
+        if pixmap.isNull():
+            return None
+
+        pixmap.setDevicePixelRatio(self._dpr)
+        return pixmap
+
+    def _build(self) -> Qt.QtGui.QPixmap:
+        """
+        Packs all the icons into a single image, writing it to the cache
+        folder if we're caching to disk
+        """
+        rows = max(1, math.ceil(len(self._names) / self._columns))
+
+        image = Qt.QtGui.QImage(
+            self._columns * self._cell,
+            rows * self._cell,
+            Qt.QtGui.QImage.Format_ARGB32_Premultiplied,
+        )
+        image.fill(Qt.QtCore.Qt.transparent)
+
+        painter = Qt.QtGui.QPainter(image)
+        painter.setRenderHint(Qt.QtGui.QPainter.SmoothPixmapTransform)
+
+        try:
+            for name in self._names:
+                painter.drawImage(
+                    self.source_rect(name),
+                    Qt.QtGui.QImage(icons.path(name)),
+                )
+
+        finally:
+            painter.end()
+
+        if CACHE_TO_DISK:
+            try:
+                image.save(self._cache_path())
+
+            except OSError:
+                pass
+
+        pixmap = Qt.QtGui.QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self._dpr)
+
+        return pixmap
+
+
+def get(size: int, dpr: float = 1.0) -> IconAtlas:
+    """
+    Returns the atlas of the built in and registered icons for the given
+    size and pixel ratio, building it if required. This must only be called
+    from the gui thread.
+    """
+    atlas = _ATLASES.get((size, dpr))
+
+    if atlas is None:
+        atlas = IconAtlas(
+            builtin_names() + sorted(_REGISTERED),
+            size,
+            dpr,
+        )
+        _ATLASES[(size, dpr)] = atlas
+
+    return atlas
+
+
+def lookup(
+    icon_name: str,
+    size: int,
+    dpr: float = 1.0,
+) -> tuple[Qt.QtGui.QPixmap, Qt.QtCore.QRectF] | None:
+    """
+    Returns the atlas pixmap along with the area of it which holds the icon,
+    or None if the icon is not packed into the atlas.
+
+    Args:
+        icon_name: The name (or registered path) of the icon
+        size: The logical size the icon is drawn at
+        dpr: The device pixel ratio of the device being painted on
+
+    Returns:
+        Tuple of the atlas pixmap and the source rect within it
+    """
+    atlas = get(size, dpr)
+    source_rect = atlas.source_rect(icon_name)
+
+    if source_rect is None:
+        return None
+
+    return atlas.pixmap, source_rect
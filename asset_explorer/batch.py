@@ -0,0 +1,257 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> batch.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+When many assets are selected, an action picked from the context menu is run
+on every selected asset which offers it. This module runs those batches whilst
+showing their progress, and allows the user to cancel them part way through.
+
+By default the actions are run one after another on the gui thread, as most
+actions touch the ui or the host application. Traits can mark actions which are
+safe to run from any thread with the thread_safe decorator, in which case the
+batch is spread over a bounded pool of worker threads:
+
+    class MyTrait(asset_composition.Trait):
+
+        @asset_explorer.thread_safe
+        def validate(self):
+            ...
+
+Thread safe actions must not touch the ui directly, and should use
+asset_explorer.notify_status_changed to refresh their asset.
+"""
+import concurrent.futures
+import logging
+import os
+from typing import Callable
+
+from Qt import QtCore, QtWidgets
+
+_LOG = logging.getLogger(__name__)
+
+# -- The most worker threads a single batch will use. Actions tend to wait
+# -- on disk or network rather than the cpu, so like the standard executor
+# -- we allow a few more threads than there are cores
+MAX_WORKERS: int = min(8, (os.cpu_count() or 1) + 4)
+
+# -- Batches which are running, held so they are not garbage collected
+# -- whilst they have no parent
+_RUNNING: set["BatchRun"] = set()
+
+
+def thread_safe(function: Callable) -> Callable:
+    """
+    Decorator which marks a trait action as safe to run from a worker thread,
+    allowing batches of it to be run in parallel
+    """
+    function.thread_safe = True
+    return function
+
+
+def is_thread_safe(function: Callable) -> bool:
+    """
+    Returns True if the function has been marked with the thread_safe
+    decorator. Bound methods expose the attributes of their function, so
+    this works for both.
+    """
+    return getattr(function, "thread_safe", False) is True
+
+
+# noinspection PyUnresolvedReferences
+class BatchRun(QtCore.QObject):
+    """
+    Runs a list of functions (typically the same action for many assets)
+    whilst showing a progress dialog which allows the batch to be cancelled.
+    Cancelling stops any function which has not started, whilst those which
+    are already running are allowed to complete.
+
+    Args:
+        functions: The functions to call, each taking no arguments
+        name: The name of the action, which is shown in the progress dialog
+        parent: The widget to show the progress dialog over
+    """
+
+    # -- Emitted once the batch has completed (or been cancelled)
+    finished: QtCore.Signal = QtCore.Signal()
+
+    def __init__(
+        self,
+        functions: list[Callable],
+        name: str,
+        parent: QtWidgets.QWidget = None,
+    ) -> None:
+        super(BatchRun, self).__init__(parent)
+
+        self._functions: list[Callable] = functions
+        self._name: str = name
+        self._parent: QtWidgets.QWidget = parent
+
+        self._index: int = 0
+        self._cancelled: bool = False
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._futures: list[concurrent.futures.Future] = list()
+        self._dialog: QtWidgets.QProgressDialog | None = None
+
+        # -- The errors raised by any of the functions
+        self.errors: list[BaseException] = list()
+
+        # -- Parallel batches are polled, whilst sequential batches run a
+        # -- single function each time the timer fires so the ui (and the
+        # -- cancel button) stays responsive
+        self._timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self._step)
+
+    @property
+    def parallel(self) -> bool:
+        """
+        A batch is only run in parallel if every function is thread safe
+        """
+        return bool(self._functions) and all(
+            is_thread_safe(function) for function in self._functions
+        )
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def start(self) -> None:
+        """
+        Starts running the batch
+        """
+        _RUNNING.add(self)
+
+        self._dialog = QtWidgets.QProgressDialog(
+            f"Running {self._name} on {len(self._functions)} assets...",
+            "Cancel",
+            0,
+            len(self._functions),
+            self._parent,
+        )
+        self._dialog.setWindowTitle(self._name)
+        self._dialog.setWindowModality(QtCore.Qt.WindowModal)
+        self._dialog.setMinimumDuration(500)
+        self._dialog.setAutoClose(False)
+        self._dialog.setAutoReset(False)
+        self._dialog.canceled.connect(self.cancel)
+        self._dialog.setValue(0)
+
+        if self.parallel:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(MAX_WORKERS, len(self._functions)),
+                thread_name_prefix="asset_explorer_batch",
+            )
+            self._futures = [
+                self._executor.submit(function) for function in self._functions
+            ]
+            self._timer.start(50)
+
+        else:
+            self._timer.start(0)
+
+    def cancel(self) -> None:
+        """
+        Stops the batch. Functions which are already running will complete.
+        """
+        self._cancelled = True
+
+        for future in self._futures:
+            future.cancel()
+
+    def _step(self) -> None:
+        """
+        Advances the batch, updating the progress dialog
+        """
+        if self._executor is not None:
+            completed = sum(1 for future in self._futures if future.done())
+
+        else:
+            if not self._cancelled and self._index < len(self._functions):
+                self._call(self._functions[self._index])
+                self._index += 1
+
+            completed = self._index
+
+        if self._dialog is not None and not self._dialog.wasCanceled():
+            self._dialog.setValue(completed)
+
+        if completed >= len(self._functions) or (
+            self._cancelled and self._executor is None
+        ):
+            self._finish()
+
+    # noinspection PyBroadException
+    def _call(self, function: Callable) -> None:
+        try:
+            function()
+
+        except Exception as error:
+            _LOG.exception(f"{self._name} failed")
+            self.errors.append(error)
+
+    def _finish(self) -> None:
+        """
+        Tidies up once every function has been run (or cancelled)
+        """
+        self._timer.stop()
+
+        if self._executor is not None:
+            for future in self._futures:
+                if not future.cancelled() and future.exception():
+                    self.errors.append(future.exception())
+
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        if self._dialog is not None:
+            self._dialog.close()
+            self._dialog.deleteLater()
+            self._dialog = None
+
+        if self.errors:
+            _LOG.warning(
+                f"{self._name} failed for {len(self.errors)} "
+                f"of {len(self._functions)} assets"
+            )
+
+        _RUNNING.discard(self)
+        self.finished.emit()
+
+
+def run_action(
+    items: list["asset_explorer.AssetItem"],
+    category: str,
+    name: str,
+    parent: QtWidgets.QWidget = None,
+) -> BatchRun:
+    """
+    Runs the action with the given category and name on every item which
+    offers it. The actions of each item are read from its cached actions,
+    so this does not ask the traits again for assets which have not changed.
+
+    Args:
+        items: The items (typically the selection) to run the action on
+        category: The category of the action
+        name: The name of the action
+        parent: The widget to show the progress dialog over
+
+    Returns:
+        The BatchRun, which has already been started
+    """
+    functions = []
+
+    for item in items:
+        for action in item.actions_by_category().get(category, []):
+            if action.name() == name:
+                functions.append(action.function)
+                break
+
+    batch = BatchRun(functions, name, parent=parent)
+    batch.start()
+
+    return batch
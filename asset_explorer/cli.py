@@ -0,0 +1,193 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> cli.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+The command line interface to the headless asset queries. Every command
+writes one json object per line to stdout, as each asset is resolved:
+
+    python -m asset_explorer --config explorer.json search chair
+    python -m asset_explorer --config explorer.json tree --depth 2 --workers 32
+    python -m asset_explorer --config explorer.json favourites
+    python -m asset_explorer --config explorer.json snapshot c:/library.snapshot
+
+Rather than (or as well as) a configuration file, trait and discovery folders
+along with the search roots can be given directly:
+
+    python -m asset_explorer --traits c:/traits --discovery c:/discovery \\
+        --root c:/assets tree
+"""
+import argparse
+import json
+import sys
+import typing
+
+from . import config, query, snapshot
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="asset_explorer",
+        description="Query assets without launching the explorer",
+    )
+    parser.add_argument(
+        "--config",
+        help="A configuration file written by the explorer",
+    )
+    parser.add_argument(
+        "--traits",
+        action="append",
+        default=[],
+        help="A folder of trait plugins to add (may be given many times)",
+    )
+    parser.add_argument(
+        "--discovery",
+        action="append",
+        default=[],
+        help="A folder of discovery plugins to add (may be given many times)",
+    )
+    parser.add_argument(
+        "--root",
+        action="append",
+        default=[],
+        help="A search root, replacing those in the configuration (may be given many times)",
+    )
+    parser.add_argument(
+        "--include-hidden",
+        action="store_true",
+        help="Include assets which the configuration filters out",
+    )
+
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="Search from the search roots")
+    search.add_argument("query", nargs="?", default=None)
+
+    tree = commands.add_parser("tree", help="Walk the hierarchy beneath the roots")
+    tree.add_argument(
+        "identifiers",
+        nargs="*",
+        help="The assets to walk from, defaulting to the search roots",
+    )
+    tree.add_argument(
+        "--depth",
+        type=int,
+        default=None,
+        help="How many levels to walk beneath the roots",
+    )
+    tree.add_argument(
+        "--workers",
+        type=int,
+        default=query.MAX_WORKERS,
+        help="How many assets to resolve in parallel",
+    )
+
+    favourites = commands.add_parser("favourites", help="List the favourites")
+    favourites.add_argument("query", nargs="?", default=None)
+
+    export = commands.add_parser(
+        "snapshot",
+        help="Export the hierarchy beneath the roots to a snapshot file",
+    )
+    export.add_argument("filepath", help="The snapshot file to write")
+    export.add_argument(
+        "identifiers",
+        nargs="*",
+        help="The assets to export from, defaulting to the search roots",
+    )
+    export.add_argument(
+        "--depth",
+        type=int,
+        default=None,
+        help="How many levels to export beneath the roots",
+    )
+    export.add_argument(
+        "--workers",
+        type=int,
+        default=query.MAX_WORKERS,
+        help="How many assets to resolve in parallel",
+    )
+
+    return parser
+
+
+def build_configuration(arguments: argparse.Namespace) -> config.Configuration:
+    """
+    Creates the configuration described by the command line arguments
+    """
+    configuration = (
+        config.Configuration(arguments.config)
+        if arguments.config
+        else config.Configuration()
+    )
+
+    for path in arguments.traits:
+        configuration.traits.add_path(path)
+
+    for path in arguments.discovery:
+        configuration.discovery.add_path(path)
+
+    if arguments.root:
+        configuration.set_setting("search_roots", list(arguments.root))
+
+    return configuration
+
+
+def main(argv: list[str] | None = None) -> int:
+    arguments = build_parser().parse_args(argv)
+    configuration = build_configuration(arguments)
+
+    if arguments.command == "snapshot":
+        count = snapshot.export(
+            configuration,
+            arguments.filepath,
+            roots=arguments.identifiers or None,
+            max_depth=arguments.depth,
+            max_workers=arguments.workers,
+            include_hidden=arguments.include_hidden,
+        )
+        _write([dict(filepath=arguments.filepath, assets=count)], sys.stdout)
+        return 0
+
+    asset_query = query.AssetQuery(
+        configuration,
+        max_workers=getattr(arguments, "workers", query.MAX_WORKERS),
+    )
+
+    if arguments.command == "search":
+        records = asset_query.search(arguments.query, arguments.include_hidden)
+
+    elif arguments.command == "favourites":
+        records = asset_query.favourites(arguments.query, arguments.include_hidden)
+
+    else:
+        records = asset_query.walk(
+            roots=arguments.identifiers or None,
+            max_depth=arguments.depth,
+            include_hidden=arguments.include_hidden,
+        )
+
+    try:
+        _write(records, sys.stdout)
+
+    except BrokenPipeError:
+        # -- The reader (for instance head) has stopped reading, which
+        # -- is not an error
+        return 0
+
+    return 0
+
+
+def _write(records: typing.Iterable[dict], stream: typing.TextIO) -> None:
+    """
+    Writes each record as a single line of json, flushing as we go so
+    that the output can be consumed whilst the query is still running
+    """
+    for record in records:
+        stream.write(json.dumps(record, default=str) + "\n")
+        stream.flush()
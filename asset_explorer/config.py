@@ -38,14 +38,26 @@ class Configuration(asset_composition.Configuration):
             search_roots=[],
             favourites=[],
             auto_sort=False,
+            trait_budget=50,
+            slow_traits="flag",
         )
 
+        # -- This is incremented whenever the settings or the available
+        # -- plugins change, allowing anything derived from them (such as
+        # -- the cached actions of an asset) to know when it is stale
+        self._revision: int = 0
+
         # -- Now that we have defined our factory and data, call the super
         super(Configuration, self).__init__(*args, **kwargs)
 
         # -- Include the built-in paths
         self._include_builtins()
 
+        # -- Traits and views decide which actions an asset has, so
+        # -- changes to either make the configuration a new revision
+        self.traits.plugins_changed.connect(self.bump_revision)
+        self.views.plugins_changed.connect(self.bump_revision)
+
     @property
     def views(self) -> view.ViewFactory:
         """
@@ -54,6 +66,20 @@ class Configuration(asset_composition.Configuration):
         """
         return self._view_factory
 
+    @property
+    def revision(self) -> int:
+        """
+        A counter which changes whenever a setting or the available plugins
+        change
+        """
+        return self._revision
+
+    def bump_revision(self, *args, **kwargs) -> None:
+        """
+        Marks the configuration as changed
+        """
+        self._revision += 1
+
     def get_setting(self, setting_name: str) -> Any:
         """
         Method for returning a setting of a given name
@@ -74,6 +100,7 @@ class Configuration(asset_composition.Configuration):
             value (Any): The value to set
         """
         self._settings[setting_name] = value
+        self.bump_revision()
 
     def add_to(self, setting_name: str, value: Any) -> None:
         """
@@ -85,6 +112,7 @@ class Configuration(asset_composition.Configuration):
             value (Any): The value to add
         """
         self._settings[setting_name].append(value)
+        self.bump_revision()
 
     def remove_from(self, setting_name: str, value: Any) -> None:
         """
@@ -96,6 +124,7 @@ class Configuration(asset_composition.Configuration):
         """
         if value in self._settings[setting_name]:
             self._settings[setting_name].remove(value)
+            self.bump_revision()
 
     @property
     def settings(self) -> dict:
@@ -169,6 +198,7 @@ class Configuration(asset_composition.Configuration):
 
         if data.get("explorer"):
             self._settings.update(data["explorer"])
+            self.bump_revision()
 
         # -- Disable any
         for path in data["view_paths"]:
@@ -0,0 +1,472 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> costs.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Many traits bind to every identifier, so whatever they cost is paid on every
+asset the explorer shows - and a single slow trait can drag the whole explorer
+down. This module keeps a running account of how long each trait class takes
+per call and flags any trait which repeatedly goes over the per-call budget
+set in the preferences.
+
+Flagged traits can optionally be quarantined:
+
+    * FLAG: The trait is flagged in the preferences but otherwise left alone
+    * DEFER: Calls are answered from the results of earlier calls. If there
+      is no earlier result then the call is made on the task pool and the asset
+      is told to refresh once it completes. Icons may be Qt objects, which can
+      only be built on the gui thread, so they are cached rather than deferred
+    * CACHE: Calls are answered from the results of earlier calls. If there is
+      no earlier result then the call is made immediately and remembered
+
+Remembered results are forgotten whenever their asset emits status_changed
+(or changed, for children), so a quarantined trait still reflects changes.
+"""
+import functools
+import threading
+import time
+import weakref
+from typing import Any, Callable
+
+from . import dispatch, profiling, tasks
+
+# -- The ways in which slow traits can be handled
+FLAG: str = "flag"
+DEFER: str = "defer"
+CACHE: str = "cache"
+
+MODES: tuple[str, ...] = (FLAG, DEFER, CACHE)
+
+# -- A trait is considered slow once this many of its calls have gone
+# -- over the budget. This stops a single hiccup (such as a cold disk
+# -- cache) from flagging a trait
+SLOW_CALLS: int = 3
+
+# -- What a deferred call returns whilst its result is being resolved, given
+# -- the asset. Callers expect labels to be strings, so until the label is
+# -- resolved the identifier stands in for it
+_PLACEHOLDERS: dict[str, Callable[[Any], Any]] = dict(
+    label=lambda asset: asset.identifier(),
+    children=lambda asset: [],
+    actions=lambda asset: [],
+)
+
+# -- Methods which may give back Qt objects (such as a QIcon). These can only
+# -- be built on the gui thread, so they are never deferred to the task pool
+_GUI_METHODS: tuple[str, ...] = ("icon",)
+
+# -- The method whose results are refreshed by the changed signal of an
+# -- asset. All the others are refreshed by its status_changed signal
+_CHILDREN_METHOD: str = "children"
+
+
+class TraitCost:
+    """
+    The accumulated cost of a single trait class
+    """
+
+    __slots__ = ("name", "calls", "total", "max", "over_budget", "methods")
+
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self.calls: int = 0
+        self.total: float = 0
+        self.max: float = 0
+        self.over_budget: int = 0
+        self.methods: dict[str, float] = dict()
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0
+
+
+class TraitLedger:
+    """
+    Records the cost of every trait call and decides which traits are slow.
+    Costs are held in seconds, whilst the budget is given in milliseconds to
+    match the preferences.
+
+    Args:
+        budget: The amount of milliseconds a single trait call may take
+        mode: How slow traits should be handled (FLAG, DEFER or CACHE)
+    """
+
+    # -- Private variables for holding the shared instance
+    _INSTANCE: "TraitLedger" = None
+    _INSTANCE_LOCK: threading.Lock = threading.Lock()
+
+    def __init__(self, budget: float = 50, mode: str = FLAG) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._costs: dict[str, TraitCost] = dict()
+
+        # -- The remembered results, keyed by the identifier of the asset and
+        # -- then by the trait and method. Deferred results are held within
+        # -- the undelivered set until their asset has been told about them
+        self._results: dict[str, dict[tuple[str, str], Any]] = dict()
+        self._undelivered: set[tuple[str, str, str]] = set()
+
+        # -- The assets whose signals we are listening to
+        self._watched: weakref.WeakSet = weakref.WeakSet()
+
+        self._budget: float = budget / 1000
+        self._mode: str = mode
+
+    @classmethod
+    def shared(cls) -> "TraitLedger":
+        """
+        Returns the ledger which all trait calls are recorded to
+        """
+        with cls._INSTANCE_LOCK:
+            if cls._INSTANCE is None:
+                cls._INSTANCE = cls()
+
+        return cls._INSTANCE
+
+    @property
+    def budget(self) -> float:
+        """
+        The per-call budget in milliseconds
+        """
+        return self._budget * 1000
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    def configure(self, budget: float | None = None, mode: str | None = None) -> None:
+        """
+        Updates the budget (in milliseconds) and the way slow traits are
+        handled. Changing either forgets any remembered results.
+        """
+        if mode is not None and mode not in MODES:
+            raise ValueError(f"{mode} is not a valid mode. Expected one of {MODES}")
+
+        with self._lock:
+            if budget is not None:
+                self._budget = budget / 1000
+
+            if mode is not None:
+                self._mode = mode
+
+            self._results = dict()
+            self._undelivered = set()
+
+    def record(self, trait_name: str, method_name: str, duration: float) -> None:
+        """
+        Records the duration (in seconds) of a single trait call
+        """
+        with self._lock:
+            cost = self._costs.get(trait_name)
+
+            if cost is None:
+                cost = self._costs[trait_name] = TraitCost(trait_name)
+
+            cost.calls += 1
+            cost.total += duration
+            cost.methods[method_name] = cost.methods.get(method_name, 0) + duration
+
+            if duration > cost.max:
+                cost.max = duration
+
+            if duration > self._budget:
+                cost.over_budget += 1
+
+    def cost(self, trait_name: str) -> TraitCost | None:
+        """
+        Returns the accumulated cost of the given trait class
+        """
+        with self._lock:
+            return self._costs.get(trait_name)
+
+    def costs(self) -> list[TraitCost]:
+        """
+        Returns the accumulated cost of every trait, most expensive first
+        """
+        with self._lock:
+            costs = list(self._costs.values())
+
+        return sorted(costs, key=lambda cost: cost.total, reverse=True)
+
+    def is_slow(self, trait_name: str) -> bool:
+        """
+        Returns True if the trait has gone over the budget often enough to
+        be considered slow
+        """
+        cost = self._costs.get(trait_name)
+        return cost is not None and cost.over_budget >= SLOW_CALLS
+
+    def slow_traits(self) -> list[str]:
+        """
+        Returns the names of all the traits which are considered slow
+        """
+        with self._lock:
+            names = list(self._costs)
+
+        return [name for name in names if self.is_slow(name)]
+
+    def reset(self) -> None:
+        """
+        Forgets all the recorded costs and remembered results, giving every
+        trait a clean slate
+        """
+        with self._lock:
+            self._costs = dict()
+            self._results = dict()
+            self._undelivered = set()
+
+    def result(self, key: tuple[str, str, str], default: Any = None) -> Any:
+        owner, method_name, identifier = key
+
+        with self._lock:
+            return self._results.get(identifier, {}).get((owner, method_name), default)
+
+    def has_result(self, key: tuple[str, str, str]) -> bool:
+        owner, method_name, identifier = key
+
+        with self._lock:
+            return (owner, method_name) in self._results.get(identifier, {})
+
+    def store_result(
+        self,
+        key: tuple[str, str, str],
+        value: Any,
+        undelivered: bool = False,
+    ) -> None:
+        """
+        Remembers the result of a trait call. Results which the asset has not
+        been told about yet (such as those resolved in the background) should
+        be marked as undelivered, so that the notification which delivers them
+        does not also forget them.
+        """
+        owner, method_name, identifier = key
+
+        with self._lock:
+            self._results.setdefault(identifier, {})[(owner, method_name)] = value
+
+            if undelivered:
+                self._undelivered.add(key)
+
+    def forget(self, identifier: str, children: bool = False) -> None:
+        """
+        Forgets the remembered results of the asset with the given identifier,
+        apart from any which are yet to be delivered.
+
+        Args:
+            identifier: The identifier of the asset
+            children: If True, only the results of the children method are
+                forgotten, otherwise only the results of the other methods are
+        """
+        with self._lock:
+            results = self._results.get(identifier)
+
+            if not results:
+                return
+
+            for owner, method_name in list(results):
+                if (method_name == _CHILDREN_METHOD) != children:
+                    continue
+
+                key = (owner, method_name, identifier)
+
+                if key in self._undelivered:
+                    self._undelivered.discard(key)
+                    continue
+
+                del results[(owner, method_name)]
+
+            if not results:
+                del self._results[identifier]
+
+    def watch(self, asset: Any) -> None:
+        """
+        Forgets the remembered results of the asset whenever it emits its
+        status_changed or changed signals. Watching an asset more than once
+        does nothing. This should be called before anything which reads the
+        traits of the asset is connected to those signals, so that the
+        results are forgotten before they are read again.
+        """
+        try:
+            if asset in self._watched:
+                return
+
+            self._watched.add(asset)
+
+        except TypeError:
+            # -- Assets which cannot be weakly referenced are never
+            # -- watched, and so never have their results remembered
+            return
+
+        identifier = asset.identifier()
+
+        asset.status_changed.connect(
+            functools.partial(_forget, identifier, False),
+        )
+        asset.changed.connect(
+            functools.partial(_forget, identifier, True),
+        )
+
+    def is_watched(self, asset: Any) -> bool:
+        try:
+            return asset in self._watched
+
+        except TypeError:
+            return False
+
+
+def _forget(identifier: str, children: bool, *args, **kwargs) -> None:
+    """
+    Slot for the signals of a watched asset, which ignores whatever the
+    signal is emitted with
+    """
+    TraitLedger.shared().forget(identifier, children=children)
+
+
+def _timed_call(
+    function: Callable,
+    name: str,
+    trait_name: str,
+    method_name: str,
+    args: tuple,
+    kwargs: dict,
+) -> Any:
+    """
+    Calls the trait method, recording its cost to the ledger (and to the
+    profiler if it is recording)
+    """
+    start = time.perf_counter()
+
+    try:
+        return function(*args, **kwargs)
+
+    finally:
+        duration = time.perf_counter() - start
+
+        TraitLedger.shared().record(trait_name, method_name, duration)
+
+        if profiling.is_enabled():
+            profiling.Profiler.shared().record(name, trait_name, start, duration)
+
+
+def _resolve_deferred(
+    function: Callable,
+    name: str,
+    trait_name: str,
+    method_name: str,
+    key: tuple[str, str, str],
+    trait: Any,
+) -> None:
+    """
+    Resolves a deferred trait call on the task pool, then tells the asset
+    to refresh so it picks up the result
+    """
+    value = _timed_call(function, name, trait_name, method_name, (trait,), {})
+    TraitLedger.shared().store_result(key, value, undelivered=True)
+
+    asset = trait.asset()
+
+    if asset is None:
+        return
+
+    if method_name == "children":
+        dispatch.notify_changed(asset)
+
+    else:
+        dispatch.notify_status_changed(asset)
+
+
+def guard(function: Callable, name: str, owner: str = "") -> Callable:
+    """
+    Returns a version of the trait method which records its cost and,
+    if the trait has been flagged as slow, quarantines it according to
+    the ledger's mode. This matches the signature of profiling.wrap so it
+    can be given to profiling.instrument_class.
+
+    Args:
+        function: The trait method to guard
+        name: The name to record the call under, such as "trait.label"
+        owner: The name of the trait class
+
+    Returns:
+        The guarded method
+    """
+    method_name = name.rsplit(".", 1)[-1]
+
+    @functools.wraps(function)
+    def _guarded(trait, *args, **kwargs):
+        ledger = TraitLedger.shared()
+
+        # -- Calls with arguments cannot be keyed by the identifier alone,
+        # -- and calls from worker threads do not hold up the ui, so neither
+        # -- are ever quarantined
+        if (
+            args
+            or kwargs
+            or ledger.mode == FLAG
+            or not ledger.is_slow(owner)
+            or threading.current_thread() is not threading.main_thread()
+        ):
+            return _timed_call(
+                function, name, owner, method_name, (trait, *args), kwargs
+            )
+
+        asset = trait.asset()
+
+        # -- Results are only remembered for assets whose signals we're
+        # -- listening to, as otherwise we would never know they are stale
+        if asset is not None:
+            ledger.watch(asset)
+
+        if asset is None or not ledger.is_watched(asset):
+            return _timed_call(function, name, owner, method_name, (trait,), {})
+
+        key = (owner, method_name, asset.identifier())
+
+        if ledger.has_result(key):
+            return ledger.result(key)
+
+        if ledger.mode == CACHE or method_name in _GUI_METHODS:
+            value = _timed_call(function, name, owner, method_name, (trait,), {})
+            ledger.store_result(key, value)
+            return value
+
+        # -- We're deferring, so hand the call to the task pool and
+        # -- give back a placeholder in the meantime
+        tasks.TaskPool.shared().submit(
+            key,
+            _resolve_deferred,
+            function,
+            name,
+            owner,
+            method_name,
+            key,
+            trait,
+            owner=asset,
+            identifier=key[2],
+        )
+
+        placeholder = _PLACEHOLDERS.get(method_name)
+        return placeholder(asset) if placeholder else None
+
+    _guarded.__profiled__ = True
+
+    return _guarded
+
+
+def instrument_traits(trait_factory) -> None:
+    """
+    Guards the label, icon, children and actions methods of all the traits
+    within the given factory. The calls are also recorded by the profiler
+    whenever it is recording.
+    """
+    for trait in trait_factory.plugins():
+        profiling.instrument_class(
+            trait,
+            profiling.TRAIT_METHODS,
+            "trait",
+            wrapper=guard,
+        )
@@ -7,13 +7,14 @@
 # Created		-> March 2025
 # Author		-> Michael Malinowski (Studio Gobo)
 # ----------------------------------------------------------------------------
+import collections
 import functools
 import typing
 from typing import Any, AnyStr
 
 from Qt import QtCore, QtGui, QtWidgets
 
-from . import constants, icons
+from . import atlas, constants, icons
 
 
 # noinspection PyUnresolvedReferences
@@ -47,91 +48,127 @@ class AssetDelegate(QtWidgets.QAbstractItemDelegate):
         allow us to do color/grayscale switching etc.
         """
 
-        # -- Get the asset path from the index data
+        # -- Decorations may be given as icon names, QIcons, QPixmaps or
+        # -- QImages, all of which are drawn at the resolution of the device
+        # -- we're painting on. Built in and registered icons come from the
+        # -- shared atlas, anything else is resolved (and cached) as a pixmap
         label: AnyStr = index.data(QtCore.Qt.DisplayRole)
-        icon: AnyStr | QtGui.QPixmap = index.data(QtCore.Qt.DecorationRole)
-
-        if isinstance(icon, str):
-            # -- Ask for our main icon
-            pixmap = icons.as_pixmap(
-                index.data(QtCore.Qt.DecorationRole),
-                self._size,
-            )
-
-        elif isinstance(icon, QtGui.QPixmap):
-            pixmap = icon.pixmap(self._size)
-
-        elif isinstance(icon, QtGui.QIcon):
-            pixmap = icon.pixmap(self._size)
-
-        else:
-            pixmap = None
+        dpr: float = painter.device().devicePixelRatioF()
 
         # -- Retrieve any custom data
         custom_data: dict[str, Any] = index.data(
             constants.DATA_ROLE,
         )
 
-        # -- Get a list of overlaying icons. Any trait can return overlaying
-        # -- icons to better represent its state
-        overlay_icons: list[QtGui.QPixmap] = [
-            icons.as_pixmap(icon, self._size)
-            for icon in index.data(constants.STATUS_ICONS_ROLE)
-        ]
-
         # -- We'll use these values a lot, so call the functions
         # -- only once
         width: int = self._size
         height: int = self._size
         icon_opacity: float = 0.85
 
-        # -- If we have a pixmap we draw the icon
-        if pixmap:
-            painter.setOpacity(icon_opacity)
-            painter.drawPixmap(
-                option.rect.x(),
-                option.rect.y(),
-                height,
-                width,
-                pixmap,
-            )
-
-        # -- Paint the overlays
-        for overlay_icon in overlay_icons:
-            painter.setOpacity(icon_opacity)
-            painter.drawPixmap(
-                option.rect.x(),
-                option.rect.y(),
-                height,
-                width,
-                overlay_icon,
-            )
+        painter.setOpacity(icon_opacity)
+
+        # -- Draw the icon followed by any overlaying icons. Any trait can
+        # -- return overlaying icons to better represent its state
+        self._draw_decoration(
+            painter,
+            option.rect,
+            index.data(QtCore.Qt.DecorationRole),
+            dpr,
+        )
+
+        for overlay in index.data(constants.STATUS_ICONS_ROLE) or []:
+            self._draw_decoration(painter, option.rect, overlay, dpr)
 
         # -- Now we restore the opacity back to full before starting
         # -- to draw the text
         painter.setOpacity(1)
         font_size: int = max(8, (int(height * 0.15)))
-        painter.setFont(self.font(font_size))
-
-        # -- Define the text area
-        text_rect: QtCore.QRect = QtCore.QRect(
-            option.rect.x() + width + (width * 0.2),
-            option.rect.y() + (height * 0.1),
-            option.rect.width(),
-            option.rect.height() * 0.5,
-        )
+        font: QtGui.QFont = get_font(font_size)
+        painter.setFont(font)
+
+        # -- Define the text area. Labels which do not fit are elided
+        # -- rather than being drawn beyond the row
+        text_x: int = option.rect.x() + width + int(width * 0.2)
+        text_width: int = option.rect.right() - text_x
+
+        if not label or text_width <= 0:
+            return
+
+        text, ascent, text_height = _TEXT_LAYOUTS.get(label, text_width, font_size)
 
         pen_color = option.palette.color(QtGui.QPalette.Text)
         painter.setPen(pen_color)
 
+        # -- Centre the text vertically within the upper half of the row. We
+        # -- draw from the baseline, which avoids any layout work in Qt
+        text_area_height: float = option.rect.height() * 0.5
+
         painter.drawText(
-            text_rect,
-            QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
-            label,
+            QtCore.QPointF(
+                text_x,
+                option.rect.y()
+                + (height * 0.1)
+                + (text_area_height - text_height) / 2
+                + ascent,
+            ),
+            text,
+        )
+
+    def _draw_decoration(
+        self,
+        painter: QtGui.QPainter,
+        rect: QtCore.QRect,
+        decoration: Any,
+        dpr: float,
+    ) -> None:
+        """
+        Draws the decoration within the icon square at the start of the given
+        rect. Icon names which are packed into the atlas are drawn straight
+        from it, whilst everything else is resolved to its own pixmap.
+        """
+        if isinstance(decoration, str) and decoration:
+            sprite = atlas.lookup(decoration, self._size, dpr)
+
+            if sprite:
+                pixmap, source_rect = sprite
+
+                painter.drawPixmap(
+                    QtCore.QRectF(rect.x(), rect.y(), self._size, self._size),
+                    pixmap,
+                    source_rect,
+                )
+                return
+
+        pixmap: QtGui.QPixmap | None = icons.resolve(decoration, self._size, dpr)
+
+        if pixmap:
+            self._draw_pixmap(painter, rect, pixmap)
+
+    def _draw_pixmap(
+        self,
+        painter: QtGui.QPainter,
+        rect: QtCore.QRect,
+        pixmap: QtGui.QPixmap,
+    ) -> None:
+        """
+        Draws the pixmap at its logical size, centred within the icon square
+        at the start of the given rect. Pixmaps are already scaled to fit the
+        square, so this never rescales them.
+        """
+        dpr: float = pixmap.devicePixelRatio()
+        width: float = pixmap.width() / dpr
+        height: float = pixmap.height() / dpr
+
+        painter.drawPixmap(
+            QtCore.QPointF(
+                rect.x() + (self._size - width) / 2,
+                rect.y() + (self._size - height) / 2,
+            ),
+            pixmap,
         )
 
     # ----------------------------------------------------------------------------------
-    @functools.cache
     def font(self, font_size: int) -> QtGui.QFont:
         """
         Returns the QFont for the given size
@@ -142,4 +179,77 @@ class AssetDelegate(QtWidgets.QAbstractItemDelegate):
         Returns:
             QtGui.QFont
         """
-        return QtGui.QFont("ariel", font_size)
+        return get_font(font_size)
+
+
+@functools.cache
+def get_font(font_size: int) -> QtGui.QFont:
+    """
+    Returns the QFont for the given size. This is shared by all delegates.
+
+    Args:
+        font_size: The size of the font to be instanced
+
+    Returns:
+        QtGui.QFont
+    """
+    return QtGui.QFont("ariel", font_size)
+
+
+# noinspection PyUnresolvedReferences
+class TextLayoutCache:
+    """
+    Measuring and eliding text is one of the more expensive parts of painting
+    a row, and whilst scrolling we paint the same labels over and over again.
+    This holds the elided label and its metrics for each (label, width, font
+    size) so that painting a label we have seen before is a single lookup. The
+    least recently used entries are discarded once we hold more than max_size.
+
+    This must only be used from the gui thread.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self._max_size: int = max_size
+        self._layouts: collections.OrderedDict = collections.OrderedDict()
+
+    def get(self, label: str, width: int, font_size: int) -> tuple[str, float, float]:
+        """
+        Returns the label elided to fit the width, along with the ascent and
+        height of the font
+
+        Args:
+            label: The text to draw
+            width: The available width, beyond which the label is elided
+            font_size: The size of the font the label is drawn with
+
+        Returns:
+            Tuple of the elided text, the font ascent and the font height
+        """
+        key = (label, width, font_size)
+        layout = self._layouts.get(key)
+
+        if layout is not None:
+            self._layouts.move_to_end(key)
+            return layout
+
+        metrics = QtGui.QFontMetricsF(get_font(font_size))
+
+        layout = (
+            metrics.elidedText(label, QtCore.Qt.ElideRight, width),
+            metrics.ascent(),
+            metrics.height(),
+        )
+        self._layouts[key] = layout
+
+        if len(self._layouts) > self._max_size:
+            self._layouts.popitem(last=False)
+
+        return layout
+
+    def clear(self) -> None:
+        self._layouts.clear()
+
+
+# -- The layouts are shared by all delegates, as the same labels are
+# -- drawn regardless of which view is active
+_TEXT_LAYOUTS: TextLayoutCache = TextLayoutCache()
@@ -0,0 +1,168 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> dispatch.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Traits are free to resolve their data on background threads, but the signals
+on an asset are bound directly to ui items which must only ever be touched from
+the main (gui) thread. This module exposes a dispatcher which traits can use to
+publish asset changes from any thread. The notifications are queued, collapsed
+(so ten status changes for the same asset only result in one redraw) and then
+emitted from the gui thread in batches.
+"""
+import threading
+import weakref
+
+import asset_composition
+from Qt import QtCore
+
+# -- These are the types of notification we can dispatch, mapped to the
+# -- name of the signal on the asset which should be emitted
+STATUS_CHANGED: str = "status_changed"
+CHANGED: str = "changed"
+
+
+# noinspection PyUnresolvedReferences
+class Dispatcher(QtCore.QObject):
+    """
+    The dispatcher collects asset notifications from any thread and emits
+    them on the gui thread. Notifications are batched over a short interval
+    to prevent a flood of worker results from starving the event loop.
+    """
+
+    # -- This is emitted (from any thread) to request that the gui thread
+    # -- starts its batching timer
+    _scheduled: QtCore.Signal = QtCore.Signal()
+
+    # -- The amount of time (in milliseconds) we collect notifications for
+    # -- before emitting them
+    INTERVAL: int = 16
+
+    # -- Private variables for holding the active instance
+    _INSTANCE: "Dispatcher" = None
+    _INSTANCE_LOCK: threading.Lock = threading.Lock()
+
+    def __init__(self, parent: QtCore.QObject = None) -> None:
+        super(Dispatcher, self).__init__(parent=parent)
+
+        # -- The pending notifications are keyed by the asset and the
+        # -- signal name, which is what allows duplicates to collapse
+        self._lock: threading.Lock = threading.Lock()
+        self._pending: dict[tuple[int, str], weakref.ref] = dict()
+        self._is_scheduled: bool = False
+
+        self._timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.INTERVAL)
+        self._timer.timeout.connect(self.flush)
+
+        # -- Always queue the connection, as the whole point is that the
+        # -- slot runs in the thread the dispatcher lives in
+        self._scheduled.connect(
+            self._timer.start,
+            QtCore.Qt.QueuedConnection,
+        )
+
+    @classmethod
+    def instance(cls) -> "Dispatcher | None":
+        """
+        Returns the dispatcher for the running application, creating it if
+        required. If there is no Qt application running then None is returned
+        """
+        application = QtCore.QCoreApplication.instance()
+
+        if not application:
+            return None
+
+        with cls._INSTANCE_LOCK:
+            if cls._INSTANCE is None:
+                cls._INSTANCE = cls()
+
+                # -- We may have been created from a worker thread, so
+                # -- ensure we always live alongside the application
+                cls._INSTANCE.moveToThread(application.thread())
+
+        return cls._INSTANCE
+
+    def post(self, asset: asset_composition.Asset, signal_name: str) -> None:
+        """
+        Queues the emission of the given signal on the asset. This is safe to
+        call from any thread.
+
+        Args:
+            asset: The asset to emit the signal on
+            signal_name: The name of the signal to emit (STATUS_CHANGED or CHANGED)
+        """
+        with self._lock:
+            self._pending[(id(asset), signal_name)] = weakref.ref(asset)
+
+            # -- If a flush is already scheduled then this notification
+            # -- will be picked up by that
+            if self._is_scheduled:
+                return
+
+            self._is_scheduled = True
+
+        self._scheduled.emit()
+
+    def flush(self) -> None:
+        """
+        Emits all the pending notifications. This is called on the gui
+        thread by the batching timer.
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = dict()
+            self._is_scheduled = False
+
+        for (_, signal_name), asset_ref in pending.items():
+
+            # -- If the asset has been garbage collected whilst the
+            # -- notification was queued then there is nothing to update
+            asset = asset_ref()
+
+            if asset is None:
+                continue
+
+            getattr(asset, signal_name).emit()
+
+
+def _notify(asset: asset_composition.Asset, signal_name: str) -> None:
+    """
+    Routes the notification through the dispatcher, or emits it immediately
+    if there is no Qt application to dispatch through.
+    """
+    dispatcher: Dispatcher = Dispatcher.instance()
+
+    if not dispatcher:
+        getattr(asset, signal_name).emit()
+        return
+
+    dispatcher.post(asset, signal_name)
+
+
+def notify_status_changed(asset: asset_composition.Asset) -> None:
+    """
+    Thread safe alternative to asset.status_changed.emit(). Use this whenever
+    a trait has new label, icon or status data available.
+
+    Args:
+        asset: The asset whose status has changed
+    """
+    _notify(asset, STATUS_CHANGED)
+
+
+def notify_changed(asset: asset_composition.Asset) -> None:
+    """
+    Thread safe alternative to asset.changed.emit(). Use this whenever the
+    children of an asset have changed.
+
+    Args:
+        asset: The asset which has changed
+    """
+    _notify(asset, CHANGED)
@@ -0,0 +1,491 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> http_client.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Traits and discovery plugins which are backed by a rest api tend to make a lot
+of small requests, and often ask for the same url more than once. This module
+exposes a small http client which:
+
+    * Keeps connections alive and re-uses them between requests
+    * Collapses simultaneous requests for the same url into a single request
+    * Stores responses in the cache store, serving them directly whilst they
+      are fresh and re-validating them (using ETag/Last-Modified) once they are not
+    * Falls back to the stored response if the server cannot be reached, which
+      allows the explorer to be used offline
+    * Follows redirects, storing the response of the final url against the
+      url which was asked for
+"""
+import email.utils
+import http.client
+import json
+import threading
+import time
+import urllib.parse
+from typing import Any
+
+from . import store
+
+# -- These are the errors which indicate that a kept-alive connection
+# -- was closed by the server whilst it was idle
+_STALE_CONNECTION_ERRORS: tuple = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+# -- The statuses which redirect to the url given in the Location header
+_REDIRECT_STATUSES: tuple[int, ...] = (301, 302, 303, 307, 308)
+
+# -- The most redirects we will follow for a single request
+MAX_REDIRECTS: int = 5
+
+
+class HttpError(IOError):
+    """
+    Raised when a request completes with an unsuccessful status code
+    """
+
+    def __init__(self, url: str, status: int, reason: str = "") -> None:
+        super(HttpError, self).__init__(f"{status} {reason} : {url}")
+        self.url: str = url
+        self.status: int = status
+
+
+class Response:
+    """
+    A fully read http response
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: dict[str, str],
+        body: bytes,
+        stored: float | None = None,
+        from_cache: bool = False,
+    ) -> None:
+        self.url: str = url
+        self.status: int = status
+        self.headers: dict[str, str] = headers
+        self.body: bytes = body
+        self.stored: float = stored or time.time()
+        self.from_cache: bool = from_cache
+
+    def __repr__(self) -> str:
+        return f"<Response {self.status} {self.url}>"
+
+    def age(self) -> float:
+        """
+        Returns how many seconds ago this response was received from the server
+        """
+        return time.time() - self.stored
+
+    def text(self, encoding: str = "utf-8") -> str:
+        """
+        Returns the body decoded as a string
+        """
+        return self.body.decode(encoding)
+
+    def json(self) -> Any:
+        """
+        Returns the body parsed as json
+        """
+        return json.loads(self.body)
+
+
+class ResponseCache:
+    """
+    Stores responses within a cache store, keyed by their url
+    """
+
+    def __init__(self, cache_store: store.CacheStore, namespace: str = "http") -> None:
+        self._store: store.CacheStore = cache_store
+        self._namespace: str = namespace
+
+    def get(self, url: str) -> Response | None:
+        """
+        Returns the stored response for the url, or None if we do not have one
+        """
+        data = self._store.get(self._namespace, url)
+
+        if data is None:
+            return None
+
+        try:
+            header, body = data.split(b"\n", 1)
+            header = json.loads(header)
+
+        except ValueError:
+            return None
+
+        return Response(
+            url=url,
+            status=header["status"],
+            headers=header["headers"],
+            body=body,
+            stored=header["stored"],
+            from_cache=True,
+        )
+
+    def put(self, response: Response) -> None:
+        """
+        Stores the given response
+        """
+        header = dict(
+            status=response.status,
+            headers=response.headers,
+            stored=response.stored,
+        )
+
+        self._store.set(
+            self._namespace,
+            response.url,
+            json.dumps(header).encode("utf-8") + b"\n" + response.body,
+        )
+
+    def clear(self) -> None:
+        """
+        Removes all the stored responses
+        """
+        self._store.clear(self._namespace)
+
+
+class ConnectionPool:
+    """
+    Holds idle connections, keyed by their scheme, host and port, so that
+    they can be re-used by subsequent requests.
+    """
+
+    def __init__(self, max_idle: int = 4, timeout: float = 30) -> None:
+        self._max_idle: int = max_idle
+        self._timeout: float = timeout
+        self._lock: threading.Lock = threading.Lock()
+        self._idle: dict[tuple, list[http.client.HTTPConnection]] = dict()
+
+    def acquire(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """
+        Returns an idle connection to the given host if we have one, otherwise
+        a new connection is created.
+        """
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+
+            if idle:
+                return idle.pop()
+
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self._timeout)
+
+        return http.client.HTTPConnection(netloc, timeout=self._timeout)
+
+    def release(
+        self,
+        scheme: str,
+        netloc: str,
+        connection: http.client.HTTPConnection,
+    ) -> None:
+        """
+        Returns the connection to the pool so that it can be re-used. If we
+        already hold enough idle connections for this host it is closed.
+        """
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), list())
+
+            if len(idle) < self._max_idle:
+                idle.append(connection)
+                return
+
+        connection.close()
+
+    def close(self) -> None:
+        """
+        Closes all the idle connections
+        """
+        with self._lock:
+            idle, self._idle = self._idle, dict()
+
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+class _InFlight:
+    """
+    Represents a request which is currently being made, allowing other
+    threads asking for the same url to wait on its result.
+    """
+
+    def __init__(self) -> None:
+        self.event: threading.Event = threading.Event()
+        self.response: Response | None = None
+        self.error: BaseException | None = None
+
+
+class HttpClient:
+    """
+    A thread safe http client which pools connections, coalesces identical
+    requests and caches responses on disk.
+
+    Args:
+        cache_store: The store to keep responses in. If None then
+            responses are not stored
+        ttl: The amount of seconds a stored response is served without
+            asking the server whether it has changed
+        timeout: The socket timeout (in seconds) for each request
+        headers: Any headers which should be sent with every request
+    """
+
+    # -- Private variables for holding the shared instance
+    _INSTANCE: "HttpClient" = None
+    _INSTANCE_LOCK: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_store: store.CacheStore | None = None,
+        ttl: float = 3600,
+        timeout: float = 30,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self._ttl: float = ttl
+        self._headers: dict[str, str] = headers or dict()
+        self._pool: ConnectionPool = ConnectionPool(timeout=timeout)
+
+        self._cache: ResponseCache | None = None
+
+        if cache_store:
+            self._cache = ResponseCache(cache_store)
+
+        self._lock: threading.Lock = threading.Lock()
+        self._in_flight: dict[str, _InFlight] = dict()
+
+    @classmethod
+    def shared(cls) -> "HttpClient":
+        """
+        Returns the client which is shared by all traits and discovery plugins.
+        Its responses are kept in the shared cache store.
+        """
+        with cls._INSTANCE_LOCK:
+            if cls._INSTANCE is None:
+                cls._INSTANCE = cls(
+                    cache_store=store.CacheStore.shared(),
+                )
+
+        return cls._INSTANCE
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """
+        Gives access to the response cache (if there is one)
+        """
+        return self._cache
+
+    def get(self, url: str, ttl: float | None = None) -> Response:
+        """
+        Returns the response for the given url. Fresh stored responses are
+        returned without contacting the server. If another thread is already
+        requesting this url then we wait for, and share, its response.
+
+        Args:
+            url: The url to request
+            ttl: Optional override of the clients time to live for this request.
+                Giving 0 forces re-validation with the server
+
+        Returns:
+            Response
+        """
+        ttl = self._ttl if ttl is None else ttl
+
+        stored = self._cache.get(url) if self._cache else None
+
+        if stored and stored.age() < ttl:
+            return stored
+
+        # -- Determine whether we're the thread making the request or
+        # -- whether we should wait on someone else
+        with self._lock:
+            in_flight = self._in_flight.get(url)
+            is_owner = in_flight is None
+
+            if is_owner:
+                in_flight = _InFlight()
+                self._in_flight[url] = in_flight
+
+        if not is_owner:
+            in_flight.event.wait()
+
+            if in_flight.error:
+                raise in_flight.error
+
+            return in_flight.response
+
+        try:
+            in_flight.response = self._fetch(url, stored)
+
+        except BaseException as error:
+            in_flight.error = error
+            raise
+
+        finally:
+            with self._lock:
+                self._in_flight.pop(url, None)
+
+            in_flight.event.set()
+
+        return in_flight.response
+
+    def close(self) -> None:
+        """
+        Closes any idle connections
+        """
+        self._pool.close()
+
+    def _fetch(self, url: str, stored: Response | None) -> Response:
+        """
+        Makes the request to the server, re-validating the stored response
+        if we have one.
+        """
+        headers = dict(self._headers)
+
+        if stored:
+            if "etag" in stored.headers:
+                headers["If-None-Match"] = stored.headers["etag"]
+
+            if "last-modified" in stored.headers:
+                headers["If-Modified-Since"] = stored.headers["last-modified"]
+
+            else:
+                headers["If-Modified-Since"] = email.utils.formatdate(
+                    stored.stored,
+                    usegmt=True,
+                )
+
+        try:
+            status, reason, response_headers, body = self._follow(url, headers)
+
+        except HttpError:
+            # -- This is an OSError, but it is the server refusing us rather
+            # -- than the server being unreachable
+            raise
+
+        except (OSError, http.client.HTTPException):
+
+            # -- If we cannot reach the server then a stale response is
+            # -- better than no response
+            if stored:
+                return stored
+
+            raise
+
+        # -- The server has confirmed that our stored response is still
+        # -- valid, so we refresh it
+        if status == 304 and stored:
+            response = Response(
+                url=url,
+                status=stored.status,
+                headers=stored.headers,
+                body=stored.body,
+                from_cache=True,
+            )
+            self._store(response)
+            return response
+
+        # -- Any other redirection (or anything we could not follow) is not
+        # -- a response we can give back, nor one we should store
+        if status >= 300:
+            raise HttpError(url, status, reason)
+
+        response = Response(
+            url=url,
+            status=status,
+            headers=response_headers,
+            body=body,
+        )
+        self._store(response)
+
+        return response
+
+    def _store(self, response: Response) -> None:
+        """
+        Stores the response, unless the server has asked us not to
+        """
+        if not self._cache:
+            return
+
+        if "no-store" in response.headers.get("cache-control", ""):
+            return
+
+        self._cache.put(response)
+
+    def _follow(
+        self,
+        url: str,
+        headers: dict[str, str],
+    ) -> tuple[int, str, dict[str, str], bytes]:
+        """
+        Makes the request, following any redirects up to MAX_REDIRECTS. The
+        response of the final url is given back.
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            status, reason, response_headers, body = self._request(url, headers)
+
+            if status not in _REDIRECT_STATUSES or "location" not in response_headers:
+                return status, reason, response_headers, body
+
+            url = urllib.parse.urljoin(url, response_headers["location"])
+
+        raise HttpError(url, status, f"More than {MAX_REDIRECTS} redirects")
+
+    def _request(
+        self,
+        url: str,
+        headers: dict[str, str],
+    ) -> tuple[int, str, dict[str, str], bytes]:
+        """
+        Makes the request on a pooled connection. If the pooled connection
+        had been closed by the server we retry once on a new one.
+        """
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+
+        if parts.query:
+            path += "?" + parts.query
+
+        for attempt in range(2):
+            connection = self._pool.acquire(parts.scheme, parts.netloc)
+
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+
+                if attempt:
+                    raise
+
+                continue
+
+            except BaseException:
+                connection.close()
+                raise
+
+            response_headers = {
+                name.lower(): value for name, value in response.getheaders()
+            }
+
+            if response.will_close:
+                connection.close()
+
+            else:
+                self._pool.release(parts.scheme, parts.netloc, connection)
+
+            return response.status, response.reason, response_headers, body
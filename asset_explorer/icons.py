@@ -13,9 +13,10 @@ expensive to constantly resolve or convert to pixmaps. Therefore this module
 attempts to make that both easy and quick - by resolving paths but caching the
 results for future use.
 """
+import collections
 import functools
 import os
-from typing import AnyStr
+from typing import Any, AnyStr
 
 import Qt
 
@@ -26,6 +27,14 @@ _ICON_DIR: str = os.path.join(
     "icons",
 )
 
+# -- The amount of rasterised decorations we hold on to. Decorations can be
+# -- given as QIcons or QPixmaps created by traits, so unlike the path based
+# -- caches we cannot let this grow forever
+MAX_DECORATIONS: int = 2048
+
+# -- Rasterised decorations keyed by the decoration, size and device pixel ratio
+_DECORATIONS: collections.OrderedDict = collections.OrderedDict()
+
 
 @functools.cache
 def path(icon_name: AnyStr) -> AnyStr:
@@ -70,10 +79,14 @@ def build_icon(icon_path: AnyStr) -> Qt.QtGui.QIcon:
 
 # noinspection PyUnresolvedReferences
 @functools.cache
-def as_pixmap(icon_path: AnyStr, size) -> Qt.QtGui.QPixmap:
+def as_pixmap(icon_path: AnyStr, size, dpr: float = 1.0) -> Qt.QtGui.QPixmap:
     """
     This will generate a pixmap from the icon path with a specified size. This
     function is cached.
+
+    The pixmap is generated at the physical resolution of the device (the size
+    multiplied by the device pixel ratio) and tagged with that ratio, so it is
+    drawn crisply at the given logical size without Qt rescaling it.
     """
     # -- If we're not given an icon we cannot do anything
     if not icon_path:
@@ -84,8 +97,142 @@ def as_pixmap(icon_path: AnyStr, size) -> Qt.QtGui.QPixmap:
     if not ":" in icon_path:
         icon_path = path(icon_path)
 
-    # -- Load the icon as a scaled pixmap to the size requested
-    return Qt.QtGui.QPixmap(icon_path).scaled(
-        Qt.QtCore.QSize(size, size),
+    # -- Load the icon as a scaled pixmap to the physical size requested
+    physical_size = max(1, round(size * dpr))
+
+    pixmap = Qt.QtGui.QPixmap(icon_path).scaled(
+        Qt.QtCore.QSize(physical_size, physical_size),
         mode=Qt.QtCore.Qt.SmoothTransformation,
     )
+    pixmap.setDevicePixelRatio(dpr)
+
+    return pixmap
+
+
+def decoration_key(decoration: Any) -> tuple | None:
+    """
+    Returns a key which uniquely represents the decoration. Qt gives every
+    icon, pixmap and image a cache key which changes whenever its content
+    changes, so we use that rather than the object itself.
+
+    Args:
+        decoration: An icon name or path, QIcon, QPixmap or QImage
+
+    Returns:
+        A hashable key, or None if the decoration cannot be drawn
+    """
+    if isinstance(decoration, str):
+        return ("path", decoration) if decoration else None
+
+    if isinstance(decoration, Qt.QtGui.QIcon):
+        return None if decoration.isNull() else ("icon", decoration.cacheKey())
+
+    if isinstance(decoration, Qt.QtGui.QPixmap):
+        return None if decoration.isNull() else ("pixmap", decoration.cacheKey())
+
+    if isinstance(decoration, Qt.QtGui.QImage):
+        return None if decoration.isNull() else ("image", decoration.cacheKey())
+
+    return None
+
+
+# noinspection PyUnresolvedReferences
+def _rasterise(decoration: Any, size: int, dpr: float) -> Qt.QtGui.QPixmap | None:
+    """
+    Converts the decoration into a pixmap of the given (logical) size
+    """
+    physical_size = max(1, round(size * dpr))
+    target = Qt.QtCore.QSize(physical_size, physical_size)
+
+    if isinstance(decoration, str):
+        pixmap = as_pixmap(decoration, size, dpr)
+
+        return None if not pixmap or pixmap.isNull() else pixmap
+
+    if isinstance(decoration, Qt.QtGui.QIcon):
+        try:
+            # -- Qt6 lets the icon pick the best source for the ratio
+            pixmap = decoration.pixmap(Qt.QtCore.QSize(size, size), dpr)
+
+        except TypeError:
+            pixmap = decoration.pixmap(target)
+
+    elif isinstance(decoration, Qt.QtGui.QImage):
+        pixmap = Qt.QtGui.QPixmap.fromImage(
+            decoration.scaled(
+                target,
+                Qt.QtCore.Qt.KeepAspectRatio,
+                Qt.QtCore.Qt.SmoothTransformation,
+            ),
+        )
+
+    else:
+        pixmap = decoration.scaled(
+            target,
+            Qt.QtCore.Qt.KeepAspectRatio,
+            Qt.QtCore.Qt.SmoothTransformation,
+        )
+
+    if not pixmap or pixmap.isNull():
+        return None
+
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
+# noinspection PyUnresolvedReferences
+def resolve(decoration: Any, size: int, dpr: float = 1.0) -> Qt.QtGui.QPixmap | None:
+    """
+    Returns a pixmap of the given size for any kind of decoration a trait may
+    give - be it an icon name or path, a QIcon, a QPixmap or a QImage. The
+    result is cached, so drawing the same decoration at the same size never
+    rescales it twice. This must only be called from the gui thread.
+
+    Args:
+        decoration: The icon name or path, QIcon, QPixmap or QImage
+        size: The logical size (in pixels) of the square to fit the pixmap to
+        dpr: The device pixel ratio of the device being painted on
+
+    Returns:
+        The QPixmap, or None if the decoration cannot be drawn
+    """
+    key = decoration_key(decoration)
+
+    if key is None:
+        return None
+
+    key = (key, size, dpr)
+    pixmap = _DECORATIONS.get(key)
+
+    if pixmap is not None:
+        _DECORATIONS.move_to_end(key)
+        return pixmap
+
+    pixmap = _rasterise(decoration, size, dpr)
+
+    if pixmap is None:
+        return None
+
+    _DECORATIONS[key] = pixmap
+
+    if len(_DECORATIONS) > MAX_DECORATIONS:
+        _DECORATIONS.popitem(last=False)
+
+    return pixmap
+
+
+def clear_decorations() -> None:
+    """
+    Forgets all the rasterised decorations
+    """
+    _DECORATIONS.clear()
+
+
+def clear_caches() -> None:
+    """
+    Forgets all the pixmaps which have been generated. This is called when
+    the explorer moves to a screen with a different device pixel ratio, as
+    the pixmaps generated for the previous screen are no longer needed.
+    """
+    as_pixmap.cache_clear()
+    clear_decorations()
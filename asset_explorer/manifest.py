@@ -0,0 +1,305 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> manifest.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Importing a plugin module can be slow (particularly within a host application
+such as Maya), and most of the views are never used in a given session. This
+module reads plugin files without importing them, finding the classes which
+declare an identifier so that a factory can list its plugins up front and only
+import a module once one of its plugins is requested.
+
+Only identifiers given as plain strings can be read this way. Files which
+define classes whose identifier cannot be read are reported as unresolved, and
+should be imported as normal.
+
+What we read is persisted within the shared cache store, so subsequent scans of
+the same folder only need to stat it. A folder's listing is only read again if
+its modification time has changed, and a file is only parsed again if both its
+modification time and the hash of its content have changed.
+"""
+import ast
+import hashlib
+import os
+import re
+import sqlite3
+from typing import Any
+
+from . import store
+
+# -- The namespace within the cache store the scans are persisted to
+_NAMESPACE: str = "plugin_manifest"
+
+
+def scan_file(
+    filepath: str,
+    attribute: str = "identifier",
+    source: bytes | None = None,
+) -> list[tuple[str, str]] | None:
+    """
+    Reads the file and returns the classes which assign a string to the given
+    attribute within their body.
+
+    Args:
+        filepath: The python file to read
+        attribute: The name of the class attribute holding the identifier
+        source: The content of the file, if it has already been read
+
+    Returns:
+        List of (identifier, class name) tuples, or None if the file cannot
+        be read statically and must be imported instead
+    """
+    if not filepath.endswith(".py"):
+        return None
+
+    try:
+        if source is None:
+            with open(filepath, "rb") as f:
+                source = f.read()
+
+        tree = ast.parse(source, filename=filepath)
+
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    entries = []
+    has_classes = False
+
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        has_classes = True
+
+        for statement in node.body:
+            if isinstance(statement, ast.Assign):
+                targets = statement.targets
+
+            elif isinstance(statement, ast.AnnAssign) and statement.value is not None:
+                targets = [statement.target]
+
+            else:
+                continue
+
+            if not any(
+                isinstance(target, ast.Name) and target.id == attribute
+                for target in targets
+            ):
+                continue
+
+            if isinstance(statement.value, ast.Constant) and isinstance(
+                statement.value.value, str
+            ):
+                entries.append((statement.value.value, node.name))
+
+            break
+
+    # -- A file which defines classes, none of which we can read an
+    # -- identifier from, may still hold plugins (for instance with a
+    # -- computed identifier) so it has to be imported
+    if has_classes and not entries:
+        return None
+
+    return entries
+
+
+def scan_path(
+    path: str,
+    file_filter: re.Pattern,
+    regex_filter: re.Pattern | None = None,
+    attribute: str = "identifier",
+    cache: bool = True,
+) -> tuple[dict[str, list[str]], list[str]]:
+    """
+    Walks the given folder, reading every plugin file within it. This mirrors
+    the files which factories.Factory.add_path would import.
+
+    Args:
+        path: The folder to walk
+        file_filter: Pattern which the filenames must match
+        regex_filter: Optional additional pattern the filenames must match
+        attribute: The name of the class attribute holding the identifier
+        cache: Whether to use (and update) the persisted scan of the folder
+
+    Returns:
+        Tuple of the filepaths declaring each identifier, and the list of
+        filepaths which could not be read and must be imported
+    """
+    key = "|".join(
+        (
+            os.path.abspath(path),
+            attribute,
+            file_filter.pattern,
+            regex_filter.pattern if regex_filter else "",
+        ),
+    )
+
+    previous = _read_cache(key) if cache else None
+    scan = _scan(path, file_filter, regex_filter, attribute, previous)
+
+    if cache and scan != previous:
+        _write_cache(key, scan)
+
+    declared: dict[str, list[str]] = dict()
+    unresolved: list[str] = list()
+
+    for filepath in sorted(scan["files"]):
+        entries = scan["files"][filepath]["entries"]
+
+        if entries is None:
+            unresolved.append(filepath)
+            continue
+
+        for identifier, _ in entries:
+            declared.setdefault(identifier, []).append(filepath)
+
+    return declared, unresolved
+
+
+def _scan(
+    path: str,
+    file_filter: re.Pattern,
+    regex_filter: re.Pattern | None,
+    attribute: str,
+    previous: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """
+    Walks the folder, reusing whatever is still valid from the previous scan.
+    The scan holds the listing of every folder (against its modification time)
+    and the entries of every file (against its modification time, size and
+    content hash).
+    """
+    previous = previous or dict(folders=dict(), files=dict())
+
+    scan = dict(folders=dict(), files=dict())
+    pending = [path]
+
+    while pending:
+        folder = pending.pop()
+
+        try:
+            modified = os.stat(folder).st_mtime_ns
+
+        except OSError:
+            continue
+
+        listing = previous["folders"].get(folder)
+
+        # -- Only list the folder if it has changed since the last scan
+        if listing is None or listing["modified"] != modified:
+            try:
+                with os.scandir(folder) as iterator:
+                    children = [
+                        (child.name, child.is_dir()) for child in iterator
+                    ]
+
+            except OSError:
+                continue
+
+            listing = dict(
+                modified=modified,
+                folders=sorted(
+                    name for name, is_dir in children
+                    if is_dir and name != "__pycache__"
+                ),
+                filenames=sorted(
+                    name for name, is_dir in children
+                    if not is_dir
+                    and file_filter.match(name)
+                    and (not regex_filter or regex_filter.match(name))
+                ),
+            )
+
+        scan["folders"][folder] = listing
+
+        # -- Compiled files within the cache folders are copies of the
+        # -- sources we're already reading, so they're never listed
+        pending.extend(os.path.join(folder, name) for name in listing["folders"])
+
+        for filename in listing["filenames"]:
+            filepath = os.path.join(folder, filename)
+            record = _scan_file_record(
+                filepath,
+                attribute,
+                previous["files"].get(filepath),
+            )
+
+            if record is not None:
+                scan["files"][filepath] = record
+
+    return scan
+
+
+def _scan_file_record(
+    filepath: str,
+    attribute: str,
+    previous: dict[str, Any] | None,
+) -> dict[str, Any] | None:
+    """
+    Returns the record of the file, reusing the previous record if the file
+    has not changed
+    """
+    try:
+        stat = os.stat(filepath)
+
+    except OSError:
+        return None
+
+    if (
+        previous
+        and previous["modified"] == stat.st_mtime_ns
+        and previous["size"] == stat.st_size
+    ):
+        return previous
+
+    try:
+        with open(filepath, "rb") as f:
+            source = f.read()
+
+    except OSError:
+        return None
+
+    content_hash = hashlib.sha1(source).hexdigest()
+
+    # -- The file may have been touched (for instance by a checkout)
+    # -- without its content changing
+    if previous and previous["hash"] == content_hash:
+        entries = previous["entries"]
+
+    else:
+        entries = scan_file(filepath, attribute, source)
+
+    return dict(
+        modified=stat.st_mtime_ns,
+        size=stat.st_size,
+        hash=content_hash,
+        entries=[list(entry) for entry in entries] if entries is not None else None,
+    )
+
+
+def _read_cache(key: str) -> dict[str, Any] | None:
+    try:
+        return store.CacheStore.shared().get_json(_NAMESPACE, key)
+
+    except (OSError, sqlite3.Error, ValueError):
+        return None
+
+
+def _write_cache(key: str, scan: dict[str, Any]) -> None:
+    try:
+        store.CacheStore.shared().set_json(_NAMESPACE, key, scan)
+
+    except (OSError, sqlite3.Error):
+        pass
+
+
+def clear_cache() -> None:
+    """
+    Forgets all the persisted scans
+    """
+    store.CacheStore.shared().clear(_NAMESPACE)
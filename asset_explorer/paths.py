@@ -0,0 +1,187 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> paths.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Identifiers within deep hierarchies (such as file paths) repeat the same long
+prefixes over and over. Storing millions of them as separate strings means
+storing those prefixes millions of times, so this module stores them as a tree
+instead. Each node only holds its own segment (which is shared between every
+node with the same segment) along with a link to its parent, and the full path
+is rebuilt when it is asked for.
+
+    store = PathStore()
+    node = store.add("c:/assets/props/chair.ma")
+
+    store.path(node)    # c:/assets/props/chair.ma
+    store.name(node)    # chair.ma
+
+Paths are split after each separator (either / or \\), and the separators are
+kept within the segments, so rebuilding a path always gives back exactly what
+was added. Identifiers which are not paths are simply stored as a single
+segment.
+"""
+import array
+import re
+import typing
+
+# -- Each segment runs up to (and includes) the next separator
+_SEGMENT: re.Pattern = re.compile(r"[^/\\]*[/\\]|[^/\\]+")
+
+# -- The node id used as the parent of the top level nodes
+_NO_PARENT: int = -1
+
+# -- The width (in bits) given to the segment within a child key
+_SEGMENT_BITS: int = 32
+
+
+def split(path: str) -> list[str]:
+    """
+    Splits the path into its segments, each holding its trailing separator
+    """
+    return _SEGMENT.findall(path) or [""]
+
+
+class PathStore:
+    """
+    Stores paths as a tree of shared segments. Each path added is given a
+    node id, which can be used to rebuild the path, or to get the name and
+    parent of the node.
+    """
+
+    def __init__(self) -> None:
+        # -- Every distinct segment, along with the id of each
+        self._segments: list[str] = list()
+        self._segment_ids: dict[str, int] = dict()
+
+        # -- The parent and segment of each node, indexed by node id
+        self._parents: array.array = array.array("q")
+        self._names: array.array = array.array("q")
+
+        # -- The node ids keyed by their parent and segment, which is packed
+        # -- into a single int as that is far cheaper than a tuple
+        self._children: dict[int, int] = dict()
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def __contains__(self, path: str) -> bool:
+        return self.find(path) is not None
+
+    def intern(self, text: str) -> int:
+        """
+        Returns the id of the given segment, storing it if it has not been
+        seen before. This can also be used to share other strings (such as
+        labels) which repeat throughout a hierarchy.
+        """
+        segment_id = self._segment_ids.get(text)
+
+        if segment_id is None:
+            segment_id = len(self._segments)
+            self._segments.append(text)
+            self._segment_ids[text] = segment_id
+
+        return segment_id
+
+    def segment_count(self) -> int:
+        """
+        Returns the amount of distinct segments (and interned strings)
+        """
+        return len(self._segments)
+
+    def segment(self, segment_id: int) -> str:
+        """
+        Returns the segment (or interned string) with the given id
+        """
+        return self._segments[segment_id]
+
+    def add(self, path: str) -> int:
+        """
+        Stores the path, returning its node id. Adding a path which is
+        already stored gives back the existing node id.
+        """
+        node = _NO_PARENT
+
+        for segment in split(path):
+            node = self.add_node(node, self.intern(segment))
+
+        return node
+
+    def add_node(self, parent: int, segment_id: int) -> int:
+        """
+        Returns the id of the node with the given segment beneath the given
+        parent (or -1 for a top level node), creating it if required
+        """
+        key = self._key(parent, segment_id)
+        node = self._children.get(key)
+
+        if node is None:
+            node = len(self._parents)
+            self._parents.append(parent)
+            self._names.append(segment_id)
+            self._children[key] = node
+
+        return node
+
+    def find(self, path: str) -> int | None:
+        """
+        Returns the node id of the path, or None if it is not stored
+        """
+        node = _NO_PARENT
+
+        for segment in split(path):
+            segment_id = self._segment_ids.get(segment)
+
+            if segment_id is None:
+                return None
+
+            node = self._children.get(self._key(node, segment_id))
+
+            if node is None:
+                return None
+
+        return node
+
+    def path(self, node: int) -> str:
+        """
+        Rebuilds the full path of the given node
+        """
+        segments = []
+
+        while node != _NO_PARENT:
+            segments.append(self._segments[self._names[node]])
+            node = self._parents[node]
+
+        return "".join(reversed(segments))
+
+    def name(self, node: int) -> str:
+        """
+        Returns the segment of the given node, without its separator
+        """
+        return self._segments[self._names[node]].rstrip("/\\")
+
+    def parent(self, node: int) -> int | None:
+        """
+        Returns the node id of the parent of the given node, or None if it
+        is a top level node
+        """
+        parent = self._parents[node]
+        return None if parent == _NO_PARENT else parent
+
+    def nodes(self) -> typing.Iterator[tuple[int, int, int]]:
+        """
+        Gives back the (node id, parent id, segment id) of every node. Parents
+        are always given before their children, so the nodes can be added to
+        another store with add_node in this order.
+        """
+        for node, (parent, segment_id) in enumerate(zip(self._parents, self._names)):
+            yield node, parent, segment_id
+
+    @staticmethod
+    def _key(parent: int, segment_id: int) -> int:
+        return ((parent + 1) << _SEGMENT_BITS) | segment_id
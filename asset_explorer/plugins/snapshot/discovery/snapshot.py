@@ -0,0 +1,29 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> snapshot.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+import asset_composition
+
+from asset_explorer import snapshot
+
+
+class SnapshotSearch(asset_composition.DiscoveryPlugin):
+    """
+    Searches the labels of the assets within the mounted snapshots, rather
+    than searching the live data
+    """
+
+    # ----------------------------------------------------------------------------------
+    @classmethod
+    def search(cls, query, search_from=None) -> list[str]:
+        results = []
+
+        for mounted in snapshot.mounted():
+            results.extend(mounted.search(query))
+
+        return sorted(set(results))
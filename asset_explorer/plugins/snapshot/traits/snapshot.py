@@ -0,0 +1,55 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> snapshot.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+import asset_composition
+
+from asset_explorer import snapshot
+
+
+class SnapshotTrait(asset_composition.Trait):
+    """
+    Serves assets from the mounted snapshots, giving back the label, icon,
+    status icons and children the asset had when the snapshot was exported.
+    This is read only, so it exposes no actions.
+    """
+
+    # -- The snapshot describes the asset entirely, so it should take
+    # -- precedence over any other trait which can bind to the asset
+    importance = 50
+
+    # ----------------------------------------------------------------------------------
+    @classmethod
+    def can_bind(cls, identifier) -> bool:
+        return snapshot.find(identifier) is not None
+
+    # ----------------------------------------------------------------------------------
+    def record(self) -> dict:
+        """
+        The record is read from the snapshot the first time it is needed
+        """
+        if getattr(self, "_record", None) is None:
+            self._record = snapshot.find(self.asset().identifier()) or dict()
+
+        return self._record
+
+    # ----------------------------------------------------------------------------------
+    def label(self) -> str:
+        return self.record().get("label") or self.asset().identifier()
+
+    # ----------------------------------------------------------------------------------
+    def icon(self) -> str | None:
+        return self.record().get("icon")
+
+    # ----------------------------------------------------------------------------------
+    def status_icons(self) -> list[str]:
+        return list(self.record().get("status", []))
+
+    # ----------------------------------------------------------------------------------
+    def children(self) -> list[str]:
+        return list(self.record().get("children", []))
@@ -7,8 +7,13 @@
 # Created		-> March 2025
 # Author		-> Michael Malinowski (Studio Gobo)
 # ----------------------------------------------------------------------------
+import functools
+
 import asset_composition
-from Qt import QtCore, QtWidgets
+from Qt import QtGui
+
+import asset_explorer
+from asset_explorer import system_icons
 
 
 class SystemIconTrait(asset_composition.Trait):
@@ -19,8 +24,14 @@ class SystemIconTrait(asset_composition.Trait):
     def can_bind(cls, identifier: str) -> bool:
         return True
 
-    def icon(self) -> str:
-        file_info = QtCore.QFileInfo(self.asset().identifier())
-        provider = QtWidgets.QFileIconProvider()
-        icon = provider.icon(file_info)
-        return icon
+    def icon(self) -> QtGui.QIcon | None:
+        # -- The icons are shared between all the files of the same type,
+        # -- and if the icon we're given is a guess we're told to refresh
+        # -- once the real one is known
+        return system_icons.SystemIcons.shared().icon(
+            self.asset().identifier(),
+            changed=functools.partial(
+                asset_explorer.notify_status_changed,
+                self.asset(),
+            ),
+        )
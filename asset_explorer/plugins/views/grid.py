@@ -0,0 +1,394 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> grid.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+This view shows the assets as a grid of thumbnails, which is far quicker to
+browse than a tree when dealing with large libraries of textures or models.
+
+Rather than re-implementing the view mechanics the view still holds its items
+as a flat list of AssetItems, but they are presented through a QListView in
+icon mode which shares the model (and selection) of the view. Thumbnails are
+only resolved for the items which are on (or near) the screen.
+"""
+import collections
+from typing import AnyStr
+
+from Qt import QtCore, QtGui, QtWidgets
+
+import asset_explorer
+from asset_explorer import constants, delegate, icons
+
+
+# noinspection PyUnresolvedReferences,PyPep8Naming
+class GridDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints an item as a thumbnail with its (elided) label beneath it
+    """
+
+    # -- The amount of padding around each cell
+    PADDING: int = 6
+
+    def __init__(self, size: int, parent: QtWidgets.QWidget = None) -> None:
+        super(GridDelegate, self).__init__(parent=parent)
+        self._size: int = size
+        self._font_size: int = max(8, int(size * 0.1))
+
+        metrics = QtGui.QFontMetrics(delegate.get_font(self._font_size))
+        self._text_height: int = metrics.height()
+
+    def cell_size(self) -> QtCore.QSize:
+        """
+        Returns the size of every cell in the grid. All cells are the same
+        size, which allows the list view to skip measuring each item
+        """
+        return QtCore.QSize(
+            self._size + (self.PADDING * 2),
+            self._size + self._text_height + (self.PADDING * 3),
+        )
+
+    def sizeHint(self, *args, **kwargs) -> QtCore.QSize:
+        return self.cell_size()
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> None:
+        rect: QtCore.QRect = option.rect
+
+        if option.state & QtWidgets.QStyle.State_Selected:
+            painter.fillRect(rect, option.palette.color(QtGui.QPalette.Highlight))
+
+        # -- Draw the thumbnail centred at the top of the cell
+        dpr: float = painter.device().devicePixelRatioF()
+        pixmap = icons.resolve(index.data(QtCore.Qt.DecorationRole), self._size, dpr)
+
+        if pixmap:
+            pixmap_dpr: float = pixmap.devicePixelRatio()
+            width: float = pixmap.width() / pixmap_dpr
+            height: float = pixmap.height() / pixmap_dpr
+
+            painter.drawPixmap(
+                QtCore.QPointF(
+                    rect.x() + (rect.width() - width) / 2,
+                    rect.y() + self.PADDING + (self._size - height) / 2,
+                ),
+                pixmap,
+            )
+
+        # -- Overlays are drawn over the top left of the thumbnail
+        for overlay in index.data(constants.STATUS_ICONS_ROLE) or []:
+            overlay_pixmap = icons.resolve(overlay, self._size // 3, dpr)
+
+            if overlay_pixmap:
+                painter.drawPixmap(
+                    QtCore.QPoint(rect.x() + self.PADDING, rect.y() + self.PADDING),
+                    overlay_pixmap,
+                )
+
+        label: str = index.data(QtCore.Qt.DisplayRole)
+
+        if not label:
+            return
+
+        text_width: int = rect.width() - (self.PADDING * 2)
+        text, ascent, _ = delegate._TEXT_LAYOUTS.get(label, text_width, self._font_size)
+
+        painter.setFont(delegate.get_font(self._font_size))
+        painter.setPen(
+            option.palette.color(
+                QtGui.QPalette.HighlightedText
+                if option.state & QtWidgets.QStyle.State_Selected
+                else QtGui.QPalette.Text
+            ),
+        )
+
+        # -- Centre the label beneath the thumbnail
+        text_advance: float = QtGui.QFontMetricsF(
+            delegate.get_font(self._font_size),
+        ).horizontalAdvance(text)
+
+        painter.drawText(
+            QtCore.QPointF(
+                rect.x() + (rect.width() - text_advance) / 2,
+                rect.y() + self._size + (self.PADDING * 2) + ascent,
+            ),
+            text,
+        )
+
+
+# noinspection PyUnresolvedReferences,PyPep8Naming
+class ThumbnailView(asset_explorer.View):
+    """
+    Shows the children of a location as a grid of thumbnails. Double clicking
+    an asset browses into it, whilst backspace browses back out again. When
+    there is no location the search roots are shown.
+    """
+
+    identifier = "Thumbnail View"
+
+    # -- The amount of items laid out in each pass. Laying out in batches
+    # -- keeps the ui responsive when showing many thousands of assets
+    BATCH_SIZE: int = 250
+
+    # -- The most assets we will look through when searching the hierarchy
+    # -- for the location of an asset we have not shown before
+    SEARCH_LIMIT: int = 5000
+
+    # -- The identifier of the asset whose children we're showing, along
+    # -- with the locations we browsed through to get here. These are
+    # -- class level defaults as populate is called during the init
+    _location: str | None = None
+    _history: tuple[str | None, ...] = ()
+
+    # -- The location each asset we have shown was found within, by the
+    # -- identifier of the asset
+    _parents: dict[str, str | None] | None = None
+
+    # -- The list view which presents our items. This is created once the
+    # -- view has initialised
+    grid: QtWidgets.QListView | None = None
+
+    def __init__(self, *args, **kwargs):
+        super(ThumbnailView, self).__init__(*args, **kwargs)
+
+        size: int = self.app.config.get_setting("item_size")
+
+        # -- The grid sits over the top of the tree and shares its model
+        # -- and selection, so the items behave exactly as they do in
+        # -- every other view
+        self.grid = QtWidgets.QListView(self)
+        self.grid.setModel(self.model())
+        self.grid.setSelectionModel(self.selectionModel())
+        self.grid.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+
+        self.grid_delegate = GridDelegate(size=size, parent=self.grid)
+        self.grid.setItemDelegate(self.grid_delegate)
+
+        self.grid.setViewMode(QtWidgets.QListView.IconMode)
+        self.grid.setMovement(QtWidgets.QListView.Static)
+        self.grid.setResizeMode(QtWidgets.QListView.Adjust)
+        self.grid.setUniformItemSizes(True)
+        self.grid.setGridSize(self.grid_delegate.cell_size())
+        self.grid.setLayoutMode(QtWidgets.QListView.Batched)
+        self.grid.setBatchSize(self.BATCH_SIZE)
+        self.grid.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.grid.installEventFilter(self)
+
+        # -- The tree itself is never seen
+        self.setHeaderHidden(True)
+        self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.setFocusProxy(self.grid)
+        self.grid.setGeometry(self.rect())
+        self.grid.show()
+
+        # -- Route the interaction with the grid through the view
+        self.grid.clicked.connect(self._grid_clicked)
+        self.grid.doubleClicked.connect(self._grid_double_clicked)
+        self.grid.customContextMenuRequested.connect(self._grid_context_menu)
+        self.grid.verticalScrollBar().valueChanged.connect(
+            self.schedule_visibility_update,
+        )
+
+    def populate(self, filter_value: AnyStr | None = None) -> None:
+
+        self.clear()
+
+        if self._parents is None:
+            self._parents = dict()
+
+        filter_value = (filter_value or "").lower()
+
+        if self._location:
+            identifiers = self.app.compositor.get(self._location).children()
+
+        else:
+            identifiers = self.app.config.get_setting("search_roots")
+
+        for identifier in identifiers:
+            self._parents[identifier] = self._location
+            asset = self.app.compositor.get(identifier)
+
+            if not asset.is_visible():
+                continue
+
+            if filter_value and filter_value not in asset.label().lower():
+                continue
+
+            self.addTopLevelItem(asset_explorer.AssetItem(asset, app=self.app))
+
+    def set_location(self, identifier: str | None) -> None:
+        """
+        Shows the children of the given asset. If None is given then the
+        search roots are shown.
+        """
+        self._history = self._history + (self._location,)
+        self._location = identifier
+        self.populate()
+        self.grid.scrollToTop()
+
+    def back(self) -> None:
+        """
+        Returns to the location we were showing before the current one
+        """
+        if not self._history:
+            return
+
+        self._location = self._history[-1]
+        self._history = self._history[:-1]
+        self.populate()
+        self.grid.scrollToTop()
+
+    def navigate_to_path(self, path: str) -> None:
+        """
+        Shows the location containing the given asset, and selects it
+        """
+        self.set_location(self._find_location(path))
+
+        item = self.item_for_identifier(path)
+
+        if item is not None:
+            self.setCurrentItem(item)
+            self.grid.scrollTo(self.indexFromItem(item))
+
+    def _find_location(self, identifier: str) -> str | None:
+        """
+        Returns the identifier of the asset whose children include the given
+        asset, or None if it is one of the search roots (or cannot be found).
+        Assets we have shown before were recorded against their location,
+        otherwise the hierarchy is searched from the search roots down.
+        """
+        if identifier in self._parents:
+            return self._parents[identifier]
+
+        pending = collections.deque(self.app.config.get_setting("search_roots"))
+        visited = set(pending)
+
+        while pending and len(visited) < self.SEARCH_LIMIT:
+            location = pending.popleft()
+
+            for child in self.app.compositor.get(location).children():
+                if child in visited:
+                    continue
+
+                visited.add(child)
+                self._parents.setdefault(child, location)
+
+                if child == identifier:
+                    return location
+
+                pending.append(child)
+
+        return None
+
+    def visible_items(self, margin: int = 0) -> list["asset_explorer.AssetItem"]:
+        """
+        Returns the items within the grid's viewport. As the grid lays items
+        out in rows, the margin is given in rows of the grid rather than in
+        items.
+        """
+        if self.grid is None:
+            return []
+
+        viewport: QtCore.QRect = self.grid.viewport().rect()
+        cell: QtCore.QSize = self.grid.gridSize()
+
+        # -- Extend the viewport by the margin, in rows
+        area: QtCore.QRect = viewport.adjusted(
+            0,
+            -margin * cell.height(),
+            0,
+            margin * cell.height(),
+        )
+
+        # -- Find the first item in the viewport, then step back through
+        # -- the rows of the margin
+        first = self.grid.indexAt(
+            QtCore.QPoint(cell.width() // 2, cell.height() // 2),
+        )
+        columns: int = max(1, viewport.width() // max(1, cell.width()))
+        start: int = max(0, (first.row() if first.isValid() else 0) - margin * columns)
+
+        items = []
+
+        for row in range(start, self.topLevelItemCount()):
+            item = self.topLevelItem(row)
+            rect = self.grid.visualRect(self.indexFromItem(item))
+
+            # -- Items which the batched layout has not reached yet have
+            # -- no geometry, and everything beyond them is the same
+            if not rect.isValid() or rect.top() > area.bottom():
+                break
+
+            if rect.bottom() < area.top() or item.isHidden():
+                continue
+
+            items.append(item)
+
+        return items
+
+    def is_item_visible(self, item: "asset_explorer.AssetItem") -> bool:
+        """
+        The tree is never seen, so an item is visible if it is within the
+        grid's viewport
+        """
+        if self.grid is None:
+            return False
+
+        return self.grid.visualRect(self.indexFromItem(item)).intersects(
+            self.grid.viewport().rect(),
+        )
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super(ThumbnailView, self).resizeEvent(event)
+
+        if self.grid is not None:
+            self.grid.setGeometry(self.rect())
+
+    def eventFilter(self, watched: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """
+        The grid has the focus, so we watch it for backspace being pressed
+        """
+        if (
+            self.grid is not None
+            and watched is self.grid
+            and event.type() == QtCore.QEvent.KeyPress
+            and event.key() == QtCore.Qt.Key_Backspace
+        ):
+            self.back()
+            return True
+
+        return super(ThumbnailView, self).eventFilter(watched, event)
+
+    def _grid_clicked(self, index: QtCore.QModelIndex) -> None:
+        self._click_propagation(self.itemFromIndex(index))
+
+    def _grid_double_clicked(self, index: QtCore.QModelIndex) -> None:
+        item = self.itemFromIndex(index)
+        self._double_click_propagation(item)
+
+        # -- Browse into anything which has children
+        if item.asset().children():
+            self.set_location(item.asset().identifier())
+
+    def _grid_context_menu(self, position: QtCore.QPoint) -> None:
+        item = self.itemFromIndex(self.grid.indexAt(position))
+
+        if not item:
+            return
+
+        # -- Right clicking outside of the selection selects the item,
+        # -- otherwise the action is run on the whole selection
+        if not item.isSelected():
+            self.setCurrentItem(item)
+
+        menu = item.context_menu(parent=self, selection=self.selectedItems())
+        menu.popup(self.grid.viewport().mapToGlobal(position))
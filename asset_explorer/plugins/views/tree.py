@@ -7,9 +7,11 @@
 # Created		-> March 2025
 # Author		-> Michael Malinowski (Studio Gobo)
 # ----------------------------------------------------------------------------
+import functools
 from typing import AnyStr
 
 import asset_composition
+from Qt import QtCore
 
 import asset_explorer
 
@@ -19,6 +21,10 @@ class HierarchyTreeView(asset_explorer.View):
 
     identifier = "Hierarchy View"
 
+    # -- The path we're currently navigating to, if any. This is a class
+    # -- level default as populate is called during the init
+    _navigation_target: str | None = None
+
     def __init__(self, *args, **kwargs):
         super(HierarchyTreeView, self).__init__(*args, **kwargs)
 
@@ -38,40 +44,101 @@ class HierarchyTreeView(asset_explorer.View):
 
             item.populate_children()
 
-    def navigate_to_path(self, path, from_this=None) -> None:
+    def navigate_to_path(self, path: str) -> None:
+        """
+        Expands the tree down to the asset with the given identifier, then
+        selects it and scrolls to it. Each level is expanded in its own pass
+        of the event loop, so navigating deep into a large tree does not
+        lock up the ui. Only the ancestors of the asset are expanded.
+
+        Args:
+            path: The identifier of the asset to navigate to
+        """
+        # -- Navigating again abandons any navigation still in progress
+        self._navigation_target = path
+        self._navigate_step(path)
+
+    def _navigate_step(self, path: str) -> None:
+        """
+        Performs a single step of the navigation to the given path, which
+        expands one item along the way
+        """
+        if path != self._navigation_target:
+            return
+
+        item = self._deepest_loaded_ancestor(path)
 
-        if not from_this:
+        if item is None:
+            self._navigation_target = None
+            return
 
-            # -- Start by determining which project root this path
-            # -- belongs to
-            for idx in range(self.topLevelItemCount()):
+        # -- Expanding an item repopulates its children, so the ancestors
+        # -- must be expanded from the top down. Otherwise expanding an
+        # -- ancestor would replace the items we have already reached
+        collapsed = None
+        ancestor = item.parent()
 
-                root_item = self.topLevelItem(idx)
+        while ancestor is not None:
+            if not ancestor.isExpanded():
+                collapsed = ancestor
 
-                if path.startswith(root_item.asset().identifier()):
-                    root_item.setExpanded(True)
-                    self.navigate_to_path(
-                        path,
-                        from_this=root_item,
-                    )
-                    break
+            ancestor = ancestor.parent()
 
+        if collapsed is None and item.asset().identifier() == path:
+            self._navigation_target = None
+            self.clearSelection()
+            self.setCurrentItem(item)
+            self.scrollToItem(item)
             return
 
-        # -- To reach here, we have a from_this node
-        for idx in range(from_this.childCount()):
+        # -- If the deepest item is already expanded then none of its
+        # -- children lead to the asset, so it is not within this tree
+        if collapsed is None and item.isExpanded():
+            self._navigation_target = None
+            return
+
+        # -- Expanding populates the children, which adds them to the
+        # -- index, so the next step carries on from deeper in the tree
+        (collapsed or item).setExpanded(True)
+
+        QtCore.QTimer.singleShot(
+            0,
+            functools.partial(self._navigate_step, path),
+        )
 
-            child = from_this.child(idx)
+    def _deepest_loaded_ancestor(self, path: str) -> "asset_explorer.AssetItem | None":
+        """
+        Returns the item for the path if it has been loaded, otherwise the
+        item for its closest loaded ancestor. The ancestors are found by
+        trimming whole path segments, so /foo is never mistaken for an
+        ancestor of /foobar.
+        """
+        item = self.item_for_identifier(path)
 
-            if path.startswith(child.asset().identifier()):
-                child.setExpanded(True)
+        if item is not None:
+            return item
 
-                if path == child.asset().identifier():
-                    child.setSelected(True)
-                    return
+        candidate = path.rstrip("/\\")
 
-                self.navigate_to_path(
-                    path,
-                    from_this=child,
-                )
+        while candidate:
+            item = self.item_for_identifier(candidate)
+
+            if item is not None:
+                return item
+
+            # -- Trim back to the previous separator
+            separator = max(candidate.rfind("/"), candidate.rfind("\\"))
+
+            if separator <= 0:
                 break
+
+            candidate = candidate[:separator]
+
+            # -- Some identifiers keep their trailing separator, such as
+            # -- drive roots (c:/)
+            item = self.item_for_identifier(candidate + path[separator])
+
+            if item is not None:
+                return item
+
+        return None
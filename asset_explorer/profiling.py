@@ -0,0 +1,397 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> profiling.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+When the explorer feels slow the cause is usually a trait or a discovery plugin
+rather than the explorer itself - but without measurements that is hard to
+prove. This module provides an opt-in instrumentation layer which times the
+hot paths of the explorer (populating views and items, trait calls and the
+compositor) and keeps per-trait-class breakdowns of where the time went.
+
+Instrumentation is disabled by default, in which case the cost of an
+instrumented call is a single flag check. It can be enabled either through
+the Diagnostics tab, by calling enable() or by setting the
+ASSET_EXPLORER_PROFILE environment variable to 1.
+
+The recorded calls can be exported as a Chrome trace, which can be opened
+in chrome://tracing or https://ui.perfetto.dev
+"""
+import functools
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+# -- The trait methods which we time when instrumenting traits
+TRAIT_METHODS: tuple[str, ...] = ("label", "icon", "children", "actions")
+
+# -- Attributes of the lru_cache wrapper which callers (such as the
+# -- preferences) rely on, and which must survive the wrapping
+_CACHE_ATTRIBUTES: tuple[str, ...] = ("cache_clear", "cache_info", "cache_parameters")
+
+# -- The amount of individual calls we hold on to for the trace export.
+# -- Beyond this the oldest calls are discarded
+MAX_EVENTS: int = 200000
+
+# -- The amount of calls we track in the slowest calls list
+MAX_SLOWEST: int = 50
+
+# -- Whether the instrumentation is currently recording. This is read on
+# -- every instrumented call, so it is deliberately a plain module global
+_ENABLED: bool = os.environ.get("ASSET_EXPLORER_PROFILE", "") == "1"
+
+# -- Trace timestamps are relative to this point
+_ORIGIN: float = time.perf_counter()
+
+
+class Stat:
+    """
+    The accumulated timings of a single instrumented call for a single owner
+    """
+
+    __slots__ = ("name", "owner", "calls", "total", "max")
+
+    def __init__(self, name: str, owner: str) -> None:
+        self.name: str = name
+        self.owner: str = owner
+        self.calls: int = 0
+        self.total: float = 0
+        self.max: float = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return dict(
+            name=self.name,
+            owner=self.owner,
+            calls=self.calls,
+            total=self.total,
+            mean=self.mean,
+            max=self.max,
+        )
+
+
+class Profiler:
+    """
+    Collects the timings of instrumented calls from any thread. Timings are
+    held in seconds.
+    """
+
+    # -- Private variables for holding the shared instance
+    _INSTANCE: "Profiler" = None
+    _INSTANCE_LOCK: threading.Lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._origin: float = _ORIGIN
+        self._stats: dict[tuple[str, str], Stat] = dict()
+        self._events: deque = deque(maxlen=MAX_EVENTS)
+        self._slowest: list[tuple] = list()
+        self._sequence = itertools.count()
+
+    @classmethod
+    def shared(cls) -> "Profiler":
+        """
+        Returns the profiler which all the instrumented calls record to
+        """
+        with cls._INSTANCE_LOCK:
+            if cls._INSTANCE is None:
+                cls._INSTANCE = cls()
+
+        return cls._INSTANCE
+
+    def record(self, name: str, owner: str, start: float, duration: float) -> None:
+        """
+        Records a single call
+
+        Args:
+            name: The name of the instrumented call, such as "trait.label"
+            owner: The class (or plugin) the call was made on
+            start: The perf_counter value when the call started
+            duration: How long the call took in seconds
+        """
+        thread_id = threading.get_ident()
+
+        with self._lock:
+            stat = self._stats.get((name, owner))
+
+            if stat is None:
+                stat = self._stats[(name, owner)] = Stat(name, owner)
+
+            stat.calls += 1
+            stat.total += duration
+
+            if duration > stat.max:
+                stat.max = duration
+
+            self._events.append((name, owner, start, duration, thread_id))
+
+            # -- The slowest calls are held as a min-heap so the quickest
+            # -- of them is always the one we replace
+            entry = (duration, next(self._sequence), name, owner, start)
+
+            if len(self._slowest) < MAX_SLOWEST:
+                heapq.heappush(self._slowest, entry)
+
+            elif duration > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def stats(self) -> list[Stat]:
+        """
+        Returns the accumulated timings, ordered by the total time spent
+        """
+        with self._lock:
+            stats = list(self._stats.values())
+
+        return sorted(stats, key=lambda stat: stat.total, reverse=True)
+
+    def slowest(self, count: int = MAX_SLOWEST) -> list[dict[str, Any]]:
+        """
+        Returns the slowest individual calls, slowest first
+        """
+        with self._lock:
+            entries = heapq.nlargest(count, self._slowest)
+
+        return [
+            dict(
+                name=name,
+                owner=owner,
+                duration=duration,
+                start=start - self._origin,
+            )
+            for duration, _, name, owner, start in entries
+        ]
+
+    def reset(self) -> None:
+        """
+        Discards everything which has been recorded
+        """
+        with self._lock:
+            self._origin = time.perf_counter()
+            self._stats = dict()
+            self._events.clear()
+            self._slowest = list()
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """
+        Returns the recorded calls in the Chrome trace event format
+        """
+        with self._lock:
+            events = list(self._events)
+            origin = self._origin
+
+        pid = os.getpid()
+        trace_events = []
+
+        for name, owner, start, duration, thread_id in events:
+            trace_events.append(
+                dict(
+                    name=f"{name} ({owner})" if owner else name,
+                    cat=name.split(".")[0],
+                    ph="X",
+                    ts=(start - origin) * 1000000,
+                    dur=duration * 1000000,
+                    pid=pid,
+                    tid=thread_id,
+                    args=dict(owner=owner),
+                ),
+            )
+
+        # -- Name the threads so the trace is easier to read
+        for thread in threading.enumerate():
+            trace_events.append(
+                dict(
+                    name="thread_name",
+                    ph="M",
+                    pid=pid,
+                    tid=thread.ident,
+                    args=dict(name=thread.name),
+                ),
+            )
+
+        return dict(traceEvents=trace_events, displayTimeUnit="ms")
+
+    def export_chrome_trace(self, filepath: str) -> None:
+        """
+        Writes the recorded calls to the given file as a Chrome trace
+        """
+        with open(filepath, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def enable() -> None:
+    """
+    Starts recording the instrumented calls
+    """
+    global _ENABLED
+    _ENABLED = True
+
+
+def disable() -> None:
+    """
+    Stops recording the instrumented calls. Anything already recorded is kept
+    """
+    global _ENABLED
+    _ENABLED = False
+
+
+def is_enabled() -> bool:
+    return _ENABLED
+
+
+def wrap(function: Callable, name: str, owner: str = "") -> Callable:
+    """
+    Returns a version of the function which records its timings whenever
+    instrumentation is enabled. Any lru cache accessors (such as cache_clear)
+    on the function are carried across to the wrapper.
+
+    Args:
+        function: The function to instrument
+        name: The name to record the call under
+        owner: The class (or plugin) the call should be attributed to
+
+    Returns:
+        The instrumented function
+    """
+
+    @functools.wraps(function)
+    def _instrumented(*args, **kwargs):
+        if not _ENABLED:
+            return function(*args, **kwargs)
+
+        start = time.perf_counter()
+
+        try:
+            return function(*args, **kwargs)
+
+        finally:
+            Profiler.shared().record(
+                name,
+                owner,
+                start,
+                time.perf_counter() - start,
+            )
+
+    for attribute in _CACHE_ATTRIBUTES:
+        if hasattr(function, attribute):
+            setattr(_instrumented, attribute, getattr(function, attribute))
+
+    _instrumented.__profiled__ = True
+
+    return _instrumented
+
+
+def timed(name: str, owner: str = "") -> Callable:
+    """
+    Decorator form of wrap
+
+    Args:
+        name: The name to record the call under
+        owner: The class (or plugin) the call should be attributed to
+    """
+
+    def _decorator(function: Callable) -> Callable:
+        return wrap(function, name, owner)
+
+    return _decorator
+
+
+def instrument_class(
+    cls: type,
+    methods: tuple[str, ...],
+    prefix: str,
+    wrapper: Callable = wrap,
+) -> None:
+    """
+    Instruments the given methods on the class, attributing the calls to
+    the class. Inherited methods are instrumented too (on the class itself),
+    so that every class gets its own breakdown. Calling this more than once
+    on the same class does nothing.
+
+    Args:
+        cls: The class to instrument
+        methods: The names of the methods to instrument
+        prefix: The prefix to record the calls under, for instance "trait"
+        wrapper: The function used to instrument each method. This must take
+            the same arguments as wrap and mark its result as __profiled__
+    """
+    for method_name in methods:
+        method = cls.__dict__.get(method_name)
+
+        # -- If this class defines the method and has already been
+        # -- instrumented there is nothing to do
+        if method is not None and getattr(method, "__profiled__", False):
+            continue
+
+        method = getattr(cls, method_name, None)
+
+        if method is None or isinstance(method, (classmethod, staticmethod)):
+            continue
+
+        # -- If we're inheriting a method which has been instrumented for
+        # -- our parent then we instrument the original so it is not
+        # -- timed twice. Anything else (such as an lru cache) is left
+        # -- wrapped, as unwrapping it would bypass what it does
+        if getattr(method, "__profiled__", False):
+            method = method.__wrapped__
+
+        setattr(
+            cls,
+            method_name,
+            wrapper(method, f"{prefix}.{method_name}", cls.__name__),
+        )
+
+
+def instrument_traits(trait_factory) -> None:
+    """
+    Instruments the label, icon, children and actions methods of all the
+    traits within the given factory
+    """
+    for trait in trait_factory.plugins():
+        instrument_class(trait, TRAIT_METHODS, "trait")
+
+
+def instrument_compositor(compositor) -> None:
+    """
+    Instruments the get and search methods of the given compositor. The
+    lru cache accessors of the get method remain available.
+    """
+    for method_name in ("get", "search"):
+        method = getattr(compositor, method_name, None)
+
+        if method is None or getattr(method, "__profiled__", False):
+            continue
+
+        setattr(
+            compositor,
+            method_name,
+            wrap(method, f"compositor.{method_name}", type(compositor).__name__),
+        )
+
+
+def stats() -> list[Stat]:
+    return Profiler.shared().stats()
+
+
+def slowest(count: int = MAX_SLOWEST) -> list[dict[str, Any]]:
+    return Profiler.shared().slowest(count)
+
+
+def reset() -> None:
+    Profiler.shared().reset()
+
+
+def export_chrome_trace(filepath: str) -> None:
+    Profiler.shared().export_chrome_trace(filepath)
@@ -0,0 +1,281 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> query.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+This module gives the same answers as the explorer (search results, children,
+favourites and which assets are filtered out) without any ui, so that they can
+be used from pipeline and farm jobs:
+
+    query = asset_explorer.AssetQuery(configuration)
+
+    for record in query.walk(max_depth=3):
+        print(record["identifier"], record["label"])
+
+Traits access the configuration through asset().app.config, so the query
+stands in for the explorer as the app of every asset it resolves. Traits which
+reach for the ui (such as the view panel) are not supported headlessly.
+
+Walking the hierarchy asks each asset for its children on a pool of worker
+threads, so the records are given back in the order they're resolved rather
+than a strict depth first order. Every record carries its parent and depth
+so the hierarchy can be rebuilt.
+"""
+import concurrent.futures
+import typing
+
+import asset_composition
+
+from . import config
+
+# -- The most worker threads a walk will use. Traits tend to wait on disk
+# -- or network rather than the cpu, so like the standard executor we
+# -- allow more threads than there are cores
+MAX_WORKERS: int = 16
+
+
+class AssetQuery:
+    """
+    A headless counterpart to the Explorer, exposing the config and
+    compositor which traits expect to find on the app.
+
+    Args:
+        configuration: The explorer configuration to query with
+        max_workers: The most threads to resolve assets with whilst walking
+    """
+
+    def __init__(
+        self,
+        configuration: config.Configuration,
+        max_workers: int = MAX_WORKERS,
+    ) -> None:
+        self._config: config.Configuration = configuration
+        self._compositor = asset_composition.Compositor(self._config)
+        self._max_workers: int = max(1, max_workers)
+
+    @property
+    def config(self) -> config.Configuration:
+        return self._config
+
+    @property
+    def compositor(self) -> asset_composition.Compositor:
+        return self._compositor
+
+    def get(self, identifier: str) -> asset_composition.Asset:
+        """
+        Returns the asset with the given identifier, with this query set as
+        its app so that its traits can read the configuration
+        """
+        return self._adopt(self._compositor.get(identifier))
+
+    def record(
+        self,
+        asset: asset_composition.Asset,
+        **extra: typing.Any,
+    ) -> dict[str, typing.Any]:
+        """
+        Returns the json serialisable description of the asset
+
+        Args:
+            asset: The asset to describe
+            **extra: Any further values to include within the record
+        """
+        data = dict(
+            identifier=asset.identifier(),
+            label=asset.label(),
+            visible=asset.is_visible(),
+        )
+        data.update(extra)
+
+        return data
+
+    def search(
+        self,
+        query: str | None = None,
+        include_hidden: bool = False,
+    ) -> typing.Iterator[dict[str, typing.Any]]:
+        """
+        Searches from the search roots, as the Search View does
+
+        Args:
+            query: The text to search for
+            include_hidden: Whether to include assets which are filtered out
+
+        Returns:
+            Iterator of the record of each matching asset, sorted by label
+        """
+        results = self._compositor.search(
+            search_from=self._config.get_setting("search_roots") or "",
+            query=query,
+        )
+
+        for asset in sorted(results, key=lambda a: a.label()):
+            record = self.record(self._adopt(asset))
+
+            if record["visible"] or include_hidden:
+                yield record
+
+    def favourites(
+        self,
+        query: str | None = None,
+        include_hidden: bool = False,
+    ) -> typing.Iterator[dict[str, typing.Any]]:
+        """
+        Gives back the favourited assets, as the Favourites View does
+
+        Args:
+            query: Only favourites whose label contains this are given
+            include_hidden: Whether to include assets which are filtered out
+
+        Returns:
+            Iterator of the record of each favourite
+        """
+        for identifier in self._config.get_setting("favourites"):
+            record = self.record(self.get(identifier))
+
+            if query and query not in record["label"]:
+                continue
+
+            if record["visible"] or include_hidden:
+                yield record
+
+    def children(
+        self,
+        identifier: str,
+        include_hidden: bool = False,
+    ) -> list[asset_composition.Asset]:
+        """
+        Returns the child assets of the asset with the given identifier
+
+        Args:
+            identifier: The identifier of the asset
+            include_hidden: Whether to include assets which are filtered out
+        """
+        children = [self.get(child) for child in self.get(identifier).children()]
+
+        if include_hidden:
+            return children
+
+        return [child for child in children if child.is_visible()]
+
+    def walk(
+        self,
+        roots: list[str] | None = None,
+        max_depth: int | None = None,
+        include_hidden: bool = False,
+        detailed: bool = False,
+    ) -> typing.Iterator[dict[str, typing.Any]]:
+        """
+        Walks the hierarchy beneath the given roots (the search roots by
+        default), resolving many assets in parallel. Assets which are
+        filtered out are not descended into. Each asset is only given back
+        once, from the first parent it was reached through, so assets with
+        many parents (or hierarchies which loop back on themselves) are
+        walked once.
+
+        Args:
+            roots: The identifiers to walk from
+            max_depth: How many levels beneath the roots to walk. None walks
+                the entire hierarchy
+            include_hidden: Whether to include (and descend into) assets
+                which are filtered out
+            detailed: Whether each record should also hold the icon, status
+                icons and children of the asset. Only icons given as names or
+                paths are included, as anything else cannot be serialised.
+
+        Returns:
+            Iterator of the record of each asset, including its parent and
+            its depth beneath the roots
+        """
+        if roots is None:
+            roots = self._config.get_setting("search_roots")
+
+        def resolve(
+            identifier: str,
+            parent: str | None,
+            depth: int,
+        ) -> tuple[dict[str, typing.Any] | None, list[str]]:
+            asset = self.get(identifier)
+            record = self.record(asset, parent=parent, depth=depth)
+
+            if not record["visible"] and not include_hidden:
+                return None, []
+
+            children = []
+
+            if max_depth is None or depth < max_depth:
+                children = [
+                    child.identifier()
+                    for child in self.children(identifier, include_hidden)
+                ]
+
+            if detailed:
+                icon = asset.icon()
+
+                record.update(
+                    icon=icon if isinstance(icon, str) else None,
+                    status=[
+                        status for status in asset.status_icons()
+                        if isinstance(status, str)
+                    ],
+                    children=children,
+                )
+
+            return record, children
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers,
+            thread_name_prefix="asset_explorer_query",
+        ) as executor:
+            # -- Every identifier which has been submitted, so that nothing
+            # -- is resolved twice
+            seen = set(roots)
+            pending = {executor.submit(resolve, root, None, 0) for root in seen}
+
+            try:
+                while pending:
+                    done, pending = concurrent.futures.wait(
+                        pending,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+
+                    for future in done:
+                        record, children = future.result()
+
+                        if record is None:
+                            continue
+
+                        yield record
+
+                        for child in children:
+                            if child in seen:
+                                continue
+
+                            seen.add(child)
+                            pending.add(
+                                executor.submit(
+                                    resolve,
+                                    child,
+                                    record["identifier"],
+                                    record["depth"] + 1,
+                                ),
+                            )
+
+            finally:
+                # -- If the caller stops iterating part way through, there is
+                # -- no need to resolve anything still waiting
+                for future in pending:
+                    future.cancel()
+
+    def _adopt(self, asset: asset_composition.Asset) -> asset_composition.Asset:
+        """
+        Sets this query as the app of the asset, which is where traits look
+        for the configuration
+        """
+        asset.app = self
+        return asset
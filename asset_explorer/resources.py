@@ -10,8 +10,27 @@
 """
 As many of the modules and widgets dynamically retrieve resources (images, ui files
 etc), this module contains convenience functionality to access them.
+
+The ui files loaded through load_ui are compiled into python modules within the
+_generated package by calling build, so that creating a widget does not need to
+parse the ui file. Whenever one of those ui files is changed, build should be
+called again:
+
+    python -c "import asset_explorer.resources; asset_explorer.resources.build()"
+
+Each compiled module records the hash of the ui file it was compiled from, and
+stale gives back the ui files which have changed since they were compiled. At
+runtime the compiled module is trusted without reading the ui file, unless the
+ASSET_EXPLORER_CHECK_UI environment variable is set (which is useful whilst
+editing the ui files), in which case a changed ui file is loaded at runtime
+instead. If the compiled module is missing then the ui file is always loaded.
 """
+import hashlib
+import importlib
 import os
+import re
+import shutil
+import subprocess
 
 # -- Cache this variable so we don't reconstruct the
 # -- path every time a resource is requested
@@ -20,6 +39,27 @@ _RES_FOLDER: str = os.path.join(
     "_res",
 )
 
+# -- The package the compiled resources are written to
+_GENERATED_FOLDER: str = os.path.join(
+    os.path.dirname(__file__),
+    "_generated",
+)
+_GENERATED_PACKAGE: str = f"{__package__}._generated"
+
+# -- The ui compilers we try, in order of preference
+_UI_COMPILERS: list[str] = ["pyside6-uic", "pyside2-uic"]
+
+# -- The ui files which are loaded through load_ui, and so are compiled
+_COMPILED_UI_FILES: tuple[str, ...] = ("preferences.ui",)
+
+# -- The environment variable which, when set, has load_ui check each compiled
+# -- module against its ui file before using it
+_CHECK_UI_VARIABLE: str = "ASSET_EXPLORER_CHECK_UI"
+
+# -- Whether the compiled module of each ui file matches the ui file, by
+# -- the name of the ui file. This only needs checking once per session
+_UP_TO_DATE: dict[str, bool] = dict()
+
 
 # --------------------------------------------------------------------------------------
 def get(name: str) -> str:
@@ -37,3 +77,220 @@ def get(name: str) -> str:
         _RES_FOLDER,
         name,
     )
+
+
+# --------------------------------------------------------------------------------------
+def cache_directory(*parts: str) -> str:
+    """
+    Returns the absolute path to the folder the explorer uses for persistent
+    caches. This can be overridden with the ASSET_EXPLORER_CACHE environment
+    variable. The folder is created if it does not exist.
+
+    Args:
+        *parts: Optional sub folder names to append to the cache location
+
+    Returns:
+        str: The absolute path of the cache folder
+    """
+    root = os.environ.get("ASSET_EXPLORER_CACHE")
+
+    if not root:
+        root = os.path.join(
+            os.environ.get("APPDATA") or os.path.expanduser("~/.cache"),
+            "asset_explorer",
+        )
+
+    path = os.path.join(root, *parts)
+    os.makedirs(path, exist_ok=True)
+
+    return path
+
+
+# --------------------------------------------------------------------------------------
+def load_ui(name: str, parent=None) -> "QtWidgets.QWidget":
+    """
+    Creates the widget described by the given ui file. The compiled form is
+    used whenever it exists, without reading the ui file. If the
+    ASSET_EXPLORER_CHECK_UI environment variable is set then the ui file is
+    loaded at runtime instead whenever it has changed since it was compiled.
+    In either case the widgets and layouts within the
+    form are accessible as attributes of the returned widget.
+
+    Args:
+        name (str): The filename of the ui file within the res folder
+        parent (QWidget): The parent widget
+
+    Returns:
+        QWidget: The widget representing the ui file
+    """
+    try:
+        module = importlib.import_module(
+            f"{_GENERATED_PACKAGE}.{_module_name(name)}",
+        )
+
+    except ImportError:
+        module = None
+
+    if module is None or (
+        os.environ.get(_CHECK_UI_VARIABLE) and not _is_up_to_date(name, module)
+    ):
+        import qtility
+
+        return qtility.designer.load(get(name), parent)
+
+    from Qt import QtWidgets
+
+    widget = QtWidgets.QWidget(parent)
+
+    form = module.FORM()
+    form.setupUi(widget)
+
+    # -- Expose the form's members on the widget, matching the
+    # -- widgets given back by the runtime loader
+    for attribute_name, value in vars(form).items():
+        setattr(widget, attribute_name, value)
+
+    return widget
+
+
+# --------------------------------------------------------------------------------------
+def build() -> list[str]:
+    """
+    Compiles each of the ui files loaded through load_ui into a python module
+    within the _generated package, recording the hash of the ui file so that
+    the module is not used once the ui file changes.
+
+    Returns:
+        list[str]: The filepaths of the modules which were written
+    """
+    compiler = next(
+        (
+            compiler_path
+            for compiler_path in map(shutil.which, _UI_COMPILERS)
+            if compiler_path
+        ),
+        None,
+    )
+
+    if not compiler:
+        raise RuntimeError(
+            f"Could not find a ui compiler, looked for {', '.join(_UI_COMPILERS)}",
+        )
+
+    os.makedirs(_GENERATED_FOLDER, exist_ok=True)
+
+    written = []
+
+    for filename in _COMPILED_UI_FILES:
+        filepath = get(filename)
+
+        source = subprocess.run(
+            [compiler, filepath],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+
+        # -- The compiler imports directly from the binding it belongs
+        # -- to, whereas we go through Qt.py so that any binding works
+        source = re.sub(
+            r"^from (PySide6|PySide2)\.",
+            "from Qt.",
+            source,
+            flags=re.MULTILINE,
+        )
+
+        # -- The form class is named after the root widget, so give it a
+        # -- consistent name for the loader to find
+        form_name = re.search(r"^class (Ui_\w+)", source, re.MULTILINE).group(1)
+        source = (
+            source.rstrip()
+            + f"\n\n\nFORM = {form_name}\n"
+            + f"SOURCE_HASH = {_hash(filepath)!r}\n"
+        )
+
+        written.append(
+            _write_module(_module_name(filename), source),
+        )
+
+    _UP_TO_DATE.clear()
+
+    return written
+
+
+# --------------------------------------------------------------------------------------
+def stale() -> list[str]:
+    """
+    Returns the ui files loaded through load_ui whose compiled module is
+    missing or was built from a different version of the ui file. This reads
+    each of the ui files, so is intended for development and for checking
+    that build has been called before releasing, rather than for runtime use.
+
+    Returns:
+        list[str]: The filenames of the ui files which need building
+    """
+    stale_files = []
+
+    for filename in _COMPILED_UI_FILES:
+        try:
+            module = importlib.import_module(
+                f"{_GENERATED_PACKAGE}.{_module_name(filename)}",
+            )
+
+        except ImportError:
+            stale_files.append(filename)
+            continue
+
+        if not _is_up_to_date(filename, module):
+            stale_files.append(filename)
+
+    return stale_files
+
+
+# --------------------------------------------------------------------------------------
+def _module_name(filename: str) -> str:
+    """
+    Returns the name of the module the given ui file is compiled to
+    """
+    return f"{os.path.splitext(filename)[0]}_ui"
+
+
+# --------------------------------------------------------------------------------------
+def _hash(filepath: str) -> str:
+    """
+    Returns the hash of the content of the given file. Line endings are
+    normalised, so a checkout which converts them still matches.
+    """
+    with open(filepath, "rb") as f:
+        return hashlib.sha1(f.read().replace(b"\r\n", b"\n")).hexdigest()
+
+
+# --------------------------------------------------------------------------------------
+def _is_up_to_date(name: str, module) -> bool:
+    """
+    Returns True if the compiled module was built from the ui file as it is
+    now. If the ui file is not present (for instance when only the compiled
+    modules are shipped) then the compiled module is all we have.
+    """
+    up_to_date = _UP_TO_DATE.get(name)
+
+    if up_to_date is None:
+        try:
+            up_to_date = getattr(module, "SOURCE_HASH", None) == _hash(get(name))
+
+        except OSError:
+            up_to_date = True
+
+        _UP_TO_DATE[name] = up_to_date
+
+    return up_to_date
+
+
+# --------------------------------------------------------------------------------------
+def _write_module(module_name: str, source: str) -> str:
+    filepath = os.path.join(_GENERATED_FOLDER, f"{module_name}.py")
+
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(source)
+
+    return filepath
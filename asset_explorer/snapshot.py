@@ -0,0 +1,405 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> snapshot.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+A snapshot is a file holding an asset hierarchy as it was when it was exported,
+allowing the hierarchy to be browsed offline or on machines which cannot reach
+the data it came from.
+
+Exporting walks the hierarchy in parallel, writing the identifier, label, icon,
+status icons and children of every asset:
+
+    asset_explorer.snapshot.export(configuration, "c:/library.snapshot")
+
+The file is json-lines. The first line is a header, followed by a line per
+asset, then a line holding the index (the position of each asset within the
+file) and finally a fixed length footer giving the position of the index. This
+means the file can be read a line at a time, whilst the explorer only needs to
+read the index and can then read each asset as it is needed. The identifiers
+and labels within the index are held as a tree of shared segments (see
+asset_explorer.paths), so that large hierarchies do not store the same long
+prefixes over and over.
+
+To browse a snapshot, add the snapshot plugins to a configuration in place of
+the live traits and discovery plugins, and mount the snapshot:
+
+    configuration.traits.add_path(asset_explorer.snapshot.PLUGIN_PATHS["traits"])
+    configuration.discovery.add_path(asset_explorer.snapshot.PLUGIN_PATHS["discovery"])
+
+    asset_explorer.snapshot.mount("c:/library.snapshot")
+
+Snapshots can also be mounted by listing them within the ASSET_EXPLORER_SNAPSHOT
+environment variable.
+"""
+import array
+import datetime
+import json
+import mmap
+import os
+import threading
+import typing
+
+from . import paths, query
+
+# -- The identifier written into the header of every snapshot
+FORMAT: str = "asset_explorer.snapshot"
+VERSION: int = 2
+
+# -- The length of the footer which gives the position of the index
+_FOOTER_LENGTH: int = 64
+
+# -- The environment variable which can list snapshots to mount
+_ENVIRONMENT_VARIABLE: str = "ASSET_EXPLORER_SNAPSHOT"
+
+# -- The folders holding the read only plugins which serve a snapshot
+PLUGIN_PATHS: dict[str, str] = dict(
+    traits=os.path.join(os.path.dirname(__file__), "plugins", "snapshot", "traits"),
+    discovery=os.path.join(os.path.dirname(__file__), "plugins", "snapshot", "discovery"),
+)
+
+# -- The snapshots which are mounted, keyed by their path
+_MOUNTED: dict[str, "Snapshot"] = dict()
+_MOUNTED_LOCK: threading.Lock = threading.Lock()
+_ENVIRONMENT_MOUNTED: bool = False
+
+
+def export(
+    configuration: "asset_explorer.Configuration",
+    filepath: str,
+    roots: list[str] | None = None,
+    max_depth: int | None = None,
+    max_workers: int = query.MAX_WORKERS,
+    include_hidden: bool = False,
+) -> int:
+    """
+    Walks the hierarchy beneath the given roots (the search roots by default)
+    and writes it to a snapshot file.
+
+    Args:
+        configuration: The configuration to resolve the assets with
+        filepath: The file to write the snapshot to
+        roots: The identifiers to walk from
+        max_depth: How many levels beneath the roots to walk. None walks
+            the entire hierarchy
+        max_workers: The most assets to resolve at once
+        include_hidden: Whether to include assets which are filtered out
+
+    Returns:
+        The number of assets written
+    """
+    asset_query = query.AssetQuery(configuration, max_workers=max_workers)
+
+    if roots is None:
+        roots = list(configuration.get_setting("search_roots"))
+
+    # -- Write to a temporary file, so anything reading the snapshot
+    # -- does not see it until it is complete
+    temporary_filepath = f"{filepath}.partial"
+
+    # -- The index is held as columns, with a row per node of the path
+    # -- store. Nodes which are only part of a path (rather than an asset
+    # -- in their own right) have no offset, length or label
+    store = paths.PathStore()
+    offsets = array.array("q")
+    lengths = array.array("q")
+    labels = array.array("q")
+
+    with open(temporary_filepath, "wb") as f:
+        f.write(
+            _line(
+                dict(
+                    format=FORMAT,
+                    version=VERSION,
+                    roots=roots,
+                    max_depth=max_depth,
+                    created=datetime.datetime.now().isoformat(timespec="seconds"),
+                ),
+            ),
+        )
+
+        for record in asset_query.walk(
+            roots=roots,
+            max_depth=max_depth,
+            include_hidden=include_hidden,
+            detailed=True,
+        ):
+            line = _line(record)
+            node = store.add(record["identifier"])
+
+            for column in (offsets, lengths, labels):
+                column.extend([-1] * (len(store) - len(column)))
+
+            offsets[node] = f.tell()
+            lengths[node] = len(line)
+            labels[node] = store.intern(record["label"])
+
+            f.write(line)
+
+        index_offset = f.tell()
+        f.write(
+            _line(
+                dict(
+                    index=dict(
+                        segments=[
+                            store.segment(segment_id)
+                            for segment_id in range(store.segment_count())
+                        ],
+                        parents=[parent for _, parent, _ in store.nodes()],
+                        names=[segment_id for _, _, segment_id in store.nodes()],
+                        offsets=offsets.tolist(),
+                        lengths=lengths.tolist(),
+                        labels=labels.tolist(),
+                    ),
+                ),
+            ),
+        )
+
+        footer = json.dumps(dict(index_offset=index_offset))
+        f.write(f"{footer:<{_FOOTER_LENGTH - 1}}\n".encode("utf-8"))
+
+    # -- If the previous snapshot at this path is mounted then the new one
+    # -- is mounted in its place. The previous one is only closed once it
+    # -- is no longer published, and closing it waits for any reads which
+    # -- are still using it
+    key = os.path.abspath(filepath)
+
+    with _MOUNTED_LOCK:
+        previous = _MOUNTED.get(key)
+
+        try:
+            os.replace(temporary_filepath, filepath)
+
+        except PermissionError:
+            # -- Windows cannot replace a file which is memory mapped, so
+            # -- there the previous snapshot has to be closed first
+            if previous is None:
+                raise
+
+            del _MOUNTED[key]
+            previous.close()
+            os.replace(temporary_filepath, filepath)
+
+        if previous:
+            _MOUNTED[key] = Snapshot(filepath)
+
+    if previous:
+        previous.close()
+
+    return sum(1 for offset in offsets if offset >= 0)
+
+
+def _line(data: dict[str, typing.Any]) -> bytes:
+    return (json.dumps(data, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+
+class Snapshot:
+    """
+    Read only access to a snapshot file. The file is memory mapped, so only
+    the index is read up front whilst each asset is read when it is asked for.
+    Once closed, the snapshot no longer gives back any records.
+
+    Args:
+        filepath: The snapshot file to read
+    """
+
+    def __init__(self, filepath: str) -> None:
+        self._filepath: str = filepath
+
+        with open(filepath, "rb") as f:
+            self._map: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = json.loads(self._map[: self._map.find(b"\n")])
+
+        if header.get("format") != FORMAT or header.get("version") != VERSION:
+            raise ValueError(f"{filepath} is not a supported snapshot")
+
+        footer = json.loads(self._map[-_FOOTER_LENGTH:])
+        index_offset = footer["index_offset"]
+
+        index = json.loads(
+            self._map[index_offset : len(self._map) - _FOOTER_LENGTH],
+        )["index"]
+
+        self._header: dict[str, typing.Any] = header
+
+        # -- Rebuild the path store. The nodes were written in the order
+        # -- they were created, so they're given the same ids here
+        self._paths: paths.PathStore = paths.PathStore()
+
+        for segment in index["segments"]:
+            self._paths.intern(segment)
+
+        for parent, segment_id in zip(index["parents"], index["names"]):
+            self._paths.add_node(parent, segment_id)
+
+        self._offsets: array.array = array.array("q", index["offsets"])
+        self._lengths: array.array = array.array("q", index["lengths"])
+        self._labels: array.array = array.array("q", index["labels"])
+        self._count: int = sum(1 for offset in self._offsets if offset >= 0)
+
+        # -- The amount of reads currently using the map, so that closing
+        # -- can wait for them rather than pulling the map from under them
+        self._condition: threading.Condition = threading.Condition()
+        self._readers: int = 0
+        self._closed: bool = False
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def roots(self) -> list[str]:
+        return self._header["roots"]
+
+    def __contains__(self, identifier: str) -> bool:
+        return self._node(identifier) is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _node(self, identifier: str) -> int | None:
+        """
+        Returns the node of the asset with the given identifier, or None if
+        the asset is not within the snapshot
+        """
+        node = self._paths.find(identifier)
+
+        if node is None or self._offsets[node] < 0:
+            return None
+
+        return node
+
+    def get(self, identifier: str) -> dict[str, typing.Any] | None:
+        """
+        Returns the record of the asset with the given identifier, or None
+        if the asset is not within the snapshot
+        """
+        node = self._node(identifier)
+
+        if node is None:
+            return None
+
+        with self._condition:
+            if self._closed:
+                return None
+
+            self._readers += 1
+
+        try:
+            offset = self._offsets[node]
+            data = self._map[offset : offset + self._lengths[node]]
+
+        finally:
+            with self._condition:
+                self._readers -= 1
+                self._condition.notify_all()
+
+        return json.loads(data)
+
+    def search(self, query: str | None = None) -> list[str]:
+        """
+        Returns the identifiers of every asset whose label contains the
+        given text (ignoring case)
+        """
+        query = (query or "").lower()
+
+        # -- Labels are shared between many assets, so each distinct
+        # -- label only needs to be checked once
+        matches: dict[int, bool] = dict()
+        results = []
+
+        for node, label_id in enumerate(self._labels):
+            if label_id < 0:
+                continue
+
+            matched = matches.get(label_id)
+
+            if matched is None:
+                matched = query in self._paths.segment(label_id).lower()
+                matches[label_id] = matched
+
+            if matched:
+                results.append(self._paths.path(node))
+
+        return results
+
+    def close(self) -> None:
+        """
+        Closes the file, waiting for any reads which are using it. Closing a
+        snapshot more than once does nothing.
+        """
+        with self._condition:
+            if self._closed:
+                return
+
+            self._closed = True
+            self._condition.wait_for(lambda: not self._readers)
+            self._map.close()
+
+
+def mount(filepath: str) -> Snapshot:
+    """
+    Makes the snapshot available to the snapshot plugins
+
+    Args:
+        filepath: The snapshot file to mount
+
+    Returns:
+        The mounted snapshot
+    """
+    key = os.path.abspath(filepath)
+
+    with _MOUNTED_LOCK:
+        if key not in _MOUNTED:
+            _MOUNTED[key] = Snapshot(filepath)
+
+        return _MOUNTED[key]
+
+
+def unmount(filepath: str) -> None:
+    """
+    Stops the snapshot being served by the snapshot plugins, and closes it
+    """
+    with _MOUNTED_LOCK:
+        snapshot = _MOUNTED.pop(os.path.abspath(filepath), None)
+
+    if snapshot:
+        snapshot.close()
+
+
+def mounted() -> list[Snapshot]:
+    """
+    Returns all the mounted snapshots, including those listed within the
+    ASSET_EXPLORER_SNAPSHOT environment variable
+    """
+    global _ENVIRONMENT_MOUNTED
+
+    if not _ENVIRONMENT_MOUNTED:
+        _ENVIRONMENT_MOUNTED = True
+
+        for filepath in os.environ.get(_ENVIRONMENT_VARIABLE, "").split(os.pathsep):
+            if filepath:
+                mount(filepath)
+
+    with _MOUNTED_LOCK:
+        return list(_MOUNTED.values())
+
+
+def find(identifier: str) -> dict[str, typing.Any] | None:
+    """
+    Returns the record of the asset from the first mounted snapshot which
+    holds it, or None if no snapshot holds it
+    """
+    for snapshot in mounted():
+        record = snapshot.get(identifier)
+
+        if record is not None:
+            return record
+
+    return None
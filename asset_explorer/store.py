@@ -0,0 +1,299 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> store.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Traits frequently want to persist the data they resolve so that subsequent
+sessions start quickly. Writing a file per asset quickly becomes slow when there
+are tens of thousands of assets, so this module exposes a key-value store which
+keeps everything within a single sqlite file.
+
+Entries are grouped by a namespace (typically the name of the trait or plugin)
+so multiple traits can safely share the same store.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Iterable
+
+from . import resources
+
+# -- Sqlite limits how many parameters can be bound in a single statement,
+# -- so bulk reads are split into chunks of this size
+_CHUNK_SIZE: int = 500
+
+
+class CacheStore:
+    """
+    A thread safe key-value store backed by a single sqlite file. Each thread
+    is given its own connection, and the database runs in WAL mode so that
+    reads are never blocked by writes.
+
+    Args:
+        filepath: The location of the database file
+        mmap_size: The amount of the file (in bytes) which sqlite is allowed
+            to memory map. This makes reads of a warm cache very cheap.
+    """
+
+    # -- Private variables for holding the shared instance
+    _INSTANCE: "CacheStore" = None
+    _INSTANCE_LOCK: threading.Lock = threading.Lock()
+
+    def __init__(self, filepath: str, mmap_size: int = 256 * 1024 * 1024) -> None:
+        self._filepath: str = filepath
+        self._mmap_size: int = mmap_size
+
+        self._local: threading.local = threading.local()
+        self._connections: list[sqlite3.Connection] = list()
+        self._lock: threading.Lock = threading.Lock()
+
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "namespace TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "value BLOB, "
+                "updated REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key)"
+                ") WITHOUT ROWID"
+            )
+
+    @classmethod
+    def shared(cls) -> "CacheStore":
+        """
+        Returns the store which is shared by the explorer and its plugins. This
+        lives in the explorer's cache folder.
+        """
+        with cls._INSTANCE_LOCK:
+            if cls._INSTANCE is None:
+                cls._INSTANCE = cls(
+                    filepath=os.path.join(
+                        resources.cache_directory(),
+                        "cache.sqlite",
+                    ),
+                )
+
+        return cls._INSTANCE
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Returns the connection for the calling thread, creating it if required
+        """
+        connection = getattr(self._local, "connection", None)
+
+        if connection:
+            return connection
+
+        # -- Connections are only ever used by the thread that created them,
+        # -- but we need to be able to close them from any thread
+        connection = sqlite3.connect(
+            self._filepath,
+            timeout=30,
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA mmap_size={int(self._mmap_size)}")
+
+        self._local.connection = connection
+
+        with self._lock:
+            self._connections.append(connection)
+
+        return connection
+
+    def get(self, namespace: str, key: str, default: Any = None) -> bytes | Any:
+        """
+        Returns the value stored against the key
+
+        Args:
+            namespace: The namespace the key belongs to
+            key: The key to look up
+            default: The value to return if the key is not stored
+
+        Returns:
+            The stored bytes, or the default
+        """
+        row = (
+            self._connection()
+            .execute(
+                "SELECT value FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            )
+            .fetchone()
+        )
+
+        if row is None:
+            return default
+
+        return row[0]
+
+    def get_many(self, namespace: str, keys: Iterable[str]) -> dict[str, bytes]:
+        """
+        Returns the values for all the given keys in as few queries as possible.
+        Keys which are not stored are not included in the result.
+
+        Args:
+            namespace: The namespace the keys belong to
+            keys: The keys to look up
+
+        Returns:
+            Dictionary of key to stored bytes
+        """
+        keys = list(keys)
+        results = dict()
+
+        for idx in range(0, len(keys), _CHUNK_SIZE):
+            chunk = keys[idx : idx + _CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+
+            rows = self._connection().execute(
+                f"SELECT key, value FROM entries "
+                f"WHERE namespace = ? AND key IN ({placeholders})",
+                (namespace, *chunk),
+            )
+            results.update(rows)
+
+        return results
+
+    def set(self, namespace: str, key: str, value: bytes) -> None:
+        """
+        Stores the value against the key
+
+        Args:
+            namespace: The namespace the key belongs to
+            key: The key to store the value against
+            value: The bytes to store
+        """
+        self.set_many(namespace, {key: value})
+
+    def set_many(self, namespace: str, items: dict[str, bytes]) -> None:
+        """
+        Stores all the given values in a single transaction
+
+        Args:
+            namespace: The namespace the keys belong to
+            items: Dictionary of key to the bytes to store
+        """
+        now = time.time()
+
+        with self._connection() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, updated) "
+                "VALUES (?, ?, ?, ?)",
+                [(namespace, key, value, now) for key, value in items.items()],
+            )
+
+    def get_json(self, namespace: str, key: str, default: Any = None) -> Any:
+        """
+        Convenience function for reading a value which was stored with set_json
+        """
+        value = self.get(namespace, key)
+
+        if value is None:
+            return default
+
+        return json.loads(value)
+
+    def get_many_json(self, namespace: str, keys: Iterable[str]) -> dict[str, Any]:
+        """
+        Convenience function for reading values which were stored with set_json
+        """
+        return {
+            key: json.loads(value)
+            for key, value in self.get_many(namespace, keys).items()
+        }
+
+    def set_json(self, namespace: str, key: str, value: Any) -> None:
+        """
+        Convenience function for storing any json serialisable value
+        """
+        self.set(namespace, key, json.dumps(value).encode("utf-8"))
+
+    def has(self, namespace: str, key: str) -> bool:
+        """
+        Returns True if a value is stored against the key
+        """
+        row = (
+            self._connection()
+            .execute(
+                "SELECT 1 FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    def keys(self, namespace: str) -> list[str]:
+        """
+        Returns all the keys stored within the namespace
+        """
+        rows = self._connection().execute(
+            "SELECT key FROM entries WHERE namespace = ?",
+            (namespace,),
+        )
+        return [row[0] for row in rows]
+
+    def delete(self, namespace: str, key: str) -> None:
+        """
+        Removes the value stored against the key
+        """
+        with self._connection() as connection:
+            connection.execute(
+                "DELETE FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            )
+
+    def clear(self, namespace: str) -> None:
+        """
+        Removes all the values stored within the namespace
+        """
+        with self._connection() as connection:
+            connection.execute(
+                "DELETE FROM entries WHERE namespace = ?",
+                (namespace,),
+            )
+
+    def compact(self, max_age: float | None = None) -> None:
+        """
+        Reclaims the space left behind by removed or replaced entries. If a
+        max age is given then any entries which have not been written within
+        that many seconds are removed first.
+
+        Args:
+            max_age: Optional age (in seconds) after which entries are removed
+        """
+        connection = self._connection()
+
+        if max_age is not None:
+            with connection:
+                connection.execute(
+                    "DELETE FROM entries WHERE updated < ?",
+                    (time.time() - max_age,),
+                )
+
+        connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        connection.execute("VACUUM")
+
+    def close(self) -> None:
+        """
+        Closes all the connections to the database
+        """
+        with self._lock:
+            connections, self._connections = self._connections, list()
+
+        for connection in connections:
+            connection.close()
+
+        self._local = threading.local()
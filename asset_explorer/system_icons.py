@@ -0,0 +1,266 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> system_icons.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Asking the operating system for the icon of a file is slow, and when showing
+a large folder we would be asking for the same few icons thousands of times.
+This module exposes a single shared icon provider which caches the icons by
+file type, so that all the files sharing an extension share an icon. Only the
+files whose icon is specific to them (such as executables and shortcuts) are
+looked up individually.
+
+Determining whether a path is a folder or an executable means touching the
+disk, so that is done on the task pool. Until it completes, the path is given
+the icon we would expect from its name alone.
+"""
+import os
+import stat
+import sys
+import threading
+from typing import Callable
+
+from Qt import QtCore, QtGui, QtWidgets
+
+from . import tasks
+
+# -- These are the kinds of key an icon can be cached against
+FOLDER: str = "folder"
+FILE: str = "file"
+EXTENSION: str = "extension"
+PATH: str = "path"
+
+# -- Files with these extensions carry their own icon, so they must
+# -- be looked up individually
+if sys.platform == "win32":
+    PER_PATH_EXTENSIONS: frozenset = frozenset(
+        (".exe", ".lnk", ".ico", ".url", ".msi", ".cur", ".ani", ".scr"),
+    )
+
+elif sys.platform == "darwin":
+    PER_PATH_EXTENSIONS: frozenset = frozenset((".app", ".icns"))
+
+else:
+    PER_PATH_EXTENSIONS: frozenset = frozenset((".desktop", ".appimage"))
+
+# -- The amount of classified paths we remember before starting again
+MAX_CLASSIFIED: int = 250000
+
+
+def guess(path: str) -> tuple[str, str]:
+    """
+    Returns the icon key we expect the path to have based only on its
+    name. This never touches the disk, so a path is never guessed to be a
+    folder - that is only known once it has been classified.
+
+    Args:
+        path: The path to guess the key for
+
+    Returns:
+        Tuple of the key kind and its value
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    if not extension:
+        return FILE, ""
+
+    if extension in PER_PATH_EXTENSIONS:
+        return PATH, path
+
+    return EXTENSION, extension
+
+
+def classify(path: str) -> tuple[str, str]:
+    """
+    Returns the icon key for the path, inspecting the file on disk to
+    determine whether it is a folder or executable. This is safe to call
+    from any thread.
+
+    Args:
+        path: The path to classify
+
+    Returns:
+        Tuple of the key kind and its value
+    """
+    try:
+        mode = os.stat(path).st_mode
+
+    except (OSError, ValueError):
+        # -- Anything which is not on disk is given an icon based on
+        # -- its name, which is what the provider would do too
+        extension = os.path.splitext(path)[1].lower()
+        return (EXTENSION, extension) if extension else (FILE, "")
+
+    if stat.S_ISDIR(mode):
+        return FOLDER, ""
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension in PER_PATH_EXTENSIONS:
+        return PATH, path
+
+    # -- Executables without an extension (as is common outside of
+    # -- windows) may have their own icon
+    if not extension and sys.platform != "win32" and mode & stat.S_IXUSR:
+        return PATH, path
+
+    if extension:
+        return EXTENSION, extension
+
+    return FILE, ""
+
+
+# noinspection PyUnresolvedReferences
+class SystemIcons:
+    """
+    Resolves and caches the system icons for paths. Icons can only be
+    created on the gui thread, so calls from any other thread only ever
+    return icons which have already been created.
+    """
+
+    # -- Private variables for holding the shared instance
+    _INSTANCE: "SystemIcons" = None
+    _INSTANCE_LOCK: threading.Lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self._provider: QtWidgets.QFileIconProvider | None = None
+
+        self._lock: threading.Lock = threading.Lock()
+        self._classified: dict[str, tuple[str, str]] = dict()
+        self._icons: dict[tuple[str, str], QtGui.QIcon] = dict()
+
+    @classmethod
+    def shared(cls) -> "SystemIcons":
+        """
+        Returns the instance which is shared by all traits
+        """
+        with cls._INSTANCE_LOCK:
+            if cls._INSTANCE is None:
+                cls._INSTANCE = cls()
+
+        return cls._INSTANCE
+
+    def key(self, path: str) -> tuple[str, str] | None:
+        """
+        Returns the icon key for the path if it has already been classified
+        """
+        with self._lock:
+            return self._classified.get(path)
+
+    def classify(self, path: str) -> tuple[str, str]:
+        """
+        Classifies the path (touching the disk) and remembers the result.
+        This is safe to call from any thread.
+        """
+        key = classify(path)
+
+        with self._lock:
+            if len(self._classified) >= MAX_CLASSIFIED:
+                self._classified = dict()
+
+            self._classified[path] = key
+
+        return key
+
+    def icon(
+        self,
+        path: str,
+        changed: Callable | None = None,
+    ) -> QtGui.QIcon | None:
+        """
+        Returns the system icon for the path. If the path has not been
+        classified yet then the icon expected from its name is returned and
+        the classification is made on the task pool. If that results in a
+        different icon the changed callable is called (from a worker thread).
+
+        Args:
+            path: The path to return the icon for
+            changed: Optional callable, taking no arguments, which is called
+                if the icon returned turns out to be the wrong one
+
+        Returns:
+            The QIcon, or None if no icon can be created at this time
+        """
+        key = self.key(path)
+
+        if key is None:
+            key = guess(path)
+
+            tasks.TaskPool.shared().submit(
+                ("system_icons", path),
+                self._classify_and_compare,
+                path,
+                key,
+                changed,
+                identifier=path,
+            )
+
+        return self.icon_for_key(key, path)
+
+    def icon_for_key(self, key: tuple[str, str], path: str = "") -> QtGui.QIcon | None:
+        """
+        Returns the icon for the given key, creating it if we're on the gui
+        thread. The path is used as the example of the key for extensions.
+        """
+        with self._lock:
+            icon = self._icons.get(key)
+
+        if icon is not None:
+            return icon
+
+        # -- Icons can only be created when there is an application and
+        # -- only on its thread
+        application = QtCore.QCoreApplication.instance()
+
+        if not isinstance(application, QtWidgets.QApplication):
+            return None
+
+        if QtCore.QThread.currentThread() is not application.thread():
+            return None
+
+        if self._provider is None:
+            self._provider = QtWidgets.QFileIconProvider()
+
+        kind, value = key
+
+        if kind == FOLDER:
+            icon = self._provider.icon(QtWidgets.QFileIconProvider.Folder)
+
+        elif kind == FILE:
+            icon = self._provider.icon(QtWidgets.QFileIconProvider.File)
+
+        else:
+            icon = self._provider.icon(QtCore.QFileInfo(path or f"file{value}"))
+
+        with self._lock:
+            self._icons[key] = icon
+
+        return icon
+
+    def clear(self) -> None:
+        """
+        Forgets all the classified paths and the icons
+        """
+        with self._lock:
+            self._classified = dict()
+            self._icons = dict()
+
+    def _classify_and_compare(
+        self,
+        path: str,
+        expected: tuple[str, str],
+        changed: Callable | None,
+    ) -> None:
+        """
+        Classifies the path on the task pool, letting the caller know if
+        the icon they were given was the wrong one
+        """
+        key = self.classify(path)
+
+        if key != expected and changed:
+            changed()
@@ -0,0 +1,571 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> tasks.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Many traits need to fetch data which is slow to resolve (rest api's, large files,
+application queries etc). This module exposes a shared pool of worker threads
+which traits can submit those fetches to rather than each trait having to manage
+its own threading.
+
+Tasks are identified by a key, which means submitting the same fetch twice will
+only ever run it once. Tasks are run in priority order (lower values first) and
+can be bound to an owner (typically the trait) - if the owner is garbage collected
+before the task runs then the task is dropped.
+
+Tasks can also be tagged with the identifier of the asset they are resolving data
+for. The active view publishes which assets are on screen, and tagged tasks for
+those assets are given the highest priority, whilst tagged tasks for assets which
+have been scrolled away from are cancelled.
+
+Note that callbacks are called from the worker thread, so any asset updates should
+be published through asset_explorer.notify_status_changed / notify_changed.
+"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Callable, Hashable
+
+_LOG = logging.getLogger(__name__)
+
+# -- These are the standard priorities. Lower values are processed first
+PRIORITY_VISIBLE: int = 0
+PRIORITY_PREFETCH: int = 10
+PRIORITY_NORMAL: int = 50
+PRIORITY_BACKGROUND: int = 100
+
+
+class Task:
+    """
+    A task represents a single unit of work within the pool. It is returned
+    from TaskPool.submit and can be used to cancel the work or to wait on
+    its result.
+    """
+
+    def __init__(
+        self,
+        key: Hashable,
+        function: Callable,
+        args: tuple,
+        kwargs: dict,
+        priority: int,
+        retries: int,
+        backoff: float,
+        identifier: str | None = None,
+    ) -> None:
+        self.key: Hashable = key
+        self.priority: int = priority
+        self.identifier: str | None = identifier
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+        self._function: Callable = function
+        self._args: tuple = args
+        self._kwargs: dict = kwargs
+        self._retries: int = retries
+        self._backoff: float = backoff
+        self._attempts: int = 0
+
+        self._owners: list[weakref.ref] = list()
+        self._has_owners: bool = False
+        self._callbacks: list[Callable] = list()
+        self._errbacks: list[Callable] = list()
+
+        # -- The sequence of the most recent heap entry for this task, and
+        # -- whether the task is currently being run by a worker
+        self._sequence: int | None = -1
+        self._running: bool = False
+
+        self._cancelled: bool = False
+        self._done: threading.Event = threading.Event()
+
+    def __repr__(self) -> str:
+        return f"<Task {self.key!r} (priority: {self.priority})>"
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        A task is cancelled if it has been explicitly cancelled or if all of
+        the owners it was bound to are no longer alive
+        """
+        if self._cancelled:
+            return True
+
+        if self._has_owners and not any(owner() for owner in self._owners):
+            return True
+
+        return False
+
+    def cancel(self) -> None:
+        """
+        Marks the task as cancelled. If the task is already running then it
+        will complete, but its callbacks will not be called.
+        """
+        self._cancelled = True
+        self._done.set()
+
+    def done(self) -> bool:
+        """
+        Returns True if the task has completed, failed or been cancelled
+        """
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> Any:
+        """
+        Blocks until the task has completed and returns its result.
+
+        Args:
+            timeout: The maximum amount of seconds to wait for
+
+        Returns:
+            The result of the task (or None if it failed or was cancelled)
+        """
+        self._done.wait(timeout)
+        return self.result
+
+    def _bind(
+        self,
+        owner: Any = None,
+        callback: Callable | None = None,
+        errback: Callable | None = None,
+    ) -> None:
+        """
+        Adds the given owner and callbacks to the task. This is used when the
+        same task is requested multiple times, so anything which is already
+        bound is not bound again.
+        """
+        if owner is not None and not any(ref() is owner for ref in self._owners):
+            self._owners.append(weakref.ref(owner))
+            self._has_owners = True
+
+        if callback and callback not in self._callbacks:
+            self._callbacks.append(callback)
+
+        if errback and errback not in self._errbacks:
+            self._errbacks.append(errback)
+
+
+# noinspection PyBroadException
+class TaskPool:
+    """
+    A bounded pool of worker threads which process tasks in priority order.
+    Workers sleep on a condition variable whilst there is nothing to do, so
+    an idle pool costs nothing.
+    """
+
+    # -- Private variables for holding the shared instance
+    _INSTANCE: "TaskPool" = None
+    _INSTANCE_LOCK: threading.Lock = threading.Lock()
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._max_workers: int = max_workers
+        self._workers: list[threading.Thread] = list()
+
+        self._condition: threading.Condition = threading.Condition()
+        self._counter: itertools.count = itertools.count()
+
+        # -- The queue is a heap of (priority, sequence, task). The delayed
+        # -- heap holds tasks waiting to be retried as (time, sequence, task)
+        self._queue: list[tuple[int, int, Task]] = list()
+        self._delayed: list[tuple[float, int, Task]] = list()
+
+        # -- Every task which is queued or running, by its key
+        self._tasks: dict[Hashable, Task] = dict()
+
+        # -- The identifiers of the assets which are currently on screen
+        # -- and those which are close to being on screen
+        self._visible: set[str] = set()
+        self._prefetch: set[str] = set()
+
+        self._shutdown: bool = False
+
+    @classmethod
+    def shared(cls) -> "TaskPool":
+        """
+        Returns the task pool which is shared by all traits. This should be
+        used in preference to creating new pools.
+        """
+        with cls._INSTANCE_LOCK:
+            if cls._INSTANCE is None:
+                cls._INSTANCE = cls()
+
+        return cls._INSTANCE
+
+    def submit(
+        self,
+        key: Hashable,
+        function: Callable,
+        *args,
+        owner: Any = None,
+        identifier: str | None = None,
+        priority: int = PRIORITY_NORMAL,
+        retries: int = 2,
+        backoff: float = 0.5,
+        callback: Callable | None = None,
+        errback: Callable | None = None,
+        **kwargs,
+    ) -> Task:
+        """
+        Submits a function to be run by the pool. If a task with the same key
+        is already queued or running then that task is returned rather than
+        a new one being created.
+
+        Args:
+            key: A unique key representing this piece of work
+            function: The callable to run
+            owner: Optional object the task is bound to. If this is garbage
+                collected before the task runs, the task is dropped
+            identifier: Optional identifier of the asset this task is resolving
+                data for. This allows the task to be prioritised based on
+                whether the asset is visible
+            priority: The priority of the task. Lower values run first. If the
+                identifier is on screen this will be raised accordingly
+            retries: How many times to retry the task if it raises
+            backoff: The delay (in seconds) before the first retry. This
+                doubles with every subsequent retry
+            callback: Called with the result when the task succeeds
+            errback: Called with the exception if the task ultimately fails
+
+        Returns:
+            The Task object
+        """
+        with self._condition:
+            priority = min(priority, self._focus_priority(identifier))
+            task = self._tasks.get(key)
+
+            # -- If we already have this task then we simply bind to it, and
+            # -- raise its priority if we're more urgent
+            if task and not task.cancelled:
+                task._bind(owner, callback, errback)
+
+                if priority < task.priority:
+                    self._push(task, priority)
+
+                return task
+
+            task = Task(
+                key=key,
+                function=function,
+                args=args,
+                kwargs=kwargs,
+                priority=priority,
+                retries=retries,
+                backoff=backoff,
+                identifier=identifier,
+            )
+            task._bind(owner, callback, errback)
+
+            self._tasks[key] = task
+            self._push(task, priority)
+            self._spawn_worker()
+
+        return task
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Cancels the task with the given key
+
+        Args:
+            key: The key of the task to cancel
+
+        Returns:
+            True if a task was cancelled
+        """
+        with self._condition:
+            task = self._tasks.pop(key, None)
+
+        if not task:
+            return False
+
+        task.cancel()
+        return True
+
+    def reprioritise(self, key: Hashable, priority: int) -> None:
+        """
+        Changes the priority of a queued task
+
+        Args:
+            key: The key of the task to change
+            priority: The new priority
+        """
+        with self._condition:
+            task = self._tasks.get(key)
+
+            if task and task.priority != priority:
+                self._push(task, priority)
+
+    def focus(self, visible: set[str], prefetch: set[str]) -> set[str]:
+        """
+        Declares which assets are currently on screen, and which are close to
+        being on screen. Queued tasks for those assets are moved to the front
+        of the queue, whilst visibility driven tasks for assets which are no
+        longer near the screen are cancelled.
+
+        Args:
+            visible: The identifiers of the assets within the viewport
+            prefetch: The identifiers of the assets just outside of the viewport
+
+        Returns:
+            The identifiers of the assets whose tasks were cancelled. Their
+            callbacks will never be called, so the data they were fetching
+            needs requesting again if the assets come back into focus
+        """
+        cancelled = set()
+
+        with self._condition:
+            self._visible = set(visible)
+            self._prefetch = set(prefetch)
+
+            for key, task in list(self._tasks.items()):
+                if task.identifier is None or task._running:
+                    continue
+
+                priority = self._focus_priority(task.identifier)
+
+                # -- If this was only requested because it was near the
+                # -- screen, and it no longer is, then drop it
+                if priority == PRIORITY_BACKGROUND:
+                    if task.priority <= PRIORITY_PREFETCH:
+                        self._tasks.pop(key)
+                        task.cancel()
+                        cancelled.add(task.identifier)
+                    continue
+
+                if priority != task.priority:
+                    self._push(task, priority)
+
+        return cancelled
+
+    def pending(self) -> list[Task]:
+        """
+        Returns all the tasks which are queued or running
+        """
+        with self._condition:
+            return list(self._tasks.values())
+
+    def shutdown(self, wait: bool = False) -> None:
+        """
+        Stops all the workers. Any queued tasks are cancelled.
+
+        Args:
+            wait: If True, block until the workers have finished
+        """
+        with self._condition:
+            self._shutdown = True
+
+            for task in self._tasks.values():
+                task.cancel()
+
+            self._tasks.clear()
+            self._queue.clear()
+            self._delayed.clear()
+            self._condition.notify_all()
+
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _push(self, task: Task, priority: int) -> None:
+        """
+        Pushes the task onto the queue. This must be called with the condition
+        held. If the task is already queued then the older entry is left in
+        the heap and is ignored when popped, as its sequence no longer matches.
+        Tasks which are running or waiting on a retry only take the new priority.
+        """
+        task.priority = priority
+
+        if task._running or task._sequence is None:
+            return
+
+        task._sequence = next(self._counter)
+        heapq.heappush(self._queue, (priority, task._sequence, task))
+        self._condition.notify()
+
+    def _focus_priority(self, identifier: str | None) -> int:
+        """
+        Returns the priority an asset should be given based on whether it is
+        on or near the screen. This must be called with the condition held.
+        """
+        if identifier in self._visible:
+            return PRIORITY_VISIBLE
+
+        if identifier in self._prefetch:
+            return PRIORITY_PREFETCH
+
+        return PRIORITY_BACKGROUND
+
+    def _spawn_worker(self) -> None:
+        """
+        Starts another worker thread if we have more work than workers and
+        are still within our bounds. This must be called with the condition held.
+        """
+        if len(self._workers) >= self._max_workers:
+            return
+
+        if len(self._workers) >= len(self._tasks):
+            return
+
+        worker = threading.Thread(
+            target=self._work,
+            name=f"asset_explorer.tasks.{len(self._workers)}",
+            daemon=True,
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _next(self) -> Task | None:
+        """
+        Blocks until there is a task ready to run and returns it. None is
+        returned if the pool is shutting down.
+        """
+        with self._condition:
+            while not self._shutdown:
+
+                # -- Move any delayed tasks which are now due into the
+                # -- main queue
+                now = time.monotonic()
+
+                while self._delayed and self._delayed[0][0] <= now:
+                    _, _, task = heapq.heappop(self._delayed)
+                    task._sequence = next(self._counter)
+                    heapq.heappush(
+                        self._queue,
+                        (task.priority, task._sequence, task),
+                    )
+
+                while self._queue:
+                    _, sequence, task = heapq.heappop(self._queue)
+
+                    # -- Skip over stale heap entries
+                    if sequence != task._sequence:
+                        continue
+
+                    # -- The task has been dropped (or replaced by a newer
+                    # -- task with the same key), so release anyone still
+                    # -- waiting on it
+                    if self._tasks.get(task.key) is not task:
+                        if not task.done():
+                            task.cancel()
+                        continue
+
+                    # -- If the task has been cancelled (or its owners have
+                    # -- died) then forget about it
+                    if task.cancelled:
+                        self._tasks.pop(task.key, None)
+                        task.cancel()
+                        continue
+
+                    task._running = True
+                    return task
+
+                # -- There is nothing to do, so sleep until we're notified
+                # -- or until the next delayed task is due
+                timeout = None
+
+                if self._delayed:
+                    timeout = max(0.0, self._delayed[0][0] - now)
+
+                self._condition.wait(timeout)
+
+        return None
+
+    def _work(self) -> None:
+        """
+        This is the main loop of each worker thread
+        """
+        while True:
+            task = self._next()
+
+            if task is None:
+                return
+
+            task._attempts += 1
+
+            # -- The task is marked as no longer running by _completed or
+            # -- _failed, whilst they hold the condition. Otherwise focus
+            # -- could drop the task between it finishing and its result
+            # -- being handled
+            try:
+                result = task._function(*task._args, **task._kwargs)
+
+            except Exception as error:
+                self._failed(task, error)
+                continue
+
+            self._completed(task, result)
+
+    def _completed(self, task: Task, result: Any) -> None:
+        """
+        Stores the result of the task and calls its callbacks
+        """
+        with self._condition:
+            task._running = False
+
+            if self._tasks.get(task.key) is task:
+                self._tasks.pop(task.key)
+
+        # -- If the task was cancelled (or its owners died) whilst it was
+        # -- running then nobody gets the result, but anyone waiting on the
+        # -- task must still be released
+        if task.cancelled:
+            task.cancel()
+            return
+
+        task.result = result
+        task._done.set()
+
+        for callback in task._callbacks:
+            try:
+                callback(result)
+
+            except Exception:
+                _LOG.exception("Task callback failed for %s", task)
+
+    def _failed(self, task: Task, error: BaseException) -> None:
+        """
+        Either schedules the task for a retry, or marks it as failed and calls
+        its errbacks if it has run out of retries
+        """
+        with self._condition:
+            task._running = False
+
+            if not task.cancelled and task._attempts <= task._retries:
+                delay = task._backoff * (2 ** (task._attempts - 1))
+
+                # -- Whilst the task is delayed it has no heap entry
+                task._sequence = None
+                heapq.heappush(
+                    self._delayed,
+                    (time.monotonic() + delay, next(self._counter), task),
+                )
+                self._condition.notify()
+                return
+
+            if self._tasks.get(task.key) is task:
+                self._tasks.pop(task.key)
+
+        # -- Nobody is interested in the failure of a cancelled task
+        if task.cancelled:
+            task.cancel()
+            return
+
+        task.error = error
+        task._done.set()
+
+        if not task._errbacks:
+            _LOG.warning("Task %s failed : %s", task, error)
+
+        for errback in task._errbacks:
+            try:
+                errback(error)
+
+            except Exception:
+                _LOG.exception("Task errback failed for %s", task)
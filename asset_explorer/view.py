@@ -12,11 +12,15 @@ This module contains the view base class (which is required when implementing
 your own views for the explorer, as well as the factory which holds the references
 to the available views.
 """
+import inspect
+import sys
 from typing import AnyStr
 
 import factories
 from Qt import QtCore, QtGui, QtWidgets
 
+from . import manifest, paths, profiling, tasks
+
 
 # noinspection PyUnresolvedReferences,PyPep8Naming
 class View(QtWidgets.QTreeWidget):
@@ -27,6 +31,28 @@ class View(QtWidgets.QTreeWidget):
 
     identifier: str = ""
 
+    # -- This is emitted with the list of items which are within (or close
+    # -- to) the viewport whenever that changes
+    visibleItemsChanged: QtCore.Signal = QtCore.Signal(object)
+
+    # -- The amount of rows either side of the viewport which we consider
+    # -- close enough to be worth resolving data for
+    PREFETCH_MARGIN: int = 20
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Instruments the populate method of every view, so that it can be
+        attributed to the view when profiling
+        """
+        super().__init_subclass__(**kwargs)
+
+        if "populate" in cls.__dict__:
+            cls.populate = profiling.wrap(
+                cls.populate,
+                "View.populate",
+                cls.identifier or cls.__name__,
+            )
+
     def __init__(
         self,
         app: "asset_explorer.Explorer",
@@ -35,6 +61,36 @@ class View(QtWidgets.QTreeWidget):
         super().__init__(parent=parent)
 
         self._app: "asset_explorer.Explorer" = app
+
+        # -- Many items can be selected, allowing actions to be run on
+        # -- all of them at once
+        self.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+
+        # -- Every item within the view by the identifier of its asset. This
+        # -- is maintained as rows are added and removed so finding the item
+        # -- for an asset never means walking the tree. An asset can be shown
+        # -- more than once, so each identifier holds a list of items. The
+        # -- identifiers themselves are held within a path store, so their
+        # -- shared prefixes are only stored once, and the items are keyed
+        # -- by the node of their identifier within that store
+        self._paths: paths.PathStore = paths.PathStore()
+        self._items: dict[int, list["AssetItem"]] = dict()
+        self.model().rowsInserted.connect(self._index_rows)
+        self.model().rowsAboutToBeRemoved.connect(self._unindex_rows)
+        self.model().modelAboutToBeReset.connect(self._clear_index)
+
+        # -- Scrolling and expanding can trigger many changes in quick
+        # -- succession, so we compress the visibility updates
+        self._visibility_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._visibility_timer.setSingleShot(True)
+        self._visibility_timer.setInterval(30)
+        self._visibility_timer.timeout.connect(self.update_visibility)
+
+        # -- The identifiers of the assets whose fetches were cancelled as
+        # -- they moved away from the viewport. Their items need their data
+        # -- reading again if they come back into focus
+        self._cancelled: set[str] = set()
+
         self.populate()
 
         if self._app.config.get_setting("auto_sort"):
@@ -45,6 +101,18 @@ class View(QtWidgets.QTreeWidget):
         self.itemDoubleClicked.connect(self._double_click_propagation)
         self.itemExpanded.connect(self._initialise_children)
 
+        # -- Any change to what could be on screen should trigger a
+        # -- visibility update
+        self.itemExpanded.connect(self.schedule_visibility_update)
+        self.itemCollapsed.connect(self.schedule_visibility_update)
+        self.verticalScrollBar().valueChanged.connect(
+            self.schedule_visibility_update,
+        )
+        self.model().rowsInserted.connect(self.schedule_visibility_update)
+        self.model().layoutChanged.connect(self.schedule_visibility_update)
+        self.model().modelReset.connect(self.schedule_visibility_update)
+        self.schedule_visibility_update()
+
     def populate(self, filter_value: AnyStr | None = None) -> None:
         """
         This should cause a redraw of the view. Ideally clearing out the view and
@@ -52,6 +120,202 @@ class View(QtWidgets.QTreeWidget):
         """
         pass
 
+    def item_for_identifier(self, identifier: str) -> "AssetItem | None":
+        """
+        Returns the item within the view which represents the asset with the
+        given identifier, or None if there is no such item. If the asset is
+        shown more than once, the most recently added item is returned.
+        """
+        items = self._items.get(self._paths.find(identifier))
+        return items[-1] if items else None
+
+    def items_for_identifier(self, identifier: str) -> list["AssetItem"]:
+        """
+        Returns all the items within the view which represent the asset with
+        the given identifier, in the order they were added
+        """
+        return list(self._items.get(self._paths.find(identifier), []))
+
+    def _clear_index(self) -> None:
+        """
+        Empties the identifier index, as every item is about to be removed
+        """
+        self._paths = paths.PathStore()
+        self._items.clear()
+
+    def _index_rows(self, parent: QtCore.QModelIndex, first: int, last: int) -> None:
+        """
+        Adds the inserted items (and any children they already have) to the
+        identifier index
+        """
+        parent_item = (
+            self.itemFromIndex(parent) if parent.isValid() else self.invisibleRootItem()
+        )
+
+        for row in range(first, last + 1):
+            item = parent_item.child(row)
+
+            try:
+                identifier = item.asset().identifier()
+
+            except AttributeError:
+                continue
+
+            self._items.setdefault(self._paths.add(identifier), []).append(item)
+
+            # -- Items are usually added before their children, but
+            # -- anything added with children already in place needs
+            # -- those indexing too
+            if item.childCount():
+                self._index_rows(self.indexFromItem(item), 0, item.childCount() - 1)
+
+    def _unindex_rows(self, parent: QtCore.QModelIndex, first: int, last: int) -> None:
+        """
+        Removes the items (and their children) which are about to be removed
+        from the identifier index
+        """
+        parent_item = (
+            self.itemFromIndex(parent) if parent.isValid() else self.invisibleRootItem()
+        )
+
+        for row in range(first, last + 1):
+            item = parent_item.child(row)
+
+            try:
+                identifier = item.asset().identifier()
+
+            except AttributeError:
+                continue
+
+            # -- Other items may represent the same asset, in which case
+            # -- only this item is removed from the index
+            node = self._paths.find(identifier)
+            items = [
+                indexed
+                for indexed in self._items.get(node, [])
+                if indexed is not item
+            ]
+
+            if items:
+                self._items[node] = items
+
+            else:
+                self._items.pop(node, None)
+
+            if item.childCount():
+                self._unindex_rows(self.indexFromItem(item), 0, item.childCount() - 1)
+
+    def visible_items(self, margin: int = 0) -> list["AssetItem"]:
+        """
+        Returns the items which are currently shown within the viewport, along
+        with the given amount of rows either side of it.
+
+        Args:
+            margin: The amount of additional rows above and below the viewport
+                to include
+
+        Returns:
+            List of AssetItems in the order they are drawn
+        """
+        viewport: QtCore.QRect = self.viewport().rect()
+        item = self.itemAt(viewport.topLeft())
+
+        if not item:
+            return []
+
+        # -- Step back up by our margin
+        for _ in range(margin):
+            above = self.itemAbove(item)
+
+            if not above:
+                break
+
+            item = above
+
+        # -- Now walk down until we have passed the bottom of the viewport
+        # -- by the margin
+        items = []
+        rows_beyond = 0
+
+        while item:
+            if self.visualItemRect(item).top() > viewport.bottom():
+                rows_beyond += 1
+
+                if rows_beyond > margin:
+                    break
+
+            items.append(item)
+            item = self.itemBelow(item)
+
+        return items
+
+    def is_item_visible(self, item: "AssetItem") -> bool:
+        """
+        Returns True if the given item is within the viewport. Views which
+        present their items through another widget should override this
+        along with visible_items.
+        """
+        return self.visualItemRect(item).intersects(self.viewport().rect())
+
+    def schedule_visibility_update(self, *args, **kwargs) -> None:
+        """
+        Requests a visibility update. The update is deferred slightly so that
+        many requests in quick succession only result in a single update.
+        """
+        self._visibility_timer.start()
+
+    def update_visibility(self) -> None:
+        """
+        Resolves which items are on (or near) the screen, ensures their data is
+        loaded and publishes them to the task pool so that fetches for these
+        items are processed first. Fetches for items which have moved away from
+        the viewport are cancelled.
+        """
+        nearby_items = self.visible_items(margin=self.PREFETCH_MARGIN)
+
+        visible_items = []
+        visible = set()
+        prefetch = set()
+
+        for item in nearby_items:
+            identifier = item.asset().identifier()
+
+            if self.is_item_visible(item):
+                visible_items.append(item)
+                visible.add(identifier)
+
+        for item in nearby_items:
+            identifier = item.asset().identifier()
+
+            if identifier not in visible:
+                prefetch.add(identifier)
+
+        # -- Publish the focus before we load the data, that way any
+        # -- fetches the traits submit are given the correct priority
+        cancelled = tasks.TaskPool.shared().focus(visible, prefetch)
+
+        # -- Any item coming back into focus whose fetches were cancelled
+        # -- never received its data, so it must be read again
+        for item in nearby_items:
+            identifier = item.asset().identifier()
+
+            if identifier in self._cancelled:
+                item.unload_data()
+
+            item.load_data()
+
+        self._cancelled.difference_update(visible, prefetch)
+        self._cancelled.update(cancelled)
+
+        self.visibleItemsChanged.emit(visible_items)
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        """
+        Resizing can bring more items into view, so we update the visibility
+        """
+        super(View, self).resizeEvent(event)
+        self.schedule_visibility_update()
+
     def _click_propagation(self, item: "AssetItem") -> None:
         """
         When the user clicks something, propagate any signalling upward
@@ -77,7 +341,8 @@ class View(QtWidgets.QTreeWidget):
     # TODO: Add typing
     def mousePressEvent(self, event) -> None:
         """
-        When an item is clicked we build the context menu for the current item
+        When an item is clicked we build the context menu for the current item.
+        Any action picked from the menu is run on all the selected items.
         """
         super(View, self).mousePressEvent(event)
 
@@ -86,7 +351,10 @@ class View(QtWidgets.QTreeWidget):
             if not self.currentItem():
                 return
 
-            menu = self.currentItem().context_menu(parent=self)
+            menu = self.currentItem().context_menu(
+                parent=self,
+                selection=self.selectedItems(),
+            )
             menu.popup(QtGui.QCursor().pos())
 
     @property
@@ -103,15 +371,153 @@ class ViewFactory(factories.Factory):
     The trait library is a factory holding a reference to all the available traits.
     Note that this should be treated as a singleton in most situations for the
     purpose of performance.
+
+    Unlike a standard factory, adding a path does not import the views within
+    it. Instead the files are read to find the identifiers of the views they
+    declare, and a file is only imported once one of its views is requested.
     """
 
     # -- Private variable for holding the active instance
     _INSTANCE: "ViewFactory" = None
 
     def __init__(self, search_paths=None, exclude_builtin=False):
+        # -- The files declaring each view which has not been imported yet,
+        # -- along with the mechanism to import them with. These must exist
+        # -- before the parent class adds any paths
+        self._manifest: dict[str, list[tuple[str, int]]] = dict()
+        self._loaded_files: set[str] = set()
+
         # -- Initialise the parent class
         super(ViewFactory, self).__init__(
             abstract=View,
             paths=search_paths or list(),
             plugin_identifier="identifier",
         )
+
+    def add_path(self, path, mechanism=0):
+        """
+        Registers the path, reading the views it declares without importing
+        them. Files which cannot be read are imported immediately.
+        """
+        if not path:
+            return 0
+
+        self._add_pathed_paths[path] = mechanism
+        self.paths_changed.emit()
+
+        declared, unresolved = manifest.scan_path(
+            path,
+            self._PY_CHECK,
+            self._regex_filter,
+            attribute="identifier",
+        )
+
+        for identifier, filepaths in declared.items():
+            self._manifest.setdefault(identifier, []).extend(
+                (filepath, mechanism)
+                for filepath in filepaths
+                if filepath not in self._loaded_files
+            )
+
+        loaded = [self._load_file(filepath, mechanism) for filepath in unresolved]
+
+        if declared or any(loaded):
+            self.plugins_changed.emit()
+
+        return len(declared) + sum(loaded)
+
+    def identifiers(self, include_disabled=False):
+        """
+        Returns the identifiers of all the views, including those which have
+        not been imported yet
+        """
+        identifiers = super(ViewFactory, self).identifiers(include_disabled)
+
+        for identifier in self._manifest:
+            if include_disabled or not self.is_disabled(identifier):
+                identifiers.add(identifier)
+
+        return identifiers
+
+    def request(self, plugin_identifier, version=None):
+        """
+        Returns the view with the given identifier, importing the files which
+        declare it if they have not been imported yet
+        """
+        for filepath, mechanism in self._manifest.pop(plugin_identifier, []):
+            self._load_file(filepath, mechanism)
+
+        return super(ViewFactory, self).request(plugin_identifier, version)
+
+    def clear(self):
+        self._manifest = dict()
+        self._loaded_files = set()
+
+        super(ViewFactory, self).clear()
+
+    def remove_path(self, path):
+        # -- Removing a path re-adds all the others, so we start afresh
+        self._manifest = dict()
+        self._loaded_files = set()
+
+        super(ViewFactory, self).remove_path(path)
+
+    # noinspection PyBroadException
+    def _load_file(self, filepath: str, mechanism: int) -> int:
+        """
+        Imports the file and registers the views within it, in the same way
+        factories.Factory.add_path does
+
+        Returns:
+            The amount of views which were registered
+        """
+        if filepath in self._loaded_files:
+            return 0
+
+        self._loaded_files.add(filepath)
+
+        module = None
+
+        if mechanism in (self.IMPORTABLE, self.GUESS):
+            module = self._mechanism_import(filepath)
+
+            # -- The plugin name may clash with a module name, in which
+            # -- case we fall back to loading it directly
+            if module and module.__file__ != filepath:
+                module = None
+
+        if not module and mechanism in (self.LOAD_SOURCE, self.GUESS):
+            module = self._mechanism_load(filepath)
+
+        if not module:
+            self._log(f"Could not import or load : {filepath}", is_warning=True)
+            return 0
+
+        count = 0
+
+        try:
+            for item_name in dir(module):
+                item = getattr(module, item_name)
+
+                if (
+                    inspect.isclass(item)
+                    and item is not self._abstract
+                    and issubclass(item, self._abstract)
+                    and item not in self._plugins
+                ):
+                    self._plugins.append(item)
+                    count += 1
+
+        except BaseException:
+            self._log(str(sys.exc_info()), is_warning=True)
+
+        # -- Anything else this file declared is now loaded too
+        for identifier in list(self._manifest):
+            self._manifest[identifier] = [
+                entry for entry in self._manifest[identifier] if entry[0] != filepath
+            ]
+
+            if not self._manifest[identifier]:
+                del self._manifest[identifier]
+
+        return count
@@ -8,10 +8,10 @@
 # Author		-> Michael Malinowski (Studio Gobo)
 # ----------------------------------------------------------------------------
 import asset_composition
-from Qt import QtCore, QtWidgets
+from Qt import QtCore, QtGui, QtWidgets
 
-from .. import config, icons
-from . import preferences, view_panel
+from .. import atlas, config, costs, icons, profiling
+from . import diagnostics, preferences, view_panel
 
 
 # noinspection PyUnresolvedReferences
@@ -35,25 +35,53 @@ class Explorer(QtWidgets.QWidget):
         self._config: config.Configuration = configuration
         self._compositor = asset_composition.Compositor(self._config)
 
+        # -- Instrument the compositor and traits, if we have been asked
+        # -- to measure them
+        costs.TraitLedger.shared().configure(
+            budget=self._config.get_setting("trait_budget"),
+            mode=self._config.get_setting("slow_traits"),
+        )
+        self.instrument()
+
         # -- Define the base layout of the widget
         self.setLayout(QtWidgets.QVBoxLayout())
 
         # -- Add in the tab widget
         self.tab_widget: QtWidgets.QTabWidget = QtWidgets.QTabWidget(parent=self)
 
-        # -- Build the view panel and the preferences widgets
+        # -- Build the view panel and the diagnostics widgets. Most sessions
+        # -- never open the preferences (which loads a ui file and builds an
+        # -- editor for each factory), so its tab only holds a placeholder
+        # -- until it is first shown
         self.view_panel = view_panel.ViewPanel(app=self)
-        self.preferences = preferences.PreferencesWidget(app=self)
+        self.diagnostics = diagnostics.DiagnosticsWidget(app=self)
+
+        self._preferences: preferences.PreferencesWidget | None = None
+        self._preferences_tab: QtWidgets.QWidget = QtWidgets.QWidget()
+        self._preferences_tab.setLayout(QtWidgets.QVBoxLayout())
+        self._preferences_tab.layout().setContentsMargins(0, 0, 0, 0)
 
         # -- Add the widgets to their respective tabs
         self.tab_widget.addTab(self.view_panel, "Explorer")
-        self.tab_widget.addTab(self.preferences, "Preferences")
+        self.tab_widget.addTab(self._preferences_tab, "Preferences")
+        self.tab_widget.addTab(self.diagnostics, "Diagnostics")
 
         # -- Add the tab widget to the layout
         self.layout().addWidget(self.tab_widget)
 
         # -- Hook up any signals and slots
-        self.view_panel.viewChanged.connect(self.preferences.serialise_changes)
+        self.tab_widget.currentChanged.connect(self._tab_changed)
+        self.view_panel.viewChanged.connect(self.serialise_changes)
+        self._config.traits.plugins_changed.connect(self.instrument)
+        self._config.traits.plugins_changed.connect(self._plugins_changed)
+        self._config.discovery.plugins_changed.connect(self._plugins_changed)
+        self._config.views.plugins_changed.connect(self._plugins_changed)
+
+        # -- The ratio of the screen we were last shown on. Our window
+        # -- only exists once we're shown, so we track screen changes
+        # -- from then
+        self._device_pixel_ratio: float | None = None
+        self._tracked_window: QtGui.QWindow | None = None
 
     @property
     def config(self) -> config.Configuration:
@@ -67,6 +95,119 @@ class Explorer(QtWidgets.QWidget):
     def compositor(self) -> asset_composition.Compositor:
         return self._compositor
 
+    @property
+    def preferences(self) -> preferences.PreferencesWidget:
+        """
+        The preferences widget is built the first time it is needed, which
+        is usually when its tab is first shown
+        """
+        if self._preferences is None:
+            self._preferences = preferences.PreferencesWidget(app=self)
+            self._preferences_tab.layout().addWidget(self._preferences)
+
+        return self._preferences
+
+    def serialise_changes(self, *args, **kwargs) -> None:
+        """
+        Writes the users preferences to the configuration. If the preferences
+        have never been shown then the configuration already holds all of
+        them, bar the active view.
+        """
+        if self._preferences is not None:
+            self._preferences.serialise_changes()
+            return
+
+        self._config.set_setting(
+            "active_view",
+            self.view_panel.active_view.identifier,
+        )
+        self._config.serialise()
+
+    def refresh(self) -> None:
+        """
+        Re-populates the view list (as the factories may have changed) and
+        redraws the current view
+        """
+        # -- Get the current view, then re-populate the view
+        # -- list. Then switch the view - which will cause it to redraw
+        current_view = self.view_panel.active_view.identifier
+        self.view_panel.populate_view_selector()
+
+        self.view_panel.switch_view(current_view)
+
+        # -- As we may have changed traits, clear the
+        # -- cache on the compositor too
+        self._compositor.get.cache_clear()
+
+    def instrument(self, *args, **kwargs) -> None:
+        """
+        Instruments the compositor and traits so that their calls are timed.
+        This only happens once profiling has been enabled or slow traits are
+        being deferred or cached, so an explorer which is measuring nothing
+        calls its traits directly. Anything already instrumented is left as
+        it is, so this can be called whenever traits are added.
+        """
+        if not profiling.is_enabled() and costs.TraitLedger.shared().mode == costs.FLAG:
+            return
+
+        profiling.instrument_compositor(self._compositor)
+        costs.instrument_traits(self._config.traits)
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        """
+        Once shown we have a window, so we start watching for it moving
+        between screens
+        """
+        super(Explorer, self).showEvent(event)
+
+        window: QtGui.QWindow = self.window().windowHandle()
+
+        if window and window is not self._tracked_window:
+            self._tracked_window = window
+            window.screenChanged.connect(self._screen_changed)
+
+        self._screen_changed()
+
+    def _screen_changed(self, *args, **kwargs) -> None:
+        """
+        Icons are generated at the resolution of the screen, so if we have
+        moved to a screen with a different pixel ratio we discard the icons
+        generated for the previous one and redraw
+        """
+        device_pixel_ratio: float = self.devicePixelRatioF()
+
+        if device_pixel_ratio == self._device_pixel_ratio:
+            return
+
+        changed = self._device_pixel_ratio is not None
+        self._device_pixel_ratio = device_pixel_ratio
+
+        if not changed:
+            return
+
+        icons.clear_caches()
+        atlas.clear()
+
+        # -- Views may present their items through other item views (such
+        # -- as the thumbnail view), so redraw all of them
+        for item_view in self.findChildren(QtWidgets.QAbstractItemView):
+            item_view.viewport().update()
+
+    def _tab_changed(self, index: int) -> None:
+        """
+        Builds the preferences the first time their tab is shown
+        """
+        if self.tab_widget.widget(index) is self._preferences_tab:
+            _ = self.preferences
+
+    def _plugins_changed(self, *args, **kwargs) -> None:
+        """
+        Triggered whenever the plugins within any of the factories change,
+        ensuring the change is stored and reflected in the views
+        """
+        self.serialise_changes()
+        self.refresh()
+
 
 # noinspection PyUnresolvedReferences
 class AppWindow(QtWidgets.QMainWindow):
@@ -0,0 +1,175 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> diagnostics.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+This module stores the widget which shows the timings recorded by the
+profiling module, allowing users to see which traits or plugins are
+slowing the explorer down.
+"""
+import qtility
+from Qt import QtCore, QtGui, QtWidgets
+
+from .. import profiling
+
+
+# noinspection PyUnresolvedReferences,PyPep8Naming
+class DiagnosticsWidget(QtWidgets.QWidget):
+    """
+    Shows live counters for every instrumented call along with the slowest
+    individual calls. Whilst shown, the widget refreshes itself periodically.
+    """
+
+    # -- How often (in milliseconds) we refresh whilst visible
+    REFRESH_INTERVAL: int = 1000
+
+    def __init__(self, app: "asset_explorer.Explorer", parent=None):
+        super(DiagnosticsWidget, self).__init__(parent=parent)
+
+        self.app: "asset_explorer.Explorer" = app
+
+        # -- Set our basic layout
+        self.setLayout(QtWidgets.QVBoxLayout(self))
+
+        # -- Create the controls
+        controls_layout = QtWidgets.QHBoxLayout()
+
+        self.enabled_checkbox = QtWidgets.QCheckBox("Record Timings")
+        self.enabled_checkbox.setChecked(profiling.is_enabled())
+        self.reset_button = QtWidgets.QPushButton("Reset")
+        self.export_button = QtWidgets.QPushButton("Export Chrome Trace")
+
+        controls_layout.addWidget(self.enabled_checkbox)
+        controls_layout.addStretch()
+        controls_layout.addWidget(self.reset_button)
+        controls_layout.addWidget(self.export_button)
+        self.layout().addLayout(controls_layout)
+
+        # -- The counters, one row per call and owner
+        self.layout().addWidget(QtWidgets.QLabel("Calls"))
+        self.counters = QtWidgets.QTreeWidget()
+        self.counters.setHeaderLabels(
+            ["Call", "Owner", "Calls", "Total (ms)", "Mean (ms)", "Max (ms)"],
+        )
+        self.counters.setRootIsDecorated(False)
+        self.counters.setSortingEnabled(True)
+        self.layout().addWidget(self.counters)
+
+        # -- The slowest individual calls
+        self.layout().addWidget(QtWidgets.QLabel("Slowest Calls"))
+        self.slowest = QtWidgets.QTreeWidget()
+        self.slowest.setHeaderLabels(["Call", "Owner", "Duration (ms)", "At (s)"])
+        self.slowest.setRootIsDecorated(False)
+        self.layout().addWidget(self.slowest)
+
+        self._timer: QtCore.QTimer = QtCore.QTimer(self)
+        self._timer.setInterval(self.REFRESH_INTERVAL)
+        self._timer.timeout.connect(self.populate)
+
+        # -- Hook up the signals and slots
+        self.enabled_checkbox.toggled.connect(self.set_enabled)
+        self.reset_button.clicked.connect(self.reset)
+        self.export_button.clicked.connect(self.export)
+
+    def populate(self) -> None:
+        """
+        Reads the current timings from the profiler
+        """
+        # -- Sorting whilst inserting is slow and moves rows around
+        # -- under us, so suspend it whilst we populate
+        self.counters.setSortingEnabled(False)
+        self.counters.clear()
+
+        for stat in profiling.stats():
+            item = _NumericItem(
+                [
+                    stat.name,
+                    stat.owner,
+                    str(stat.calls),
+                    f"{stat.total * 1000:.2f}",
+                    f"{stat.mean * 1000:.3f}",
+                    f"{stat.max * 1000:.2f}",
+                ],
+            )
+            self.counters.addTopLevelItem(item)
+
+        self.counters.setSortingEnabled(True)
+
+        self.slowest.clear()
+
+        for call in profiling.slowest():
+            self.slowest.addTopLevelItem(
+                QtWidgets.QTreeWidgetItem(
+                    [
+                        call["name"],
+                        call["owner"],
+                        f"{call['duration'] * 1000:.2f}",
+                        f"{call['start']:.2f}",
+                    ],
+                ),
+            )
+
+    def set_enabled(self, enabled: bool) -> None:
+        """
+        Starts or stops the recording of timings
+        """
+        if enabled:
+            profiling.enable()
+            self.app.instrument()
+
+        else:
+            profiling.disable()
+
+    def reset(self) -> None:
+        """
+        Discards all the recorded timings
+        """
+        profiling.reset()
+        self.populate()
+
+    def export(self) -> None:
+        """
+        Asks the user where to save the trace, then writes it
+        """
+        filepath = qtility.request.filepath(
+            title="Export Chrome Trace",
+            save=True,
+            filter_="Chrome Trace (*.json)",
+            parent=self,
+        )
+
+        if not filepath:
+            return
+
+        profiling.export_chrome_trace(filepath)
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        """
+        Whilst shown we keep the counters live
+        """
+        self.enabled_checkbox.setChecked(profiling.is_enabled())
+        self.populate()
+        self._timer.start()
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:
+        self._timer.stop()
+
+
+class _NumericItem(QtWidgets.QTreeWidgetItem):
+    """
+    Tree item which sorts its numeric columns by value rather than as text
+    """
+
+    def __lt__(self, other: QtWidgets.QTreeWidgetItem) -> bool:
+        column = self.treeWidget().sortColumn() if self.treeWidget() else 0
+
+        try:
+            return float(self.text(column)) < float(other.text(column))
+
+        except ValueError:
+            return self.text(column) < other.text(column)
@@ -7,12 +7,94 @@
 # Created		-> March 2025
 # Author		-> Michael Malinowski (Studio Gobo)
 # ----------------------------------------------------------------------------
+import functools
 import weakref
 
 import asset_composition
 from Qt import QtCore, QtWidgets
 
-from .. import constants, icons
+from .. import batch, constants, costs, icons, profiling
+
+# -- Gathering the actions of an asset means asking every trait, so we keep
+# -- them (grouped by category and sorted) for each asset. Each entry holds
+# -- the key it was built against - the state version of the asset and the
+# -- revision of the configuration - so it is rebuilt when either changes
+_ACTIONS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# -- The state version of each asset, which is incremented whenever the
+# -- asset tells us its status or children have changed
+_VERSIONS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _bump_version(asset: asset_composition.Asset) -> None:
+    """
+    Marks the state of the asset as changed, so its actions are gathered
+    again the next time they're needed
+    """
+    try:
+        _VERSIONS[asset] = _VERSIONS.get(asset, 0) + 1
+
+    except TypeError:
+        # -- Assets which cannot be weakly referenced are never cached
+        pass
+
+
+def _populate_menu(
+    menu: QtWidgets.QMenu,
+    actions: list,
+    selection: list["AssetItem"] | None = None,
+    parent: QtWidgets.QWidget = None,
+) -> None:
+    """
+    Adds a QAction to the menu for each of the given trait actions. This
+    is called when a category menu is about to be shown, so menus which are
+    never opened never create their actions. If a selection of more than
+    one item is given then the actions are run on every item within it,
+    showing their progress over the given parent.
+    """
+    if not menu.isEmpty():
+        return
+
+    for action in actions:
+
+        # -- Build the action item
+        menu_action: QtWidgets.QAction = QtWidgets.QAction(
+            icons.build_icon(action.icon()),
+            action.name(),
+            menu,
+        )
+
+        # -- Connect the menu action signal/slot
+        if selection and len(selection) > 1:
+            menu_action.triggered.connect(
+                functools.partial(
+                    _run_on_selection,
+                    selection,
+                    action.category(),
+                    action.name(),
+                    parent,
+                ),
+            )
+
+        else:
+            menu_action.triggered.connect(action.function)
+
+        # -- Finally add the action to the menu
+        menu.addAction(menu_action)
+
+
+def _run_on_selection(
+    selection: list["AssetItem"],
+    category: str,
+    name: str,
+    parent: QtWidgets.QWidget,
+    *args,
+) -> None:
+    """
+    Runs the action on every item in the selection. Any arguments given by
+    the triggering signal are ignored.
+    """
+    batch.run_action(selection, category, name, parent=parent)
 
 
 # noinspection PyUnresolvedReferences
@@ -23,6 +105,11 @@ class AssetItem(QtWidgets.QTreeWidgetItem):
     passed to the delegate.
     """
 
+    # -- Views can hold hundreds of thousands of items, so rather than each
+    # -- item carrying its own attribute dictionary the state of an item is
+    # -- held within fixed slots
+    __slots__ = ("_app", "_asset", "_data_loaded")
+
     def __init__(
         self,
         asset: asset_composition.Asset,
@@ -36,12 +123,24 @@ class AssetItem(QtWidgets.QTreeWidgetItem):
         self._app: "asset_explorer.Explorer" = app
         self._asset: asset_composition.Asset = asset
 
+        # -- The icon, status and custom data can be expensive to resolve, so
+        # -- we only request them once the item is close to being on screen
+        self._data_loaded: bool = False
+
+        # -- If slow traits are being quarantined then the ledger has to hear
+        # -- about changes to the asset before we do, so that it forgets any
+        # -- results it remembered before we read them again
+        ledger = costs.TraitLedger.shared()
+
+        if ledger.mode != costs.FLAG:
+            ledger.watch(self._asset)
+
         # -- Store a reference to the panel on the asset, and connect the
         # -- asset changed events
         self._asset.app = self._app
-        self._asset.status_changed.connect(self.update_data)
+        self._asset.status_changed.connect(self._status_changed)
         self._asset.changed.connect(
-            self.populate_children,
+            self._children_changed,
         )
 
         # -- Finally we trigger a data update which scrapes the
@@ -57,33 +156,86 @@ class AssetItem(QtWidgets.QTreeWidgetItem):
         """
         return self._app
 
+    def _status_changed(self, *args, **kwargs) -> None:
+        """
+        Called when the asset tells us its status has changed
+        """
+        _bump_version(self._asset)
+        self.update_data()
+
+    def _children_changed(self, *args, **kwargs) -> None:
+        """
+        Called when the asset tells us its children have changed
+        """
+        _bump_version(self._asset)
+        self.populate_children()
+
+    @profiling.timed("AssetItem.update_data")
     def update_data(self, *args, **kwargs) -> None:
         """
         This will read the asset state and store the required data in the data
         roles - which allow the delegate to access important information.
+
+        Only the label is read immediately. The remaining data is read once the
+        view has asked for it through load_data.
         """
+        # -- The text of an item is its display role, so this is the only
+        # -- string each item stores
         try:
-            self.setText(0, f"{self._asset.label()} :: " + str(self._asset))
+            self.setData(
+                0,
+                QtCore.Qt.DisplayRole,
+                self._asset.label(),
+            )
 
         except RuntimeError:
             return
 
-        self.setData(
-            0,
-            QtCore.Qt.DecorationRole,
-            self._asset.icon(),
-        )
+        # -- If the view has already shown this item then we need to
+        # -- refresh the remaining data too
+        if self._data_loaded:
+            self._read_data()
 
-        self.setData(
-            0,
-            QtCore.Qt.DisplayRole,
-            self._asset.label(),
-        )
+    def load_data(self) -> None:
+        """
+        This is called by the view when the item is on (or near) the screen
+        and reads the data which is expensive to resolve. Subsequent calls
+        do nothing, as update_data will keep the data current from then on.
+        """
+        if self._data_loaded:
+            return
+
+        self._data_loaded = True
+        self._read_data()
+
+    def unload_data(self) -> None:
+        """
+        This is called by the view when fetches for the data of this item have
+        been cancelled before they delivered. The data is then read again the
+        next time load_data is called.
+        """
+        self._data_loaded = False
+
+    def _read_data(self) -> None:
+        """
+        Reads the icon, status icons and custom data from the asset into
+        their data roles
+        """
+        try:
+            self.setData(
+                0,
+                QtCore.Qt.DecorationRole,
+                self._asset.icon(),
+            )
+
+        except RuntimeError:
+            return
 
         self.setData(0, constants.STATUS_ICONS_ROLE, self._asset.status_icons())
 
         self.setData(0, constants.DATA_ROLE, self._asset.custom_data())
 
+    @profiling.timed("AssetItem.populate_children")
     def populate_children(
         self,
         regenerate: bool = False,
@@ -99,7 +251,7 @@ class AssetItem(QtWidgets.QTreeWidgetItem):
         #     return
 
         # -- Clear current children before we repopulate it. But wrap it
-        # -- in a try in case we have a threaded callback.
+        # -- in a try in case the view has already deleted this item
         try:
             while self.childCount():
                 self.removeChild(self.child(0))
@@ -140,13 +292,60 @@ class AssetItem(QtWidgets.QTreeWidgetItem):
         """
         return self._asset
 
-    def context_menu(self, parent: QtWidgets.QWidget = None) -> QtWidgets.QMenu:
+    def actions_by_category(self) -> dict[str, list]:
+        """
+        Returns the actions of the asset grouped by their category, with
+        each category sorted by the action names. This is cached against the
+        state of the asset and the configuration, so repeatedly asking for
+        the actions of an asset which has not changed does not ask the
+        traits again.
+
+        Returns:
+            Dictionary of category names to lists of trait actions
+        """
+        try:
+            key = (_VERSIONS.get(self._asset, 0), self._app.config.revision)
+            cached = _ACTIONS.get(self._asset)
+
+        except TypeError:
+            # -- Assets which cannot be weakly referenced are never cached
+            key, cached = None, None
+
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        # -- Group all the actions by their given categories
+        actions_by_category = {}
+
+        for action in self._asset.actions():
+            if not action.category() in actions_by_category:
+                actions_by_category[action.category()] = []
+            actions_by_category[action.category()].append(action)
+
+        for category, actions in actions_by_category.items():
+            actions.sort(key=lambda action: action.name())
+
+        if key is not None:
+            _ACTIONS[self._asset] = (key, actions_by_category)
+
+        return actions_by_category
+
+    def context_menu(
+        self,
+        parent: QtWidgets.QWidget = None,
+        selection: list["AssetItem"] | None = None,
+    ) -> QtWidgets.QMenu:
         """
         This will generate the qmenu for this item based on all the actions
-        defined in traits for the asset.
+        defined in traits for the asset. When there is more than one category
+        each named category is given its own sub menu, whose actions are only
+        created when the sub menu is first shown. Actions without a category
+        are placed directly within the menu, above the sub menus.
 
         Args:
             parent: The parent widget for the menu
+            selection: The selected items. If this holds more than one item
+                then the chosen action is run on all of them
 
         Returns:
             The QMenu
@@ -154,40 +353,44 @@ class AssetItem(QtWidgets.QTreeWidgetItem):
         # -- Create a new menu
         menu: QtWidgets.QMenu = QtWidgets.QMenu(parent)
 
-        # -- Before populating the menu, group all the actions by their
-        # -- given categories
-        menus_by_category = {}
+        actions_by_category = self.actions_by_category()
 
-        for action in self._asset.actions():
-            if not action.category() in menus_by_category:
-                menus_by_category[action.category()] = []
-            menus_by_category[action.category()].append(action)
-
-        # -- Now our data is constructed per category we can start to
-        # -- add them to the menu
-        for category in sorted(menus_by_category):
-
-            # -- Always split the categories by a separator
+        # -- A single category is shown directly within the menu
+        if len(actions_by_category) == 1:
+            _populate_menu(
+                menu,
+                next(iter(actions_by_category.values())),
+                selection,
+                parent,
+            )
+            return menu
+
+        # -- Actions without a category sit at the top of the menu, as an
+        # -- untitled sub menu would be meaningless
+        uncategorised = [
+            action
+            for category, actions in actions_by_category.items()
+            if not category
+            for action in actions
+        ]
+
+        if uncategorised:
+            _populate_menu(menu, uncategorised, selection, parent)
             menu.addSeparator()
 
-            sorted_actions: list = sorted(
-                menus_by_category[category], key=lambda action: action.name()
+        # -- Each named category gets a sub menu which is only populated
+        # -- once it is about to be shown
+        for category in sorted(category for category in actions_by_category if category):
+            category_menu: QtWidgets.QMenu = menu.addMenu(category)
+
+            category_menu.aboutToShow.connect(
+                functools.partial(
+                    _populate_menu,
+                    category_menu,
+                    actions_by_category[category],
+                    selection,
+                    parent,
+                ),
             )
 
-            # -- Now add each item
-            for action in sorted_actions:
-
-                # -- Build the action item
-                menu_action: QtWidgets.QAction = QtWidgets.QAction(
-                    icons.build_icon(action.icon()),
-                    action.name(),
-                    menu,
-                )
-
-                # -- Connect the menu action signal/slot
-                menu_action.triggered.connect(action.function)
-
-                # -- Finally add the action to the menu
-                menu.addAction(menu_action)
-
         return menu
@@ -15,7 +15,7 @@ import qfactory
 import qtility
 from Qt import QtCore, QtGui, QtWidgets
 
-from .. import resources
+from .. import costs, resources
 
 
 class PreferencesWidget(QtWidgets.QWidget):
@@ -35,9 +35,7 @@ class PreferencesWidget(QtWidgets.QWidget):
         self.setLayout(QtWidgets.QVBoxLayout(self))
 
         # -- Load in our ui file
-        self.ui = qtility.designer.load(
-            resources.get("preferences.ui"),
-        )
+        self.ui = resources.load_ui("preferences.ui")
         self.layout().addWidget(self.ui)
 
         self.filters_editor = FilterOptionsWidget(app=self.app)
@@ -51,28 +49,87 @@ class PreferencesWidget(QtWidgets.QWidget):
         self.discovery_editor = qfactory.FactoryWidget(self.app.config.discovery)
         self.view_editor = qfactory.FactoryWidget(self.app.config.views)
 
+        # -- The budget editor sits beneath the trait editor, as the
+        # -- traits it flags are shown there
+        self.budget_editor = TraitBudgetWidget(app=self.app)
+
         # -- Add them to their corresponding layouts
         self.ui.traits_layout.insertWidget(0, self.trait_editor)
+        self.ui.traits_layout.insertWidget(1, self.budget_editor)
         self.ui.searches_layout.insertWidget(0, self.discovery_editor)
         self.ui.views_layout.insertWidget(0, self.view_editor)
 
         # -- Populate our static values
         self.populate()
 
-        # -- Hook up the signals and slots
-        self.app.config.traits.plugins_changed.connect(self.reflect_change)
-        self.app.config.discovery.plugins_changed.connect(self.reflect_change)
-        self.app.config.views.plugins_changed.connect(self.reflect_change)
+        # -- Hook up the signals and slots. Changes to the factories are
+        # -- picked up by the explorer itself, as they can be made before
+        # -- the preferences are ever built
         self.ui.item_size.valueChanged.connect(self.reflect_change)
         self.ui.auto_sort.stateChanged.connect(self.reflect_change)
         self.filters_editor.changed.connect(self.reflect_change)
         self.search_editor.changed.connect(self.reflect_change)
+        self.budget_editor.changed.connect(self.serialise_changes)
+        self.app.config.traits.plugins_changed.connect(self.flag_slow_traits)
 
     def populate(self) -> None:
         self.ui.item_size.setValue(
             self.app.config.get_setting("item_size"),
         )
         self.ui.auto_sort.setChecked(self.app.config.get_setting("auto_sort"))
+        self.budget_editor.populate()
+
+    def flag_slow_traits(self, *args, **kwargs) -> None:
+        """
+        Marks any trait which has been going over the per-call budget
+        within the trait editor, along with its cost
+        """
+        ledger = costs.TraitLedger.shared()
+        factory = self.app.config.traits
+
+        for plugin_editor in self.trait_editor.findChildren(qfactory.core.PluginEditor):
+            plugin_list = plugin_editor.plugin_list
+
+            for idx in range(plugin_list.count()):
+                item = plugin_list.item(idx)
+
+                # -- Keep hold of the label the editor gave the item, so
+                # -- that repeated flagging does not keep appending to it
+                label = item.data(QtCore.Qt.UserRole)
+
+                if label is None:
+                    label = item.text()
+                    item.setData(QtCore.Qt.UserRole, label)
+
+                # -- The editor lists the factory identifiers, whilst costs
+                # -- are recorded against the class name
+                trait = factory.request(item.identifier)
+                cost = ledger.cost(trait.__name__) if trait else None
+
+                if not cost or not ledger.is_slow(cost.name):
+                    item.setText(label)
+                    item.setData(QtCore.Qt.ForegroundRole, None)
+                    item.setToolTip("")
+                    continue
+
+                item.setText(f"{label} (Slow: {cost.mean * 1000:.1f}ms)")
+                item.setForeground(QtGui.QColor(230, 120, 60))
+                item.setToolTip(
+                    f"{cost.name} has taken longer than the budget of "
+                    f"{ledger.budget:g}ms on {cost.over_budget} of its "
+                    f"{cost.calls} calls (slowest {cost.max * 1000:.1f}ms).\n\n"
+                    + "\n".join(
+                        f"{method_name}: {total * 1000:.1f}ms total"
+                        for method_name, total in sorted(cost.methods.items())
+                    ),
+                )
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        """
+        The costs are recorded continually, so refresh the flags whenever
+        the preferences are shown
+        """
+        self.flag_slow_traits()
 
     def reflect_change(self) -> None:
 
@@ -80,17 +137,8 @@ class PreferencesWidget(QtWidgets.QWidget):
         # -- that way any changes we make in the config will be reflected
         self.serialise_changes()
 
-        # -- Get the current view, then re-populate the view
-        # -- list (as the factories may have changed). Then
-        # -- switch the view - which will cause it to redraw
-        current_view = self.app.view_panel.active_view.identifier
-        self.app.view_panel.populate_view_selector()
-
-        self.app.view_panel.switch_view(current_view)
-
-        # -- As we may have changed traits, clear the
-        # -- cache on the compositor too
-        self.app.compositor.get.cache_clear()
+        # -- Then have the explorer redraw with the new settings
+        self.app.refresh()
 
     def serialise_changes(self) -> None:
 
@@ -114,6 +162,22 @@ class PreferencesWidget(QtWidgets.QWidget):
             self.ui.auto_sort.isChecked(),
         )
 
+        self.app.config.set_setting(
+            "trait_budget",
+            self.budget_editor.budget(),
+        )
+
+        self.app.config.set_setting(
+            "slow_traits",
+            self.budget_editor.mode(),
+        )
+
+        costs.TraitLedger.shared().configure(
+            budget=self.budget_editor.budget(),
+            mode=self.budget_editor.mode(),
+        )
+        self.app.instrument()
+
         self.app.config.set_setting(
             "active_view",
             self.app.view_panel.active_view.identifier,
@@ -125,6 +189,79 @@ class PreferencesWidget(QtWidgets.QWidget):
         self.app.config.serialise()
 
 
+# noinspection PyUnresolvedReferences,PyPep8Naming
+class TraitBudgetWidget(QtWidgets.QWidget):
+    """
+    This allows the user to set how long a single trait call may take before
+    the trait is considered slow, and what should happen to slow traits
+    """
+
+    # -- This signal will be emitted whenever the value of this
+    # -- widget changes
+    changed = QtCore.Signal()
+
+    # -- The labels shown for each of the ways slow traits can be handled
+    MODE_LABELS: dict[str, str] = {
+        costs.FLAG: "Flag Only",
+        costs.DEFER: "Defer To Background",
+        costs.CACHE: "Serve From Cache",
+    }
+
+    def __init__(self, app: "asset_explorer.Explorer", parent=None):
+        super(TraitBudgetWidget, self).__init__(parent=parent)
+
+        self.app: "asset_explorer.Explorer" = app
+
+        # -- Build our base layout
+        self.setLayout(
+            QtWidgets.QFormLayout(self),
+        )
+
+        # -- Create our sub widgets
+        self.budget_spinner = QtWidgets.QDoubleSpinBox()
+        self.budget_spinner.setRange(0.1, 10000)
+        self.budget_spinner.setSuffix(" ms")
+        self.budget_spinner.setToolTip(
+            "Traits which repeatedly take longer than this per call are flagged as slow",
+        )
+
+        self.mode_combo = QtWidgets.QComboBox()
+
+        for mode, label in self.MODE_LABELS.items():
+            self.mode_combo.addItem(label, mode)
+
+        self.layout().addRow("Trait Budget", self.budget_spinner)
+        self.layout().addRow("Slow Traits", self.mode_combo)
+
+        # -- Finally we populate the values
+        self.populate()
+
+        # -- Hook up our signals and slots
+        self.budget_spinner.valueChanged.connect(self.changed.emit)
+        self.mode_combo.currentIndexChanged.connect(self.changed.emit)
+
+    def budget(self) -> float:
+        return self.budget_spinner.value()
+
+    def mode(self) -> str:
+        return self.mode_combo.currentData()
+
+    def populate(self) -> None:
+        """
+        Reads the budget and mode from the settings
+        """
+        self.budget_spinner.blockSignals(True)
+        self.mode_combo.blockSignals(True)
+
+        self.budget_spinner.setValue(self.app.config.get_setting("trait_budget"))
+        self.mode_combo.setCurrentIndex(
+            max(0, self.mode_combo.findData(self.app.config.get_setting("slow_traits"))),
+        )
+
+        self.budget_spinner.blockSignals(False)
+        self.mode_combo.blockSignals(False)
+
+
 # noinspection PyUnresolvedReferences,PyPep8Naming
 class FilterOptionsWidget(QtWidgets.QWidget):
     """
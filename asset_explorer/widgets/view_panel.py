@@ -141,10 +141,10 @@ class ViewPanel(Qt.QtWidgets.QWidget):
         """
         self.view_selector.clear()
 
-        for view_type in sorted(
-            self.app.config.views.plugins(), key=lambda x: x.identifier
-        ):
-            self.view_selector.addItem(view_type.identifier)
+        # -- We only need the identifiers here, which means the views
+        # -- are not imported until they're switched to
+        for identifier in sorted(self.app.config.views.identifiers()):
+            self.view_selector.addItem(identifier)
 
     def force_refresh(self) -> None:
         """
@@ -0,0 +1,18 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> __init__.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Benchmarks for the hot paths of the asset explorer. These run headless (using
+the offscreen Qt platform) against synthetic configurations, so the results are
+comparable between machines and between changes.
+
+Run them from the root of the repository with:
+
+    python -m benchmarks.run --output results.json
+"""
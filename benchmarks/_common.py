@@ -0,0 +1,252 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> _common.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+This module holds the timing helpers and the fixtures which are shared by
+all the benchmarks.
+"""
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+# -- The benchmarks must never need a display, so unless told otherwise
+# -- we always use the offscreen platform
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# -- Allow the benchmarks to be run against the checkout rather than
+# -- whichever version of the explorer happens to be installed
+_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+import asset_composition  # noqa: E402
+from Qt import QtWidgets  # noqa: E402
+
+import asset_explorer  # noqa: E402
+
+# -- The location of the synthetic trait and discovery plugins
+PLUGIN_DIR: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "plugins",
+)
+
+
+def measure(
+    function: Callable,
+    repeat: int = 5,
+    setup: Callable | None = None,
+) -> dict[str, Any]:
+    """
+    Calls the function the given number of times and returns the timings
+    in milliseconds. The garbage collector is disabled whilst timing so
+    that a collection does not land in the middle of a single run.
+
+    Args:
+        function: The callable to time
+        repeat: The amount of times to call it
+        setup: Optional callable which is called (untimed) before each run
+
+    Returns:
+        Dictionary of min, mean, max and the individual runs
+    """
+    runs = []
+
+    for _ in range(repeat):
+        if setup:
+            setup()
+
+        gc.collect()
+        gc.disable()
+
+        try:
+            start = time.perf_counter()
+            function()
+            runs.append((time.perf_counter() - start) * 1000)
+
+        finally:
+            gc.enable()
+
+    return dict(
+        min=min(runs),
+        mean=statistics.mean(runs),
+        max=max(runs),
+        runs=runs,
+    )
+
+
+def peak_rss() -> int | None:
+    """
+    Returns the peak resident memory of this process in kilobytes, or None
+    if it cannot be determined on this platform
+    """
+    try:
+        import resource
+
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # -- MacOS reports in bytes whilst linux reports in kilobytes
+    if sys.platform == "darwin":
+        peak //= 1024
+
+    return peak
+
+
+def application() -> QtWidgets.QApplication:
+    """
+    Returns the running QApplication, creating one if required
+    """
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def synthetic_root(width: int, depth: int) -> str:
+    """
+    Returns the identifier of a synthetic hierarchy where every asset has
+    the given amount of children, down to the given depth
+    """
+    return f"synthetic:{width}x{depth}"
+
+
+def generate_tree(root: str, width: int, depth: int) -> str:
+    """
+    Generates a folder hierarchy on disk, where every folder contains the given
+    amount of sub folders and files, down to the given depth.
+
+    Args:
+        root: The folder to generate the hierarchy within
+        width: The amount of folders and files within each folder
+        depth: The amount of levels of folders
+
+    Returns:
+        The root folder of the hierarchy
+    """
+    folders = [root]
+
+    for level in range(depth):
+        next_folders = []
+
+        for folder in folders:
+            for idx in range(width):
+                with open(os.path.join(folder, f"file_{idx}.txt"), "w"):
+                    pass
+
+                # -- The deepest level only contains files
+                if level == depth - 1:
+                    continue
+
+                sub_folder = os.path.join(folder, f"folder_{idx}")
+                os.makedirs(sub_folder)
+                next_folders.append(sub_folder)
+
+        folders = next_folders
+
+    return root
+
+
+def configuration(
+    search_roots: list[str],
+    filesystem: bool = False,
+    active_view: str = "Hierarchy View",
+    **settings,
+) -> asset_explorer.Configuration:
+    """
+    Creates an explorer configuration using the synthetic plugins (or the
+    asset composition filesystem plugins) with the given search roots.
+
+    Args:
+        search_roots: The identifiers to use as the roots
+        filesystem: If True the filesystem plugins are used rather than
+            the synthetic ones
+        active_view: The view to show
+        settings: Any other settings to apply
+
+    Returns:
+        asset_explorer.Configuration
+    """
+    config = asset_explorer.Configuration()
+
+    if filesystem:
+        plugin_dir = os.path.join(
+            os.path.dirname(asset_composition.__file__),
+            "plugins",
+            "filesystem",
+        )
+
+    else:
+        plugin_dir = PLUGIN_DIR
+
+    config.traits.add_path(os.path.join(plugin_dir, "traits"))
+    config.discovery.add_path(os.path.join(plugin_dir, "discovery"))
+
+    for root in search_roots:
+        config.add_to("search_roots", root)
+
+    config.set_setting("active_view", active_view)
+
+    for setting_name, value in settings.items():
+        config.set_setting(setting_name, value)
+
+    return config
+
+
+class Context:
+    """
+    This is given to every benchmark, and gives access to the running
+    application and a temporary folder which is removed once all the
+    benchmarks have run.
+    """
+
+    def __init__(self, repeat: int = 5) -> None:
+        self.repeat: int = repeat
+        self.application: QtWidgets.QApplication = application()
+
+        self._temp_dir = tempfile.TemporaryDirectory(prefix="asset_explorer_bench_")
+
+    @property
+    def temp_dir(self) -> str:
+        return self._temp_dir.name
+
+    def measure(self, function: Callable, setup: Callable | None = None) -> dict:
+        """
+        Convenience wrapper around measure using the context's repeat count
+        """
+        return measure(function, repeat=self.repeat, setup=setup)
+
+    def cleanup(self) -> None:
+        self._temp_dir.cleanup()
+
+
+def explorer(config: asset_explorer.Configuration) -> asset_explorer.Explorer:
+    """
+    Creates (and shows) an explorer for the given configuration and processes
+    the pending events, so that the view is fully laid out before any timing
+    takes place.
+    """
+    widget = asset_explorer.Explorer(config)
+    widget.resize(600, 800)
+    widget.show()
+
+    application().processEvents()
+
+    return widget
+
+
+def clear_compositor(widget: asset_explorer.Explorer) -> None:
+    """
+    Clears the cached assets from the explorer's compositor so that the next
+    run has to bind the traits again
+    """
+    widget.compositor.get.cache_clear()
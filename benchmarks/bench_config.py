@@ -0,0 +1,45 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> bench_config.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Measures how long it takes to serialise and deserialise a configuration
+with a large amount of user data (favourites, search roots etc)
+"""
+import json
+import os
+
+import asset_explorer
+
+from . import _common
+
+
+def run(context: _common.Context) -> dict[str, dict]:
+    results = dict()
+
+    config = _common.configuration(
+        [_common.synthetic_root(10, 3) + f"/{idx}" for idx in range(100)],
+        favourites=[
+            _common.synthetic_root(10, 3) + f"/{idx % 10}/{idx // 10}"
+            for idx in range(5000)
+        ],
+        filtered_labels=[f"label_{idx}" for idx in range(500)],
+    )
+    filepath = os.path.join(context.temp_dir, "config.json")
+
+    def serialise() -> None:
+        with open(filepath, "w") as f:
+            json.dump(config.serialise(), f, indent=4, sort_keys=True)
+
+    results["config.serialise"] = context.measure(serialise)
+    results["config.deserialise"] = context.measure(
+        lambda: asset_explorer.Configuration(filepath=filepath),
+    )
+    results["config.size"] = dict(bytes=os.path.getsize(filepath))
+
+    return results
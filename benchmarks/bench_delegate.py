@@ -0,0 +1,79 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> bench_delegate.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Measures how quickly the asset delegate can paint rows. We paint onto an
+image rather than the screen so that the results are not tied to the
+platform's compositor.
+"""
+from Qt import QtCore, QtGui, QtWidgets
+
+from asset_explorer import delegate
+
+from . import _common
+
+# -- The amount of rows we paint in each run
+_ROWS: int = 500
+
+
+def _paint(
+    asset_delegate: delegate.AssetDelegate,
+    view: QtWidgets.QTreeWidget,
+    indices: list[QtCore.QModelIndex],
+    image: QtGui.QImage,
+    size: int,
+) -> None:
+    painter = QtGui.QPainter(image)
+
+    try:
+        option = QtWidgets.QStyleOptionViewItem()
+        option.palette = view.palette()
+
+        for row, index in enumerate(indices):
+            option.rect = QtCore.QRect(0, row * size, image.width(), size)
+            asset_delegate.paint(painter, option, index)
+
+    finally:
+        painter.end()
+
+
+def run(context: _common.Context) -> dict[str, dict]:
+    results = dict()
+
+    config = _common.configuration([_common.synthetic_root(_ROWS, 1)])
+    widget = _common.explorer(config)
+    view = widget.view_panel.active_view
+
+    root = view.topLevelItem(0)
+
+    for idx in range(root.childCount()):
+        root.child(idx).load_data()
+
+    indices = [view.indexFromItem(root.child(idx)) for idx in range(root.childCount())]
+
+    for size in (16, 32, 64):
+        asset_delegate = delegate.AssetDelegate(size=size)
+        image = QtGui.QImage(
+            600,
+            size * len(indices),
+            QtGui.QImage.Format_ARGB32_Premultiplied,
+        )
+
+        result = context.measure(
+            lambda: _paint(asset_delegate, view, indices, image, size),
+        )
+        result["items"] = len(indices)
+        result["items_per_second"] = len(indices) / (result["mean"] / 1000)
+
+        results[f"delegate.paint.{size}"] = result
+
+    widget.close()
+    widget.deleteLater()
+
+    return results
@@ -0,0 +1,56 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> bench_icons.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Measures the cost of resolving the built in icons to pixmaps, both when the
+icon cache is empty (cold) and when it has already been populated (warm)
+"""
+import os
+
+from asset_explorer import icons
+
+from . import _common
+
+
+def _icon_names() -> list[str]:
+    return [
+        os.path.splitext(filename)[0]
+        for filename in sorted(os.listdir(icons._ICON_DIR))
+        if filename.endswith(".png")
+    ]
+
+
+def _clear() -> None:
+    icons.path.cache_clear()
+    icons.as_pixmap.cache_clear()
+
+
+def run(context: _common.Context) -> dict[str, dict]:
+    results = dict()
+    names = _icon_names()
+
+    for size in (16, 32, 64):
+
+        def resolve() -> None:
+            for name in names:
+                icons.as_pixmap(name, size)
+
+        results[f"icons.as_pixmap.{size}.cold"] = context.measure(
+            resolve,
+            setup=_clear,
+        )
+        results[f"icons.as_pixmap.{size}.warm"] = context.measure(resolve)
+
+        for result in (
+            results[f"icons.as_pixmap.{size}.cold"],
+            results[f"icons.as_pixmap.{size}.warm"],
+        ):
+            result["items"] = len(names)
+
+    return results
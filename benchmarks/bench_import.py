@@ -0,0 +1,131 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> bench_import.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Measures how long it takes to import the explorer in a fresh interpreter,
+using python's -X importtime. Importing the package alone should be almost
+free, whilst accessing the Explorer pulls in Qt and the widgets. The modules
+which took the longest to import are reported alongside the timings.
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+from . import _common
+
+# -- The statements we time, each run within a fresh interpreter
+SCENARIOS: dict[str, str] = {
+    "import.package": "import asset_explorer",
+    "import.explorer": "import asset_explorer; asset_explorer.Explorer",
+}
+
+# -- The amount of modules we list as the slowest to import
+SLOWEST: int = 10
+
+
+def import_times(statement: str) -> list[tuple[str, int, int]]:
+    """
+    Runs the statement in a fresh interpreter with -X importtime and returns
+    the timings of every module it imported
+
+    Args:
+        statement: The python code to run
+
+    Returns:
+        List of (module name, self microseconds, cumulative microseconds)
+    """
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        [_common._ROOT] + [path for path in [environment.get("PYTHONPATH")] if path]
+    )
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=environment,
+    )
+
+    if process.returncode:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+
+    timings = []
+
+    # -- Lines take the form "import time: self [us] | cumulative | name"
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:") :].split("|")
+
+        try:
+            self_time, cumulative = int(fields[0]), int(fields[1])
+
+        except ValueError:
+            # -- This is the header line
+            continue
+
+        # -- Nested imports are indented beneath the module importing them
+        timings.append((fields[2][1:].rstrip(), self_time, cumulative))
+
+    return timings
+
+
+def run(context: _common.Context) -> dict[str, dict]:
+    results = dict()
+
+    # -- The interpreter imports a number of modules whilst starting up,
+    # -- which are nothing to do with the explorer so we leave them out
+    startup = {module.strip() for module, _, _ in import_times("pass")}
+
+    for name, statement in SCENARIOS.items():
+        runs = []
+        timings = []
+
+        try:
+            for _ in range(context.repeat):
+                timings = [
+                    timing
+                    for timing in import_times(statement)
+                    if timing[0].strip() not in startup
+                ]
+
+                # -- The total is the cumulative time of every top level
+                # -- import, which is everything the statement pulled in
+                runs.append(
+                    sum(
+                        cumulative
+                        for module, _, cumulative in timings
+                        if not module.startswith(" ")
+                    )
+                    / 1000
+                )
+
+        except RuntimeError as error:
+            results[name] = dict(error=str(error))
+            continue
+
+        results[name] = dict(
+            min=min(runs),
+            mean=statistics.mean(runs),
+            max=max(runs),
+            runs=runs,
+            modules=len(timings),
+            slowest=[
+                dict(module=module.strip(), self_ms=self_time / 1000)
+                for module, self_time, _ in sorted(
+                    timings,
+                    key=lambda timing: timing[1],
+                    reverse=True,
+                )[:SLOWEST]
+            ],
+        )
+
+    return results
@@ -0,0 +1,76 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> bench_items.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Measures how long AssetItems take to populate their children on wide (many
+children per asset) and deep (many levels of assets) hierarchies.
+"""
+import functools
+
+import asset_explorer
+
+from . import _common
+
+
+def _populate_deep(item: asset_explorer.AssetItem) -> None:
+    """
+    Populates the item, then walks down through the first child of every
+    level populating as we go - which is what happens when a user expands
+    their way down a hierarchy.
+    """
+    while item:
+        item.populate_children()
+        item = item.child(0)
+
+
+def run(context: _common.Context) -> dict[str, dict]:
+    results = dict()
+
+    widget = _common.explorer(_common.configuration([]))
+    clear = functools.partial(_common.clear_compositor, widget)
+
+    # -- A single asset with thousands of children
+    wide = asset_explorer.AssetItem(
+        widget.compositor.get(_common.synthetic_root(5000, 1)),
+        app=widget,
+    )
+    results["item.populate_children.wide.cold"] = context.measure(
+        wide.populate_children,
+        setup=clear,
+    )
+    results["item.populate_children.wide.warm"] = context.measure(
+        wide.populate_children,
+    )
+    results["item.populate_children.wide.cold"]["items"] = wide.childCount()
+
+    # -- A narrow hierarchy which is many levels deep
+    deep = asset_explorer.AssetItem(
+        widget.compositor.get(_common.synthetic_root(5, 40)),
+        app=widget,
+    )
+    results["item.populate_children.deep.cold"] = context.measure(
+        functools.partial(_populate_deep, deep),
+        setup=clear,
+    )
+    results["item.populate_children.deep.warm"] = context.measure(
+        functools.partial(_populate_deep, deep),
+    )
+
+    # -- Reading the data which the delegate draws
+    results["item.update_data"] = context.measure(
+        lambda: [wide.child(idx).update_data() for idx in range(wide.childCount())],
+    )
+    results["item.load_data"] = context.measure(
+        lambda: [wide.child(idx)._read_data() for idx in range(wide.childCount())],
+    )
+
+    widget.close()
+    widget.deleteLater()
+
+    return results
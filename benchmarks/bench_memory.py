@@ -0,0 +1,212 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> bench_memory.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Measures how much python memory each AssetItem costs. The assets are resolved
+before measuring, so only the state the items themselves hold (along with what
+they store on their assets) is counted. A plain QTreeWidgetItem is measured too,
+as the python wrapper of an item is the least each node can cost. Items holding
+their state within an attribute dictionary (as AssetItem did before it used
+slots) are measured against AssetItem itself, giving the saving of the slots.
+
+The cost of storing the identifiers of a deep hierarchy within a path store is
+also compared against storing each of them as a full string.
+"""
+import gc
+import tracemalloc
+from typing import Any, Callable
+
+from Qt import QtWidgets
+
+import asset_explorer
+from asset_explorer import paths
+
+from . import _common
+
+# -- The amount of children we populate beneath a single asset
+WIDTH: int = 20000
+
+# -- The shape of the hierarchy whose identifiers we store, which gives
+# -- just over a hundred thousand identifiers
+PATH_WIDTH: int = 10
+PATH_DEPTH: int = 5
+PATH_ROOT: str = "c:/projects/studio_library/assets"
+
+
+class _UnslottedAssetItem(asset_explorer.AssetItem):
+    """
+    An AssetItem which also holds its state within an attribute dictionary,
+    as AssetItem did before it used slots. The slots are still filled too,
+    so this overstates the cost of the dictionary by the size of the slots.
+    """
+
+    def __init__(self, asset, app) -> None:
+        super(_UnslottedAssetItem, self).__init__(asset, app=app)
+        self.__dict__.update(_app=app, _asset=asset, _data_loaded=False)
+
+
+def bytes_per_node(populate: Callable[[], QtWidgets.QTreeWidgetItem]) -> float:
+    """
+    Returns the amount of python memory allocated per child item by the
+    given populate function, which should return the parent item.
+
+    Args:
+        populate: Callable which creates the items
+
+    Returns:
+        The allocated bytes per child item
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        parent = populate()
+        gc.collect()
+
+        allocated, _ = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return allocated / max(1, parent.childCount())
+
+
+def allocated(build: Callable[[], Any]) -> int:
+    """
+    Returns the amount of python memory still allocated once the given
+    build function has run (whilst its result is alive)
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        result = build()
+        gc.collect()
+
+        allocated_bytes, _ = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return allocated_bytes
+
+
+def identifiers() -> list[str]:
+    """
+    Returns the identifiers of a synthetic folder hierarchy
+    """
+    results = []
+    level = [PATH_ROOT]
+
+    for depth in range(PATH_DEPTH):
+        level = [
+            f"{parent}/folder_{depth}_{idx}"
+            for parent in level
+            for idx in range(PATH_WIDTH)
+        ]
+        results.extend(level)
+
+    return results
+
+
+def run(context: _common.Context) -> dict[str, dict]:
+    results = dict()
+
+    widget = _common.explorer(_common.configuration([]))
+    asset = widget.compositor.get(_common.synthetic_root(WIDTH, 1))
+
+    # -- Resolve the assets up front, so we do not measure the compositor
+    asset_explorer.AssetItem(asset, app=widget).populate_children(
+        expand_additional_depth=False,
+    )
+
+    # -- Hold onto the parents, so their children are alive whilst measuring
+    parents = []
+
+    def populate_items() -> QtWidgets.QTreeWidgetItem:
+        item = asset_explorer.AssetItem(asset, app=widget)
+        item.populate_children(expand_additional_depth=False)
+        parents.append(item)
+
+        return item
+
+    def populate_plain() -> QtWidgets.QTreeWidgetItem:
+        item = QtWidgets.QTreeWidgetItem()
+        item.addChildren([QtWidgets.QTreeWidgetItem() for _ in range(WIDTH)])
+        parents.append(item)
+
+        return item
+
+    # -- The slotted and unslotted items are added the same way, so that
+    # -- the only difference between them is where they hold their state
+    child_assets = [widget.compositor.get(child) for child in asset.children()]
+
+    def populate_with(item_class: type) -> Callable[[], QtWidgets.QTreeWidgetItem]:
+        def populate() -> QtWidgets.QTreeWidgetItem:
+            item = QtWidgets.QTreeWidgetItem()
+            item.addChildren(
+                [item_class(child_asset, app=widget) for child_asset in child_assets],
+            )
+            parents.append(item)
+
+            return item
+
+        return populate
+
+    item_bytes = bytes_per_node(populate_items)
+    plain_bytes = bytes_per_node(populate_plain)
+
+    results["memory.item"] = dict(
+        bytes_per_node=item_bytes,
+        wrapper_bytes_per_node=plain_bytes,
+        overhead_bytes_per_node=item_bytes - plain_bytes,
+        nodes=WIDTH,
+    )
+
+    slotted_bytes = bytes_per_node(populate_with(asset_explorer.AssetItem))
+    unslotted_bytes = bytes_per_node(populate_with(_UnslottedAssetItem))
+
+    results["memory.slots"] = dict(
+        slotted_bytes_per_node=slotted_bytes,
+        unslotted_bytes_per_node=unslotted_bytes,
+        saving_bytes_per_node=unslotted_bytes - slotted_bytes,
+        saving=1 - (slotted_bytes / unslotted_bytes),
+        nodes=WIDTH,
+    )
+
+    # -- The identifiers are generated within the build functions, so their
+    # -- strings are counted when they're kept as full strings
+    def build_strings() -> dict[str, int]:
+        return {identifier: idx for idx, identifier in enumerate(identifiers())}
+
+    def build_store() -> paths.PathStore:
+        store = paths.PathStore()
+
+        for identifier in identifiers():
+            store.add(identifier)
+
+        return store
+
+    count = len(identifiers())
+    string_bytes = allocated(build_strings) / count
+    store_bytes = allocated(build_store) / count
+
+    results["memory.identifiers"] = dict(
+        string_bytes_per_identifier=string_bytes,
+        store_bytes_per_identifier=store_bytes,
+        saving=1 - (store_bytes / string_bytes),
+        identifiers=count,
+    )
+
+    parents.clear()
+    widget.close()
+    widget.deleteLater()
+
+    return results
@@ -0,0 +1,74 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> bench_view.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Measures how long the hierarchy view takes to populate itself
+"""
+import functools
+import os
+
+from . import _common
+
+
+def _populate(context: _common.Context, config, cold: bool) -> dict:
+    widget = _common.explorer(config)
+    view = widget.view_panel.active_view
+
+    setup = functools.partial(_common.clear_compositor, widget) if cold else None
+
+    result = context.measure(view.populate, setup=setup)
+    result["items"] = view.topLevelItemCount() + sum(
+        view.topLevelItem(idx).childCount()
+        for idx in range(view.topLevelItemCount())
+    )
+
+    widget.close()
+    widget.deleteLater()
+
+    return result
+
+
+def run(context: _common.Context) -> dict[str, dict]:
+    results = dict()
+
+    # -- A handful of roots, each with a moderate amount of children
+    config = _common.configuration(
+        [_common.synthetic_root(50, 4) + f"/{idx}" for idx in range(10)],
+    )
+    results["view.populate.synthetic.cold"] = _populate(context, config, cold=True)
+    results["view.populate.synthetic.warm"] = _populate(context, config, cold=False)
+
+    # -- A single root with a large amount of children
+    config = _common.configuration([_common.synthetic_root(2000, 1)])
+    results["view.populate.synthetic_wide.cold"] = _populate(
+        context,
+        config,
+        cold=True,
+    )
+
+    # -- The same shape of hierarchy, but on disk using the filesystem traits
+    root = os.path.join(context.temp_dir, "view_tree")
+    os.makedirs(root)
+    _common.generate_tree(root, width=10, depth=3)
+
+    config = _common.configuration([root], filesystem=True)
+    results["view.populate.filesystem.cold"] = _populate(context, config, cold=True)
+
+    # -- Finally measure how long it takes to resolve what is on screen
+    config = _common.configuration([_common.synthetic_root(2000, 1)])
+    widget = _common.explorer(config)
+    view = widget.view_panel.active_view
+    view.topLevelItem(0).setExpanded(True)
+
+    results["view.update_visibility"] = context.measure(view.update_visibility)
+
+    widget.close()
+    widget.deleteLater()
+
+    return results
@@ -0,0 +1,53 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> synthetic.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+This discovery plugin searches the synthetic hierarchies generated by the
+synthetic trait, without touching the disk.
+"""
+import fnmatch
+
+import asset_composition
+
+PREFIX: str = "synthetic:"
+
+
+class SyntheticSearch(asset_composition.DiscoveryPlugin):
+
+    @classmethod
+    def search(cls, query, search_from):
+        results = []
+
+        if isinstance(search_from, str):
+            search_from = [search_from]
+
+        pattern = f"*{query or ''}*"
+
+        for root in search_from or []:
+            if not root.startswith(PREFIX):
+                continue
+
+            width, depth = root[len(PREFIX):].split("/")[0].split("x")
+
+            # -- Walk the hierarchy breadth first, matching on the label
+            level = [root]
+
+            for _ in range(int(depth)):
+                level = [
+                    f"{identifier}/{idx}"
+                    for identifier in level
+                    for idx in range(int(width))
+                ]
+                results.extend(
+                    identifier
+                    for identifier in level
+                    if fnmatch.fnmatch(identifier.rsplit("/", 1)[-1], pattern)
+                )
+
+        return results
@@ -0,0 +1,69 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> synthetic.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+This trait generates an asset hierarchy entirely in memory, which allows the
+benchmarks to measure the cost of the explorer without any disk or network
+access getting in the way.
+
+Synthetic identifiers take the form:
+
+    synthetic:<width>x<depth>/0/4/2
+
+Where every asset has <width> children until the hierarchy is <depth> levels
+deep.
+"""
+import asset_composition
+
+PREFIX: str = "synthetic:"
+
+
+class SyntheticTrait(asset_composition.Trait):
+
+    importance = 50
+
+    @classmethod
+    def can_bind(cls, identifier: str) -> bool:
+        return identifier.startswith(PREFIX)
+
+    def _shape(self) -> tuple[int, int, int]:
+        """
+        Returns the width and depth of the hierarchy this asset belongs to
+        along with the level of this asset within it
+        """
+        root, *path = self.asset().identifier()[len(PREFIX):].split("/")
+        width, depth = root.split("x")
+
+        return int(width), int(depth), len(path)
+
+    def label(self) -> str:
+        return self.asset().identifier().rsplit("/", 1)[-1]
+
+    def icon(self) -> str:
+        return "Action"
+
+    def children(self) -> list[str]:
+        width, depth, level = self._shape()
+
+        if level >= depth:
+            return []
+
+        identifier = self.asset().identifier()
+        return [f"{identifier}/{idx}" for idx in range(width)]
+
+    def status_icons(self) -> list[str]:
+        width, depth, level = self._shape()
+
+        if level % 2:
+            return ["Favourite"]
+
+        return list()
+
+    def custom_data(self) -> dict:
+        return dict(level=self._shape()[2])
@@ -0,0 +1,113 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> run.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Runs the benchmarks and writes the results as json. Usage:
+
+    python -m benchmarks.run [--output results.json] [--repeat 5] [--only view]
+"""
+import argparse
+import datetime
+import importlib
+import json
+import platform
+import sys
+
+from . import _common
+
+import Qt  # noqa: E402 - _common ensures the offscreen platform is used
+
+import asset_explorer  # noqa: E402
+
+# -- The benchmark modules, in the order they are run. Each must expose
+# -- a run function which takes the context and returns a dictionary
+# -- of results
+MODULES: list[str] = [
+    "bench_view",
+    "bench_items",
+    "bench_delegate",
+    "bench_icons",
+    "bench_config",
+    "bench_import",
+    "bench_memory",
+]
+
+
+def run(repeat: int = 5, only: list[str] | None = None) -> dict:
+    """
+    Runs the benchmarks and returns the results
+
+    Args:
+        repeat: The amount of times each benchmark is repeated
+        only: Optional list of module names to restrict the run to
+
+    Returns:
+        Dictionary of metadata and results
+    """
+    context = _common.Context(repeat=repeat)
+    results = dict()
+
+    try:
+        for module_name in MODULES:
+            if only and not any(name in module_name for name in only):
+                continue
+
+            module = importlib.import_module(f"{__package__}.{module_name}")
+            results.update(module.run(context))
+
+    finally:
+        context.cleanup()
+
+    return dict(
+        timestamp=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        version=asset_explorer.__version__,
+        python=sys.version,
+        platform=platform.platform(),
+        qt_binding=Qt.__binding__,
+        qt_version=Qt.__qt_version__,
+        repeat=repeat,
+        peak_rss_kb=_common.peak_rss(),
+        results=results,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--output",
+        default="benchmark_results.json",
+        help="The json file to write the results to",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="The amount of times each benchmark is repeated",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="*",
+        help="Only run the benchmark modules which contain these names",
+    )
+    args = parser.parse_args(argv)
+
+    data = run(repeat=args.repeat, only=args.only)
+
+    for name, result in data["results"].items():
+        if "mean" in result:
+            print(f"{name:<48} {result['mean']:>10.3f} ms")
+
+    print(f"{'peak rss':<48} {data['peak_rss_kb']} kb")
+
+    with open(args.output, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
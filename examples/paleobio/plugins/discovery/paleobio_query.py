@@ -11,11 +11,10 @@
 This discovery mechanism will search the paleobio rest api for a dinosaur
 and return the results
 """
-import json
-import urllib.request
-
 import asset_composition
 
+import asset_explorer
+
 
 class PaleoBioSearch(asset_composition.DiscoveryPlugin):
     """
@@ -32,8 +31,9 @@ class PaleoBioSearch(asset_composition.DiscoveryPlugin):
             + query
             + "%"
         )
-        with urllib.request.urlopen(api_search) as response:
-            data = json.load(response)["records"]
+        # -- Use the shared http client, which keeps the connection to the
+        # -- api alive and caches results so repeated searches are instant
+        data = asset_explorer.HttpClient.shared().get(api_search).json()["records"]
 
         results = [record["nam"] for record in data if "nam" in record]
 
@@ -8,29 +8,19 @@
 # Author		-> Michael Malinowski (Studio Gobo)
 # ----------------------------------------------------------------------------
 import functools
-import json
-import os
-import shutil
-import urllib.request
 import weakref
-from typing import Self
+from typing import Any, Self
 
 import asset_composition
-import Qt
 from asset_composition._trait import _TraitAction
+from Qt import QtGui
+
+import asset_explorer
 
 
 class PaleoBioRestApiResourceTrait(asset_composition.Trait):
 
     importance = 100
-    CACHE_DIR: str = os.path.join(
-        os.environ["APPDATA"],
-        "PALEO_RESOURCES",
-    )
-
-    def __init__(self, *args, **kwargs):
-        super(PaleoBioRestApiResourceTrait, self).__init__(*args, **kwargs)
-        DB.cache.get_data(self)
 
     @classmethod
     def can_bind(cls, identifier: str) -> bool:
@@ -60,71 +50,42 @@ class PaleoBioRestApiResourceTrait(asset_composition.Trait):
         return DB.cache.get_icon(self)
 
 
-class DataCache(Qt.QtCore.QThread):
+class DataCache:
+    """
+    The data cache holds all the data we have pulled from the rest api. Any
+    data we do not yet have is fetched through the shared asset_explorer task
+    pool, which means the requests run in parallel, are never duplicated and
+    are dropped if the trait which asked for them no longer exists.
+
+    Everything we fetch is persisted in the shared asset_explorer cache store,
+    which keeps all the taxa within a single file rather than a file per taxon.
+    """
 
     INSTANCE = None
 
-    def __init__(self, *args, **kwargs):
-        super(DataCache, self).__init__(*args, **kwargs)
+    # -- These are the namespaces we use within the cache store
+    DATA: str = "paleobio.data"
+    CHILDREN: str = "paleobio.children"
+    ICON_IDS: str = "paleobio.icon_ids"
+    ICONS: str = "paleobio.icons"
 
+    def __init__(self):
         self._cache = dict(
             icons=dict(),
             data=dict(),
             children=dict(),
         )
 
-        self._queue: list = []
+        self._store = asset_explorer.CacheStore.shared()
+        self._pool = asset_explorer.TaskPool.shared()
+        self._http = asset_explorer.HttpClient.shared()
 
     @classmethod
     def as_singleton(cls) -> Self:
         if cls.INSTANCE is None:
             cls.INSTANCE: Self = cls()
-            cls.INSTANCE.start()
         return cls.INSTANCE
 
-    @functools.lru_cache(maxsize=None)
-    def get_cache_path(self) -> str:
-        CACHE_DIR: str = os.path.join(
-            os.environ["APPDATA"],
-            "PALEO_RESOURCES",
-        )
-        if not os.path.exists(CACHE_DIR):
-            os.makedirs(CACHE_DIR)
-
-        return CACHE_DIR
-
-    # TODO: Add typing
-    @functools.lru_cache(maxsize=None)
-    def data_filepath(self, name) -> str:
-        return os.path.join(
-            self.get_cache_path(),
-            name + "_data.json",
-        )
-
-    # TODO: Add typing
-    @functools.lru_cache(maxsize=None)
-    def child_filepath(self, name) -> str:
-        return os.path.join(
-            self.get_cache_path(),
-            name + "_children.json",
-        )
-
-    # TODO: Add typing
-    @functools.lru_cache(maxsize=None)
-    def icon_filepath(self, name) -> str:
-        return os.path.join(
-            self.get_cache_path(),
-            name + ".png",
-        )
-
-    # TODO: Add typing
-    @functools.lru_cache(maxsize=None)
-    def base_icon_filepath(self, icon_id) -> str:
-        return os.path.join(
-            self.get_cache_path(),
-            str(icon_id) + "_base_icon.png",
-        )
-
     # TODO: Add typing
     def get_data(self, trait):
         name = trait.asset().identifier()
@@ -133,14 +94,15 @@ class DataCache(Qt.QtCore.QThread):
         if name in self._cache["data"]:
             return self._cache["data"][name]
 
-        # -- Check if the cache file is ready
-        if os.path.exists(self.data_filepath(name)):
-            with open(self.data_filepath(name), "r") as f:
-                self._cache["data"][name] = json.load(f)
-                return self._cache["data"][name]
+        # -- Check if the data is already in the store
+        data = self._store.get_json(self.DATA, name)
+
+        if data is not None:
+            self._cache["data"][name] = data
+            return data
 
         # -- To reach here means we need to queue it
-        self.queue_data_request(weakref.ref(trait), "data")
+        self.queue_data_request(trait, "data")
         return dict(nam=name)
 
     # TODO: Add typing
@@ -149,14 +111,19 @@ class DataCache(Qt.QtCore.QThread):
         if name in self._cache["children"]:
             return self._cache["children"][name]
 
-        # -- Check if a cached file already exists
-        if os.path.exists(self.child_filepath(name)):
-            with open(self.child_filepath(name), "r") as f:
-                self._cache["children"][name] = json.load(f)
-                return self._cache["children"][name]
+        # -- Check if the children are already in the store
+        children = self._store.get_json(self.CHILDREN, name)
+
+        if children is not None:
+            self._cache["children"][name] = children
+
+            # -- Its very likely we're about to be asked about all of
+            # -- these children, so read them in a single pass
+            self.prime(children)
+            return children
 
         # -- We need to queue a request for the data
-        self.queue_data_request(weakref.ref(trait), "children")
+        self.queue_data_request(trait, "children")
         return []
 
     # TODO: Add typing
@@ -165,132 +132,155 @@ class DataCache(Qt.QtCore.QThread):
         if name in self._cache["icons"]:
             return self._cache["icons"][name]
 
-        # -- Check if the file already exists
-        if os.path.exists(self.icon_filepath(name)):
-            self._cache["icons"][name] = self.icon_filepath(name)
-            return self._cache["icons"][name]
+        # -- Many taxa share the same image, so we store which image each
+        # -- taxon uses and then the images themselves just once
+        icon_id = self._store.get_json(self.ICON_IDS, name)
+
+        if icon_id is not None:
+            image = self._store.get(self.ICONS, icon_id)
+
+            if image is not None:
+                pixmap = QtGui.QPixmap()
+                pixmap.loadFromData(image)
+
+                self._cache["icons"][name] = QtGui.QIcon(pixmap)
+                return self._cache["icons"][name]
 
         # -- To reach here means we need to queue it
-        self.queue_data_request(weakref.ref(trait), "icon")
+        self.queue_data_request(trait, "icon")
         return
 
+    def prime(self, names: list[str]) -> None:
+        """
+        Reads the data and children of all the given taxa from the store
+        in bulk.
+        """
+        names = [
+            name
+            for name in names
+            if name not in self._cache["data"]
+        ]
+
+        self._cache["data"].update(
+            self._store.get_many_json(self.DATA, names),
+        )
+        self._cache["children"].update(
+            self._store.get_many_json(self.CHILDREN, names),
+        )
+
+    # TODO: Add typing
+    def queue_data_request(self, trait, access_type) -> None:
+        name = trait.asset().identifier()
+
+        fetchers = dict(
+            data=self._fetch_data,
+            children=self._fetch_children,
+            icon=self._fetch_icon,
+        )
+
+        # -- Data and icon changes are status changes, whilst children
+        # -- changes require the asset to repopulate
+        if access_type == "children":
+            notify = asset_explorer.notify_changed
+
+        else:
+            notify = asset_explorer.notify_status_changed
+
+        # -- The pool will only run one request for this key, regardless
+        # -- of how many traits ask for it. Each trait will be notified
+        # -- when the request completes
+        self._pool.submit(
+            (access_type, name),
+            fetchers[access_type],
+            name,
+            owner=trait,
+            identifier=name,
+            callback=functools.partial(
+                self._notify,
+                weakref.ref(trait),
+                notify,
+            ),
+        )
+
     # TODO: Add typing
-    def queue_data_request(self, trait_ref, access_type) -> None:
-        self._queue.append((trait_ref, access_type))
+    @staticmethod
+    def _notify(trait_ref, notify, result):
+
+        # -- If the trait is no longer with us, or there was nothing
+        # -- to fetch, then there is nothing to update
+        if not trait_ref() or result is None:
+            return
+
+        notify(trait_ref().asset())
+
+    def _request_taxon(self, name: str) -> dict[str, Any]:
+
+        # -- Resolve the rest api url. Both the data and the icon requests
+        # -- need this, but the http client will only ever make the request
+        # -- once, even if they ask at the same time
+        url_name = name.replace(" ", "+")
+        url = (
+            r"https://paleobiodb.org/data1.2/taxa/list.json?rowcount&show=class&show=img&show=full&name="
+            + url_name
+        )
+
+        return self._http.get(url).json()["records"][0]
 
-    def run(self):
-        while True:
+    def _fetch_data(self, name: str) -> dict[str, Any]:
+        data = self._request_taxon(name)
 
-            # -- If there is nothing queued, then do nothing
-            if not self._queue:
-                import time
-
-                time.sleep(1)
-                continue
-
-            # -- Take the first item in the queue to operate on
-            trait_ref, access_type = self._queue.pop(0)
-
-            # -- If the trait is no longer with us, skip it!
-            if not trait_ref():
-                continue
-
-            # -- Get the name of the asset
-            name = trait_ref().asset().identifier()
-
-            # -- Determine what type of operation we need to do
-            if access_type == "data":
-
-                # -- Resolve the rest api url
-                url_name = name.replace(" ", "+")
-                url = (
-                    r"https://paleobiodb.org/data1.2/taxa/list.json?rowcount&show=class&show=img&show=full&name="
-                    + url_name
-                )
-
-                with urllib.request.urlopen(url) as response:
-                    data = json.load(response)["records"][0]
-
-                    # -- Write the data to a persistent cache
-                    cache_file = self.data_filepath(name)
-                    with open(cache_file, "w") as f:
-                        json.dump(data, f)
-
-                    # -- Store the data in our own cache
-                    self._cache["data"][name] = data
-
-                # -- Emit the fact that this has been done
-                if trait_ref():
-                    trait = trait_ref().asset().status_changed.emit()
-
-            elif access_type == "children":
-
-                url_name = name.replace(" ", "+")
-                url = (
-                    r"https://paleobiodb.org/data1.2/taxa/list.json?rowcount&show=class&rel=children&name="
-                    + url_name
-                )
-
-                with urllib.request.urlopen(url) as response:
-                    data = json.load(response)["records"]
-
-                    children = [
-                        item["nam"]
-                        for item in data
-                        if "oid" in item and item["nam"] != name
-                    ]
-
-                    cache_file = self.child_filepath(name)
-                    with open(cache_file, "w") as f:
-                        json.dump(children, f)
-
-                    self._cache["children"][name] = children
-
-                if trait_ref():
-                    trait = trait_ref().asset().changed.emit()
-
-            elif access_type == "icon":
-                url_name = name.replace(" ", "+")
-                url = (
-                    r"https://paleobiodb.org/data1.2/taxa/list.json?rowcount&show=class&show=img&show=full&name="
-                    + url_name
-                )
-
-                with urllib.request.urlopen(url) as response:
-                    data = json.load(response)["records"][0]
-
-                if "img" not in data:
-                    continue
-
-                # -- Many assets share the same icons, so look for the base
-                # -- icon first, as we wont have to download it again if it
-                # -- already has been downloaded
-                base_icon_path = os.path.join(
-                    self.get_cache_path(),
-                    data["img"] + "_base_icon.png",
-                )
-
-                if not os.path.exists(base_icon_path):
-                    url = (
-                        r"https://paleobiodb.org/data1.2/taxa/thumb.png?id="
-                        + data["img"]
-                    )
-                    response = urllib.request.urlopen(url)
-                    image = response.read()
+        # -- Write the data to the persistent store
+        self._store.set_json(self.DATA, name, data)
+
+        # -- Store the data in our own cache
+        self._cache["data"][name] = data
+        return data
+
+    def _fetch_children(self, name: str) -> list[str]:
+
+        url_name = name.replace(" ", "+")
+        url = (
+            r"https://paleobiodb.org/data1.2/taxa/list.json?rowcount&show=class&rel=children&name="
+            + url_name
+        )
+
+        data = self._http.get(url).json()["records"]
+
+        children = [
+            item["nam"]
+            for item in data
+            if "oid" in item and item["nam"] != name
+        ]
+
+        self._store.set_json(self.CHILDREN, name, children)
+
+        self._cache["children"][name] = children
+        return children
+
+    def _fetch_icon(self, name: str) -> str | None:
+        data = self._request_taxon(name)
+
+        if "img" not in data:
+            return None
+
+        # -- Many assets share the same icons, so look for the base
+        # -- icon first, as we wont have to download it again if it
+        # -- already has been downloaded
+        icon_id = str(data["img"])
+
+        if not self._store.has(self.ICONS, icon_id):
+            url = (
+                r"https://paleobiodb.org/data1.2/taxa/thumb.png?id="
+                + icon_id
+            )
+            self._store.set(self.ICONS, icon_id, self._http.get(url).body)
 
-                    with open(base_icon_path, "wb") as file:
-                        file.write(image)
+        self._store.set_json(self.ICON_IDS, name, icon_id)
 
-                shutil.copy(
-                    str(base_icon_path),
-                    str(self.icon_filepath(name)),
-                )
-
-                # -- Store the path in the cache
-                self._cache["icons"][name] = self.icon_filepath(name)
-
-                if trait_ref():
-                    trait_ref().asset().status_changed.emit()
+        # -- We do not build the icon here, as pixmaps must be created on
+        # -- the main thread. Instead the icon will be read from the store
+        # -- when the trait is next asked for it.
+        return icon_id
 
 
 class DB:
@@ -0,0 +1,187 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> test_http_client.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Tests the http client against a stub server running on a local port
+"""
+import http.server
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from asset_explorer import http_client, store
+
+
+class _StubHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serves a handful of fixed routes, recording every request it is given
+    """
+
+    # -- Keep connections alive, so the client can pool them
+    protocol_version: str = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.server.requests.append((self.path, self.client_address))
+
+        if self.path == "/asset":
+            self._respond(200, b'{"label": "chair"}', ETag='"v1"')
+
+        elif self.path == "/versioned":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self._respond(304, b"")
+
+            else:
+                self._respond(200, b'{"version": 1}', ETag='"v1"')
+
+        elif self.path == "/slow":
+            time.sleep(0.2)
+            self._respond(200, b'{"slow": true}')
+
+        elif self.path == "/moved":
+            self._respond(301, b"moved", Location="/asset")
+
+        elif self.path == "/loop":
+            self._respond(302, b"", Location="/loop")
+
+        elif self.path == "/choices":
+            self._respond(300, b"choices")
+
+        else:
+            self._respond(404, b"")
+
+    def _respond(self, status: int, body: bytes, **headers: str) -> None:
+        self.send_response(status)
+
+        for name, value in headers.items():
+            self.send_header(name, value)
+
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args, **kwargs) -> None:
+        pass
+
+
+class HttpClientTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        cls.server.daemon_threads = True
+        cls.server.requests = list()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        self.server.requests.clear()
+
+        self.folder = tempfile.mkdtemp()
+        self.store = store.CacheStore(os.path.join(self.folder, "cache.db"))
+        self.client = http_client.HttpClient(cache_store=self.store, ttl=0)
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.store.close()
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def requests_for(self, path: str) -> list:
+        return [request for request in self.server.requests if request[0] == path]
+
+    def test_connections_are_pooled(self) -> None:
+        for _ in range(3):
+            self.client.get(f"{self.base_url}/asset")
+
+        # -- Every request should have come from the same client port
+        ports = {address[1] for _, address in self.server.requests}
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(len(ports), 1)
+
+    def test_fresh_responses_are_served_from_the_cache(self) -> None:
+        client = http_client.HttpClient(cache_store=self.store, ttl=60)
+
+        first = client.get(f"{self.base_url}/asset")
+        second = client.get(f"{self.base_url}/asset")
+        client.close()
+
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.json(), dict(label="chair"))
+        self.assertEqual(len(self.requests_for("/asset")), 1)
+
+    def test_stale_responses_are_revalidated(self) -> None:
+        first = self.client.get(f"{self.base_url}/versioned")
+        second = self.client.get(f"{self.base_url}/versioned")
+
+        self.assertFalse(first.from_cache)
+        self.assertTrue(second.from_cache)
+        self.assertEqual(second.status, 200)
+        self.assertEqual(second.json(), dict(version=1))
+        self.assertEqual(len(self.requests_for("/versioned")), 2)
+
+    def test_simultaneous_requests_are_collapsed(self) -> None:
+        responses = []
+
+        def request() -> None:
+            responses.append(self.client.get(f"{self.base_url}/slow"))
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(responses), 5)
+        self.assertEqual(len(self.requests_for("/slow")), 1)
+        self.assertTrue(all(response.json() == dict(slow=True) for response in responses))
+
+    def test_redirects_are_followed(self) -> None:
+        url = f"{self.base_url}/moved"
+        response = self.client.get(url)
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.json(), dict(label="chair"))
+
+        # -- The final response is stored against the url we asked for,
+        # -- and the redirect itself is never stored
+        self.assertEqual(self.client.cache.get(url).status, 200)
+        self.assertEqual(self.client.cache.get(url).body, response.body)
+
+    def test_redirect_loops_are_bounded(self) -> None:
+        url = f"{self.base_url}/loop"
+
+        with self.assertRaises(http_client.HttpError):
+            self.client.get(url)
+
+        self.assertEqual(len(self.requests_for("/loop")), http_client.MAX_REDIRECTS + 1)
+        self.assertIsNone(self.client.cache.get(url))
+
+    def test_unfollowable_redirects_are_not_stored(self) -> None:
+        url = f"{self.base_url}/choices"
+
+        with self.assertRaises(http_client.HttpError) as context:
+            self.client.get(url)
+
+        self.assertEqual(context.exception.status, 300)
+        self.assertIsNone(self.client.cache.get(url))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) Studio Gobo Ltd 2025
+# Licensed under the MIT license.
+# See LICENSE.TXT in the project root for license information.
+# ----------------------------------------------------------------------------
+# File			-> test_query.py
+# Created		-> March 2025
+# Author		-> Michael Malinowski (Studio Gobo)
+# ----------------------------------------------------------------------------
+"""
+Tests walking hierarchies with the headless asset query, using a stand in
+compositor which serves assets from a dictionary of children
+"""
+import unittest
+import unittest.mock
+
+try:
+    import asset_composition
+
+except ImportError:
+    asset_composition = None
+
+
+class _Asset:
+    """
+    Stands in for an asset, giving back the children it was given
+    """
+
+    def __init__(self, identifier: str, children: list[str]) -> None:
+        self._identifier: str = identifier
+        self._children: list[str] = children
+        self.app = None
+
+    def identifier(self) -> str:
+        return self._identifier
+
+    def label(self) -> str:
+        return self._identifier
+
+    def is_visible(self) -> bool:
+        return True
+
+    def children(self) -> list[str]:
+        return self._children
+
+    def icon(self) -> str:
+        return ""
+
+    def status_icons(self) -> list:
+        return []
+
+
+class _Compositor:
+
+    def __init__(self, hierarchy: dict[str, list[str]]) -> None:
+        self._hierarchy: dict[str, list[str]] = hierarchy
+
+    def get(self, identifier: str) -> _Asset:
+        return _Asset(identifier, self._hierarchy.get(identifier, []))
+
+
+class _Configuration:
+
+    def get_setting(self, name: str) -> list[str]:
+        return ["root"]
+
+
+@unittest.skipIf(asset_composition is None, "asset_composition is not installed")
+class WalkTests(unittest.TestCase):
+
+    def walk(self, hierarchy: dict[str, list[str]], **kwargs) -> list[dict]:
+        from asset_explorer import query
+
+        with unittest.mock.patch.object(
+            asset_composition,
+            "Compositor",
+            return_value=_Compositor(hierarchy),
+        ):
+            asset_query = query.AssetQuery(_Configuration(), max_workers=4)
+
+        return list(asset_query.walk(**kwargs))
+
+    def test_shared_children_are_walked_once(self) -> None:
+        # -- shared sits beneath both a and b, and leaf beneath shared
+        records = self.walk(
+            dict(
+                root=["a", "b"],
+                a=["shared"],
+                b=["shared"],
+                shared=["leaf"],
+            ),
+        )
+        identifiers = [record["identifier"] for record in records]
+
+        self.assertEqual(sorted(identifiers), ["a", "b", "leaf", "root", "shared"])
+
+        shared = next(record for record in records if record["identifier"] == "shared")
+        self.assertIn(shared["parent"], ("a", "b"))
+        self.assertEqual(shared["depth"], 2)
+
+    def test_cycles_end(self) -> None:
+        # -- c lists the root as one of its children
+        records = self.walk(
+            dict(
+                root=["a"],
+                a=["b"],
+                b=["c"],
+                c=["root", "a"],
+            ),
+        )
+        identifiers = [record["identifier"] for record in records]
+
+        self.assertEqual(sorted(identifiers), ["a", "b", "c", "root"])
+
+    def test_repeated_roots_are_walked_once(self) -> None:
+        records = self.walk(dict(root=["a"]), roots=["root", "root", "a"])
+        identifiers = [record["identifier"] for record in records]
+
+        self.assertEqual(sorted(identifiers), ["a", "root"])
+
+
+if __name__ == "__main__":
+    unittest.main()